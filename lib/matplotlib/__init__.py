@@ -944,7 +944,12 @@ default_test_modules = [
     'matplotlib.tests.test_spines',
     'matplotlib.tests.test_image',
     'matplotlib.tests.test_simplification',
-    'matplotlib.tests.test_mathtext'
+    'matplotlib.tests.test_mathtext',
+    'matplotlib.tests.test_ticker',
+    'matplotlib.tests.test_quiver',
+    'matplotlib.tests.test_contour',
+    'matplotlib.tests.test_triangulation',
+    'matplotlib.tests.test_delaunay'
     ]
 
 def test(verbosity=0):
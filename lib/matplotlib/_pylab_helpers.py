@@ -2,7 +2,7 @@
 Manage figures for pyplot interface.
 """
 
-import sys, gc
+import sys, gc, threading
 
 import atexit
 import traceback
@@ -28,9 +28,12 @@ class Gcf(object):
         *_activeQue*:
           list of *managers*, with active one at the end
 
+    Updates to these attributes are serialized with a lock, so
+    figures may be created and closed from several threads.
     """
     _activeQue = []
     figs = {}
+    _lock = threading.RLock()
 
     @staticmethod
     def get_fig_manager(num):
@@ -51,19 +54,22 @@ class Gcf(object):
         In the interactive backends, this is bound to the
         window "destroy" and "delete" events.
         """
-        if not Gcf.has_fignum(num): return
-        manager = Gcf.figs[num]
-        manager.canvas.mpl_disconnect(manager._cidgcf)
-
-        # There must be a good reason for the following careful
-        # rebuilding of the activeQue; what is it?
-        oldQue = Gcf._activeQue[:]
-        Gcf._activeQue = []
-        for f in oldQue:
-            if f != manager:
-                Gcf._activeQue.append(f)
-
-        del Gcf.figs[num]
+        Gcf._lock.acquire()
+        try:
+            manager = Gcf.figs.pop(num, None)
+            if manager is None: return
+            manager.canvas.mpl_disconnect(manager._cidgcf)
+
+            # There must be a good reason for the following careful
+            # rebuilding of the activeQue; what is it?
+            oldQue = Gcf._activeQue[:]
+            Gcf._activeQue = []
+            for f in oldQue:
+                if f != manager:
+                    Gcf._activeQue.append(f)
+        finally:
+            Gcf._lock.release()
+
         #print len(Gcf.figs.keys()), len(Gcf._activeQue)
         manager.destroy()
         gc.collect()
@@ -107,21 +113,26 @@ class Gcf(object):
         """
         Return the manager of the active figure, or *None*.
         """
-        if len(Gcf._activeQue)==0:
+        que = Gcf._activeQue
+        if len(que)==0:
             return None
-        else: return Gcf._activeQue[-1]
+        else: return que[-1]
 
     @staticmethod
     def set_active(manager):
         """
         Make the figure corresponding to *manager* the active one.
         """
-        oldQue = Gcf._activeQue[:]
-        Gcf._activeQue = []
-        for m in oldQue:
-            if m != manager: Gcf._activeQue.append(m)
-        Gcf._activeQue.append(manager)
-        Gcf.figs[manager.num] = manager
+        Gcf._lock.acquire()
+        try:
+            oldQue = Gcf._activeQue[:]
+            Gcf._activeQue = []
+            for m in oldQue:
+                if m != manager: Gcf._activeQue.append(m)
+            Gcf._activeQue.append(manager)
+            Gcf.figs[manager.num] = manager
+        finally:
+            Gcf._lock.release()
 
 atexit.register(Gcf.destroy_all)
 
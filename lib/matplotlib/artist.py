@@ -71,6 +71,7 @@ class Artist(object):
 
     aname = 'Artist'
     zorder = 0
+    _datalim_cache = None
     def __init__(self):
         self.figure = None
 
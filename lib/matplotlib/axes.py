@@ -1433,8 +1433,16 @@ class Axes(martist.Artist):
         line._remove_method = lambda h: self.lines.remove(h)
         return line
 
-    def _update_line_limits(self, line):
-        p = line.get_path()
+    def _update_line_limits(self, line, path=None):
+        # *path* holds points just appended to *line*, if not None
+        if path is None:
+            p = line.get_path()
+            # a new path is made whenever the line data changes
+            p = self._cached_limits(line, p, lambda: self._limits_path(p))
+            if p is None:
+                return
+        else:
+            p = path
         if p.vertices.size > 0:
             self.dataLim.update_from_path(p, self.ignore_existing_data_limits,
                                             updatex=line.x_isdata,
@@ -1470,16 +1478,74 @@ class Axes(martist.Artist):
         if (isinstance(patch, mpatches.Rectangle) and
                     ((not patch.get_width()) or (not patch.get_height()))):
             return
-        vertices = patch.get_path().vertices
-        if vertices.size > 0:
+        def compute():
+            vertices = patch.get_path().vertices
+            if vertices.size == 0:
+                return None
             xys = patch.get_patch_transform().transform(vertices)
             if patch.get_data_transform() != self.transData:
                 transform = (patch.get_data_transform() +
                                     self.transData.inverted())
                 xys = transform.transform(xys)
-            self.update_datalim(xys, updatex=patch.x_isdata,
+            return self._limits_path(mpath.Path(xys))
+
+        key = None
+        if patch.get_data_transform() == self.transData:
+            # the limits only depend on the geometry of the patch; the
+            # bounds of a rectangle are quicker to compare than its
+            # transform, which is made anew from them
+            if isinstance(patch, mpatches.Rectangle):
+                key = (patch.get_x(), patch.get_y(),
+                       patch.get_width(), patch.get_height())
+                for value in key:
+                    if not isinstance(value, (int, long, float, np.number)):
+                        key = None
+                        break
+            if key is None:
+                patch_transform = patch.get_patch_transform()
+                if patch_transform.is_affine:
+                    key = (patch.get_path().vertices.tostring(),
+                           patch_transform.get_matrix().tostring())
+        if key is not None:
+            p = self._cached_limits(patch, key, compute)
+        else:
+            # the limits depend on the view limits or on a transform
+            # which is not affine
+            p = compute()
+        if p is not None:
+            self.update_datalim(p.vertices, updatex=patch.x_isdata,
                                      updatey=patch.y_isdata)
 
+    def _cached_limits(self, artist, key, compute):
+        """
+        Return the path from :meth:`_limits_path` for *artist*,
+        calling *compute* only if *key* changed since the last call,
+        so :meth:`relim` only rescans the data of changed artists.
+        *key* is compared with ``==``, i.e., by identity for paths.
+        """
+        cache = artist._datalim_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        p = compute()
+        artist._datalim_cache = key, p
+        return p
+
+    def _limits_path(self, path):
+        """
+        Return a path of at most three vertices which updates the data
+        limits, including their minimum positive values, like *path*
+        does, or *None* if *path* has no finite vertices.
+        """
+        if path.vertices.size == 0:
+            return None
+        bbox = mtransforms.Bbox.unit()
+        bbox.update_from_path(path, ignore=True)
+        points = bbox.get_points()
+        if not np.isfinite(points).all():
+            return None
+        minpos = np.where(np.isfinite(bbox.minpos), bbox.minpos, points[0])
+        return mpath.Path(np.vstack((points, minpos)))
+
 
     def add_table(self, tab):
         '''
@@ -94,6 +94,8 @@ class Tick(artist.Artist):
         self._name = name
 
         self._loc = loc
+        # the locations the lines were last placed at by _draw_locs
+        self._drawn_locs = None
 
         if size is None:
             if major:
@@ -237,6 +239,75 @@ class Tick(artist.Artist):
 
         renderer.close_group(self.__name__)
 
+    def _draw_locs(self, renderer, locs, labels, draw=True):
+        """
+        Draw this tick at each of *locs*, labelled with *labels*, and
+        return lists of the window extents of the label1 and label2
+        texts.  The tick marks of all locations are drawn with one
+        marker call and the gridlines as one path, or one at a time
+        through transforms which are not affine, and the labels reuse
+        the texts of this tick, so no artists are made per location.  If *draw* is *False*, only the extents are
+        computed.
+        """
+        ticklabelBoxes = []
+        ticklabelBoxes2 = []
+        draw = draw and self.get_visible()
+        if draw:
+            renderer.open_group(self.__name__)
+            if len(locs):
+                # keep the lines, and so their transformed paths, while
+                # the locations do not change
+                locs = np.asarray(locs, np.float_)
+                if not np.array_equal(locs, self._drawn_locs):
+                    self._set_locs(locs)
+                    self._drawn_locs = locs
+                if self.gridOn:
+                    if self.gridline.get_transform().is_affine:
+                        self.gridline.draw(renderer)
+                    else:
+                        # curved projections need not pass the nans
+                        # separating the gridlines through, so draw
+                        # them one at a time
+                        for loc in locs:
+                            self._set_gridline_loc(loc)
+                            self.gridline.draw(renderer)
+                        self._drawn_locs = None
+                if self.tick1On:
+                    self.tick1line.draw(renderer)
+                if self.tick2On:
+                    self.tick2line.draw(renderer)
+
+        for loc, label in zip(locs, labels):
+            self._set_label_loc(loc)
+            self.set_label1(label)
+            self.set_label2(label)
+            if self.label1On and self.label1.get_visible():
+                if draw:
+                    self.label1.draw(renderer)
+                extent = self.label1.get_window_extent(renderer)
+                ticklabelBoxes.append(extent)
+            if self.label2On and self.label2.get_visible():
+                if draw:
+                    self.label2.draw(renderer)
+                extent = self.label2.get_window_extent(renderer)
+                ticklabelBoxes2.append(extent)
+
+        if draw:
+            renderer.close_group(self.__name__)
+        return ticklabelBoxes, ticklabelBoxes2
+
+    def _set_locs(self, locs):
+        'Place the tick lines and the gridline at all of *locs* at once'
+        raise NotImplementedError('Derived must override')
+
+    def _set_gridline_loc(self, loc):
+        'Place the gridline at *loc* alone'
+        raise NotImplementedError('Derived must override')
+
+    def _set_label_loc(self, loc):
+        'Place the tick labels at *loc*'
+        raise NotImplementedError('Derived must override')
+
     def set_label1(self, s):
         """
         Set the text of ticklabel
@@ -438,6 +509,21 @@ class XTick(Tick):
 
         self._loc = loc
 
+    def _set_locs(self, locs):
+        x = np.asarray(locs, np.float_)
+        self.tick1line.set_data(x, np.zeros(len(x)))
+        self.tick2line.set_data(x, np.ones(len(x)))
+        # one path of gridlines, separated by nans
+        self.gridline.set_data(np.repeat(x, 3),
+                               np.tile([0., 1., np.nan], len(x)))
+
+    def _set_gridline_loc(self, loc):
+        self.gridline.set_data((loc, loc), (0., 1.))
+
+    def _set_label_loc(self, loc):
+        self.label1.set_x(loc)
+        self.label2.set_x(loc)
+
     def get_view_interval(self):
         'return the Interval instance for this axis view limits'
         return self.axes.viewLim.intervalx
@@ -573,6 +659,20 @@ class YTick(Tick):
 
         self._loc = loc
 
+    def _set_locs(self, locs):
+        y = np.asarray(locs, np.float_)
+        self.tick1line.set_data(np.zeros(len(y)), y)
+        self.tick2line.set_data(np.ones(len(y)), y)
+        # one path of gridlines, separated by nans
+        self.gridline.set_data(np.tile([0., 1., np.nan], len(y)),
+                               np.repeat(y, 3))
+
+    def _set_gridline_loc(self, loc):
+        self.gridline.set_data((0., 1.), (loc, loc))
+
+    def _set_label_loc(self, loc):
+        self.label1.set_y(loc)
+        self.label2.set_y(loc)
 
     def get_view_interval(self):
         'return the Interval instance for this axis view limits'
@@ -633,8 +733,9 @@ class Axis(artist.Artist):
         self.label = self._get_label()
         self.labelpad = 5
         self.offsetText = self._get_offset_text()
-        self.majorTicks = []
-        self.minorTicks = []
+        self._majorTicks = []
+        self._minorTicks = []
+        self._tickClipPath = None
         self.pickradius = pickradius
 
         # Initialize here for testing; later add API
@@ -732,14 +833,33 @@ class Axis(artist.Artist):
     def reset_ticks(self):
         # build a few default ticks; grow as necessary later; only
         # define 1 so properties set on ticks will be copied as they
-        # grow
-        cbook.popall(self.majorTicks)
-        cbook.popall(self.minorTicks)
+        # grow.  The first tick is only made when the tick lists are
+        # accessed, as axes are often cleared several times, or never
+        # drawn, after they are made.
+        cbook.popall(self._majorTicks)
+        cbook.popall(self._minorTicks)
 
-        self.majorTicks.extend([self._get_tick(major=True)])
-        self.minorTicks.extend([self._get_tick(major=False)])
         self._lastNumMajorTicks = 1
         self._lastNumMinorTicks = 1
+        self._batchTicks = {}
+
+    def _get_majorTicks(self):
+        if not self._majorTicks:
+            self._majorTicks.append(self._make_first_tick(major=True))
+        return self._majorTicks
+    majorTicks = property(_get_majorTicks, doc='the major Tick instances')
+
+    def _get_minorTicks(self):
+        if not self._minorTicks:
+            self._minorTicks.append(self._make_first_tick(major=False))
+        return self._minorTicks
+    minorTicks = property(_get_minorTicks, doc='the minor Tick instances')
+
+    def _make_first_tick(self, major):
+        tick = self._get_tick(major)
+        if self._tickClipPath is not None:
+            tick.set_clip_path(*self._tickClipPath)
+        return tick
 
     def set_tick_params(self, which='major', reset=False, **kw):
         """
@@ -761,11 +881,12 @@ class Axis(artist.Artist):
         if reset:
             self.reset_ticks()
         else:
+            # ticks not made yet pick up the parameters when made
             if which == 'major' or which == 'both':
-                 for tick in self.majorTicks:
+                 for tick in self._majorTicks:
                     tick._apply_params(**self._major_tick_kw)
             if which == 'minor' or which == 'both':
-                 for tick in self.minorTicks:
+                 for tick in self._minorTicks:
                     tick._apply_params(**self._minor_tick_kw)
 
     @staticmethod
@@ -829,9 +950,10 @@ class Axis(artist.Artist):
 
     def set_clip_path(self, clippath, transform=None):
         artist.Artist.set_clip_path(self, clippath, transform)
-        majorticks = self.get_major_ticks()
-        minorticks = self.get_minor_ticks()
-        for child in self.majorTicks + self.minorTicks:
+        # ticks made later get the clip path from _make_first_tick, or
+        # copy it from the first tick
+        self._tickClipPath = clippath, transform
+        for child in self._majorTicks + self._minorTicks:
             child.set_clip_path(clippath, transform)
 
     def get_view_interval(self):
@@ -866,49 +988,172 @@ class Axis(artist.Artist):
         if a is None: return
         a.set_figure(self.figure)
 
+    def _tick_groups(self):
+        """
+        Return a list of (*major*, *locs*, *labels*) tuples for the
+        major and the minor ticks.
+        """
+        groups = []
+        for major, ticker in ((True, self.major), (False, self.minor)):
+            locs = ticker.locator()
+            labels = ticker.formatter.format_ticks(locs)
+            groups.append((major, locs, labels))
+        return groups
+
     def iter_ticks(self):
         """
         Iterate through all of the major and minor ticks.
         """
-        majorLocs = self.major.locator()
-        majorTicks = self.get_major_ticks(len(majorLocs))
-        self.major.formatter.set_locs(majorLocs)
-        majorLabels = [self.major.formatter(val, i) for i, val in enumerate(majorLocs)]
+        for major, locs, labels in self._tick_groups():
+            if major:
+                ticks = self.get_major_ticks(len(locs))
+            else:
+                ticks = self.get_minor_ticks(len(locs))
+            for tick in zip(ticks, locs, labels):
+                yield tick
+
+    def _get_batch_tick(self, major):
+        """
+        Return a tick for drawing all the major (or minor) ticks at
+        once with :meth:`Tick._draw_locs`, with the properties of the
+        first tick, or *None* if a tick instance has been made for
+        each location, as is done by :meth:`get_major_ticks`, since
+        such ticks may have been customized one by one.
+        """
+        if major:
+            ticks = self.majorTicks
+        else:
+            ticks = self.minorTicks
+        if len(ticks) != 1 or not hasattr(ticks[0], '_draw_locs'):
+            return None
+        protoTick = ticks[0]
+        tick = self._batchTicks.get(major)
+        if tick is None:
+            tick = self._batchTicks[major] = self._get_tick(major)
+            # the texts are reused for every label; keep their layouts
+            tick.label1.cached = cbook.maxdict(50)
+            tick.label2.cached = cbook.maxdict(50)
+        self._copy_tick_props(protoTick, tick)
+        tick.gridOn = protoTick.gridOn
+        tick.set_visible(protoTick.get_visible())
+        return tick
+
+    def _draw_ticks(self, renderer, draw=True):
+        """
+        Move the ticks to the current tick locations, draw them if
+        *draw* is *True*, and return the window extents of the label1
+        and of the label2 texts.
+
+        Ticks which were not made one by one are drawn in batches;
+        see :meth:`_get_batch_tick`.
+        """
+        ticklabelBoxes = []
+        ticklabelBoxes2 = []
 
-        minorLocs = self.minor.locator()
-        minorTicks = self.get_minor_ticks(len(minorLocs))
-        self.minor.formatter.set_locs(minorLocs)
-        minorLabels = [self.minor.formatter(val, i) for i, val in enumerate(minorLocs)]
+        interval = self.get_view_interval()
+        groups = self._tick_groups()
+        bounds = None
+        if draw and self._smart_bounds:
+            locs = []
+            for major, majorlocs, labels in groups:
+                locs.extend(majorlocs)
+            bounds = self._get_smart_tick_bounds(locs)
+
+        for major, locs, labels in groups:
+            if not len(locs):
+                # don't make ticks, eg for the default NullLocator
+                continue
+            tick = self._get_batch_tick(major)
+            if tick is None:
+                if major:
+                    ticks = self.get_major_ticks(len(locs))
+                else:
+                    ticks = self.get_minor_ticks(len(locs))
+            else:
+                ticks = [tick] * len(locs)
+
+            tick_tups = [ti for ti in zip(ticks, locs, labels)
+                         if mtransforms.interval_contains(interval, ti[1])]
+            if bounds is not None:
+                tick_tups = [ti for ti in tick_tups
+                             if (ti[1] >= bounds[0]) and (ti[1] <= bounds[1])]
+
+            if tick is not None:
+                boxes, boxes2 = tick._draw_locs(renderer,
+                                                [ti[1] for ti in tick_tups],
+                                                [ti[2] for ti in tick_tups],
+                                                draw)
+                ticklabelBoxes.extend(boxes)
+                ticklabelBoxes2.extend(boxes2)
+                continue
+
+            for tick, loc, label in tick_tups:
+                if tick is None: continue
+                tick.update_position(loc)
+                tick.set_label1(label)
+                tick.set_label2(label)
+                if draw:
+                    tick.draw(renderer)
+                if tick.label1On and tick.label1.get_visible():
+                    extent = tick.label1.get_window_extent(renderer)
+                    ticklabelBoxes.append(extent)
+                if tick.label2On and tick.label2.get_visible():
+                    extent = tick.label2.get_window_extent(renderer)
+                    ticklabelBoxes2.append(extent)
 
-        major_minor = [
-            (majorTicks, majorLocs, majorLabels),
-            (minorTicks, minorLocs, minorLabels)]
+        return ticklabelBoxes, ticklabelBoxes2
 
-        for group in major_minor:
-            for tick in zip(*group):
-                yield tick
+    def _get_smart_tick_bounds(self, locs):
+        """
+        Return the range of tick locations *locs* to draw with smart
+        bounds, or *None* to draw them all.
+        """
+        interval = self.get_view_interval()
+        # handle inverted limits
+        view_low, view_high = min(*interval), max(*interval)
+        data_low, data_high = self.get_data_interval()
+        if data_low > data_high:
+            data_low, data_high = data_high, data_low
+        locs = list(locs)
+        locs.sort()
+        locs = np.array(locs)
+        if not len(locs):
+            return None
+        if data_low <= view_low:
+            # data extends beyond view, take view as limit
+            ilow = view_low
+        else:
+            # data stops within view, take best tick
+            cond = locs <= data_low
+            good_locs = locs[cond]
+            if len(good_locs) > 0:
+                # last tick prior or equal to first data point
+                ilow = good_locs[-1]
+            else:
+                # No ticks (why not?), take first tick
+                ilow = locs[0]
+        if data_high >= view_high:
+            # data extends beyond view, take view as limit
+            ihigh = view_high
+        else:
+            # data stops within view, take best tick
+            cond = locs >= data_high
+            good_locs = locs[cond]
+            if len(good_locs) > 0:
+                # first tick after or equal to last data point
+                ihigh = good_locs[0]
+            else:
+                # No ticks (why not?), take last tick
+                ihigh = locs[-1]
+        return ilow, ihigh
 
     def get_ticklabel_extents(self, renderer):
         """
         Get the extents of the tick labels on either side
         of the axes.
         """
-        ticklabelBoxes = []
-        ticklabelBoxes2 = []
-
-        interval = self.get_view_interval()
-        for tick, loc, label in self.iter_ticks():
-            if tick is None: continue
-            if not mtransforms.interval_contains(interval, loc): continue
-            tick.update_position(loc)
-            tick.set_label1(label)
-            tick.set_label2(label)
-            if tick.label1On and tick.label1.get_visible():
-                extent = tick.label1.get_window_extent(renderer)
-                ticklabelBoxes.append(extent)
-            if tick.label2On and tick.label2.get_visible():
-                extent = tick.label2.get_window_extent(renderer)
-                ticklabelBoxes2.append(extent)
+        ticklabelBoxes, ticklabelBoxes2 = self._draw_ticks(renderer,
+                                                           draw=False)
 
         if len(ticklabelBoxes):
             bbox = mtransforms.Bbox.union(ticklabelBoxes)
@@ -931,65 +1176,9 @@ class Axis(artist.Artist):
     @allow_rasterization
     def draw(self, renderer, *args, **kwargs):
         'Draw the axis lines, grid lines, tick lines and labels'
-        ticklabelBoxes = []
-        ticklabelBoxes2 = []
-
         if not self.get_visible(): return
         renderer.open_group(__name__)
-        interval = self.get_view_interval()
-        tick_tups = [ t for t in self.iter_ticks()]
-        if self._smart_bounds:
-            # handle inverted limits
-            view_low, view_high = min(*interval), max(*interval)
-            data_low, data_high = self.get_data_interval()
-            if data_low > data_high:
-                data_low, data_high = data_high, data_low
-            locs = [ti[1] for ti in tick_tups]
-            locs.sort()
-            locs = np.array(locs)
-            if len(locs):
-                if data_low <= view_low:
-                    # data extends beyond view, take view as limit
-                    ilow = view_low
-                else:
-                    # data stops within view, take best tick
-                    cond = locs <= data_low
-                    good_locs = locs[cond]
-                    if len(good_locs) > 0:
-                        # last tick prior or equal to first data point
-                        ilow = good_locs[-1]
-                    else:
-                        # No ticks (why not?), take first tick
-                        ilow = locs[0]
-                if data_high >= view_high:
-                    # data extends beyond view, take view as limit
-                    ihigh = view_high
-                else:
-                    # data stops within view, take best tick
-                    cond = locs >= data_high
-                    good_locs = locs[cond]
-                    if len(good_locs) > 0:
-                        # first tick after or equal to last data point
-                        ihigh = good_locs[0]
-                    else:
-                        # No ticks (why not?), take last tick
-                        ihigh = locs[-1]
-                tick_tups = [ ti for ti in tick_tups
-                              if (ti[1] >= ilow) and (ti[1] <= ihigh)]
-
-        for tick, loc, label in tick_tups:
-            if tick is None: continue
-            if not mtransforms.interval_contains(interval, loc): continue
-            tick.update_position(loc)
-            tick.set_label1(label)
-            tick.set_label2(label)
-            tick.draw(renderer)
-            if tick.label1On and tick.label1.get_visible():
-                extent = tick.label1.get_window_extent(renderer)
-                ticklabelBoxes.append(extent)
-            if tick.label2On and tick.label2.get_visible():
-                extent = tick.label2.get_window_extent(renderer)
-                ticklabelBoxes2.append(extent)
+        ticklabelBoxes, ticklabelBoxes2 = self._draw_ticks(renderer)
 
         # scale up the axis label box to also find the neighbors, not
         # just the tick labels that actually overlap note we need a
@@ -1199,7 +1388,10 @@ class Axis(artist.Artist):
                 self._gridOnMinor = not self._gridOnMinor
             else:
                 self._gridOnMinor = b
-            for tick in self.minorTicks:  # don't use get_ticks here!
+            ticks = self._minorTicks
+            if len(kwargs):
+                ticks = self.minorTicks  # style the first tick, if not made
+            for tick in ticks:  # don't use get_ticks here!
                 if tick is None: continue
                 tick.gridOn = self._gridOnMinor
                 if len(kwargs): artist.setp(tick.gridline,**kwargs)
@@ -1209,7 +1401,10 @@ class Axis(artist.Artist):
                 self._gridOnMajor = not self._gridOnMajor
             else:
                 self._gridOnMajor = b
-            for tick in self.majorTicks:  # don't use get_ticks here!
+            ticks = self._majorTicks
+            if len(kwargs):
+                ticks = self.majorTicks  # style the first tick, if not made
+            for tick in ticks:  # don't use get_ticks here!
                 if tick is None: continue
                 tick.gridOn = self._gridOnMajor
                 if len(kwargs): artist.setp(tick.gridline,**kwargs)
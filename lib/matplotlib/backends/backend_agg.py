@@ -376,6 +376,13 @@ class FigureCanvasAgg(FigureCanvasBase):
       figure - A Figure instance
     """
 
+    _track_damage = False
+
+    def __init__(self, figure):
+        FigureCanvasBase.__init__(self, figure)
+        self._damage_backgrounds = {}
+        self._damage_figure_key = None
+
     def copy_from_bbox(self, bbox):
         renderer = self.get_renderer()
         return renderer.copy_from_bbox(bbox)
@@ -391,7 +398,208 @@ class FigureCanvasAgg(FigureCanvasBase):
         if __debug__: verbose.report('FigureCanvasAgg.draw', 'debug-annoying')
 
         self.renderer = self.get_renderer()
-        self.figure.draw(self.renderer)
+        if not self._track_damage:
+            self.figure.draw(self.renderer)
+        elif not self._draw_damaged():
+            self._draw_full()
+
+    def set_damage_tracking(self, b):
+        """
+        Set whether :meth:`draw` should only redraw damaged regions.
+
+        With damage tracking on, a draw keeps a copy of the static
+        background of every axes, i.e. everything but its animated
+        artists (see :meth:`~matplotlib.artist.Artist.set_animated`),
+        and then draws the animated artists on top.  Animated artists
+        of the figure itself, such as figure texts and legends, are
+        drawn last, over a copy of the whole figure's background.  As long as the
+        size of the figure and the position and view limits of the
+        axes do not change, the following draws only restore the
+        background under the old window extents of the animated
+        artists and draw them again.  This gives blitting frame rates
+        for figures with a few moving artists without hand-written
+        blitting code.
+
+        Adding, removing, hiding or (un)animating an artist of the
+        figure or of an axes also makes the next draw render the whole
+        figure.  Other changes to static artists, e.g., their data,
+        colors or the axes grid, are not noticed: call
+        :meth:`invalidate_damage` after making them.
+        """
+        self._track_damage = b
+        self.invalidate_damage()
+
+    def get_damage_tracking(self):
+        'Return whether :meth:`draw` only redraws damaged regions'
+        return self._track_damage
+
+    def invalidate_damage(self):
+        """
+        Discard the cached axes backgrounds, so that the next
+        :meth:`draw` renders the whole figure.
+        """
+        self._damage_backgrounds = {}
+        self._damage_figure_key = None
+
+    def _damage_key(self, ax):
+        # the artists of *ax* (an axes or the figure), with the flags
+        # which decide whether they are drawn in its background; the
+        # visibility of animated artists does not matter
+        artists = []
+        for a in ax.get_children():
+            animated = a.get_animated()
+            artists.append((a, animated, animated or a.get_visible()))
+        if ax is self.figure:
+            return self.renderer, ax.bbox.bounds, artists
+        return self.renderer, ax.bbox.bounds, ax.viewLim.bounds, artists
+
+    def _figure_animated(self):
+        # the animated artists of the figure itself, in zorder
+        figure = self.figure
+        dsu = [(a.zorder, a) for a in figure.get_children()
+               if a.get_animated() and a not in figure.axes and
+               (a is not figure.patch or figure.frameon)]
+        dsu.sort(key=lambda x: x[0])
+        return [a for zorder, a in dsu]
+
+    def _draw_full(self):
+        figure = self.figure
+        animated = self._figure_animated()
+        # the figure, unlike the axes, draws its animated artists; hide
+        # them without the setters, which would mark the figure changed
+        hidden = [a for a in animated if a.get_visible()]
+        for a in hidden:
+            a._visible = False
+        try:
+            figure.draw(self.renderer)
+        finally:
+            for a in hidden:
+                a._visible = True
+        self._damage_backgrounds = {}
+        self._damage_figure_key = self._damage_key(figure)
+        if animated:
+            figure_background = self.copy_from_bbox(figure.bbox)
+        for ax in figure.axes:
+            # clipped artists may touch the pixels on the axes border
+            background = self.copy_from_bbox(ax.bbox.padded(1))
+            extents = self._draw_animated(ax)
+            self._damage_backgrounds[ax] = (self._damage_key(ax),
+                                            background, extents)
+        if animated:
+            self._damage_backgrounds[figure] = (
+                self._damage_figure_key, figure_background,
+                self._draw_figure_animated(animated))
+
+    def _draw_damaged(self):
+        """
+        Restore the damaged parts of the cached backgrounds and redraw
+        the animated artists on top.  Return *False*, without drawing
+        anything, if the backgrounds are stale and a full draw is
+        needed.
+        """
+        figure = self.figure
+        backgrounds = self._damage_backgrounds
+        animated = self._figure_animated()
+        parents = list(figure.axes)
+        if animated:
+            parents.append(figure)
+        if not backgrounds or len(backgrounds) != len(parents):
+            return False
+        # artists of the figure are drawn over the axes backgrounds too
+        if self._damage_key(figure) != self._damage_figure_key:
+            return False
+        for parent in parents:
+            if parent not in backgrounds:
+                return False
+            key, background, extents = backgrounds[parent]
+            if parent is not figure and key != self._damage_key(parent):
+                return False
+            if None in extents:
+                return False
+
+        # the figure's artists are drawn over the axes, so repair their
+        # damage first and draw them last
+        if animated:
+            key, background, extents = backgrounds[figure]
+            self._restore_damaged(background, extents)
+        for ax in figure.axes:
+            key, background, extents = backgrounds[ax]
+            self._restore_damaged(background, extents)
+            backgrounds[ax] = key, background, self._draw_animated(ax)
+        if animated:
+            key, background, extents = backgrounds[figure]
+            backgrounds[figure] = (key, background,
+                                   self._draw_figure_animated(animated))
+
+        self.draw_event(self.renderer)
+        return True
+
+    def _restore_damaged(self, background, extents):
+        # restore the regions *extents* of the canvas from *background*
+        height = self.renderer.height
+        rx0, ry0, rx1, ry1 = background.get_extents()
+        for x0, y0, x1, y1 in extents:
+            # regions are addressed from the top of the canvas
+            bbox = (max(int(np.floor(x0)), rx0),
+                    max(int(np.floor(height - y1)), ry0),
+                    min(int(np.ceil(x1)), rx1),
+                    min(int(np.ceil(height - y0)), ry1))
+            if bbox[0] < bbox[2] and bbox[1] < bbox[3]:
+                self.restore_region(background, bbox, (rx0, ry0))
+
+    def _draw_animated(self, ax):
+        """
+        Draw the animated artists of *ax* and return the list of
+        regions they damaged.  A region is *None* if the artist drew
+        outside of *ax*, which the axes background can not repair.
+        """
+        dsu = [(a.zorder, a) for a in ax.get_children() if a.get_animated()]
+        dsu.sort(key=lambda x: x[0])
+
+        extents = []
+        for zorder, a in dsu:
+            a.draw(self.renderer)
+            if a.get_visible():
+                extents.append(self._damaged_extents(ax, a))
+        return extents
+
+    def _draw_figure_animated(self, animated):
+        """
+        Draw the animated artists of the figure itself, *animated*, and
+        return the list of regions they damaged.
+        """
+        extents = []
+        for a in animated:
+            a.draw(self.renderer)
+            if a.get_visible():
+                extents.append(self._damaged_extents(self.figure, a))
+        return extents
+
+    def _damaged_extents(self, ax, a):
+        # the window extent of *a*, padded by its linewidth to cover
+        # antialiasing, and clipped to *ax* (an axes or the figure) if
+        # *a* is clipped
+        x0, y0, x1, y1 = ax.bbox.padded(1).extents
+        try:
+            bbox = a.get_window_extent(self.renderer)
+        except (TypeError, ValueError):
+            return x0, y0, x1, y1
+        if (not np.isfinite(bbox.extents).all() or
+            (bbox.width == 0 and bbox.height == 0)):
+            # unknown extent; repair the whole axes
+            return x0, y0, x1, y1
+
+        pad = 2
+        if hasattr(a, 'get_linewidth'):
+            lw = np.asarray(a.get_linewidth(), dtype=float)
+            if lw.size and np.isfinite(lw).all():
+                pad += lw.max() * self.figure.dpi / 72.0
+        ax0, ay0, ax1, ay1 = bbox.padded(pad).extents
+        clipped = a.get_clip_on() and (a.get_clip_box() is not None or
+                                       a.get_clip_path() is not None)
+        if not clipped and (ax0 < x0 or ay0 < y0 or ax1 > x1 or ay1 > y1):
+            return None
+        return max(ax0, x0), max(ay0, y0), min(ax1, x1), min(ay1, y1)
 
     def get_renderer(self):
         l, b, w, h = self.figure.bbox.bounds
@@ -891,6 +891,64 @@ class RingBuffer:
         return self.data[i % len(self.data)]
 
 
+class GrowableArray:
+    """
+    An array which grows at the end in amortized constant time per
+    appended row, for streaming data.  If *maxlen* is not *None*,
+    only the last *maxlen* rows are kept, as in a
+    :class:`RingBuffer`, but they are always available as one
+    contiguous array.  The rows are stored as *dtype*, float by
+    default.
+
+    :meth:`view` returns the current rows without copying.  Views
+    remain valid after further calls to :meth:`extend`, which only
+    ever write past the end of the current rows or into a newly
+    allocated array.
+    """
+    def __init__(self, data, maxlen=None, dtype=np.float_):
+        data = np.asarray(data, dtype)
+        if maxlen is not None:
+            data = data[max(len(data) - maxlen, 0):]
+        self.maxlen = maxlen
+        n = len(data)
+        self._buf = np.empty((max(2 * n, 16),) + data.shape[1:], dtype)
+        self._buf[:n] = data
+        self._start = 0
+        self._stop = n
+        self._view = self._buf[:n]
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def view(self):
+        'return the current rows as an array view'
+        return self._view
+
+    def extend(self, rows):
+        """
+        Append *rows*, dropping the oldest rows beyond *maxlen*, and
+        return the new :meth:`view`.
+        """
+        rows = np.asarray(rows, self._buf.dtype)
+        maxlen = self.maxlen
+        if maxlen is not None:
+            rows = rows[max(len(rows) - maxlen, 0):]
+            self._start += max(len(self) + len(rows) - maxlen, 0)
+        n, k = len(self), len(rows)
+        if self._stop + k > len(self._buf):
+            # move to a new array with room for as many rows again,
+            # so the copy is paid for by the appends that follow it
+            buf = np.empty((max(2 * (n + k), 16),) + self._buf.shape[1:],
+                           self._buf.dtype)
+            buf[:n] = self._buf[self._start:self._stop]
+            self._buf = buf
+            self._start, self._stop = 0, n
+        self._buf[self._stop:self._stop + k] = rows
+        self._stop += k
+        self._view = self._buf[self._start:self._stop]
+        return self._view
+
+
 
 def get_split_ind(seq, N):
     """
@@ -1090,18 +1148,25 @@ class maxdict(dict):
     A dictionary with a maximum size; this doesn't override all the
     relevant methods to contrain size, just setitem, so use with
     caution
+
+    Insertion and eviction are serialized with a lock, so a maxdict
+    may be shared as a cache between rendering threads.
     """
     def __init__(self, maxsize):
         dict.__init__(self)
         self.maxsize = maxsize
         self._killkeys = []
+        self._lock = threading.Lock()
     def __setitem__(self, k, v):
-        if k not in self:
-            if len(self)>=self.maxsize:
-                del self[self._killkeys[0]]
-                del self._killkeys[0]
-            self._killkeys.append(k)
-        dict.__setitem__(self, k, v)
+        self._lock.acquire()
+        try:
+            if k not in self:
+                if len(self)>=self.maxsize:
+                    dict.pop(self, self._killkeys.pop(0), None)
+                self._killkeys.append(k)
+            dict.__setitem__(self, k, v)
+        finally:
+            self._lock.release()
 
 
 
@@ -1386,6 +1451,11 @@ class Grouper(object):
 
     The objects being joined must be hashable and weak-referenceable.
 
+    The sets are kept as a union-find forest with path compression, so
+    joining and testing objects takes close to constant time however
+    many objects are grouped.  Objects which are garbage collected are
+    dropped from their sets the next time the grouper is used.
+
     For example:
 
     >>> class Foo:
@@ -1409,44 +1479,95 @@ class Grouper(object):
     False
     """
     def __init__(self, init=[]):
-        mapping = self._mapping = {}
+        # each weak reference maps to its parent in the forest, and
+        # each root to the list of all the references in its set
+        self._parent = {}
+        self._members = {}
+        # references whose objects have died, filled in by the weakref
+        # callbacks and emptied by clean()
+        self._dead = []
         for x in init:
-            mapping[ref(x)] = [ref(x)]
+            self._add(x)
 
     def __contains__(self, item):
-        return ref(item) in self._mapping
+        return ref(item) in self._parent
+
+    def _add(self, x):
+        """
+        Return the weak reference to *x*, adding *x* as a set of its
+        own if it is not grouped yet.
+        """
+        key = ref(x)
+        if key not in self._parent:
+            key = ref(x, self._dead.append)
+            self._parent[key] = key
+            self._members[key] = [key]
+        return key
+
+    def _find(self, key):
+        """
+        Return the root of the set holding *key*, pointing every
+        reference on the way directly at the root.
+        """
+        parent = self._parent
+        path = []
+        root = key
+        while True:
+            up = parent[root]
+            if up is root:
+                break
+            path.append(root)
+            root = up
+        for node in path:
+            parent[node] = root
+        return root
 
     def clean(self):
         """
         Clean dead weak references from the dictionary
         """
-        mapping = self._mapping
-        for key, val in mapping.items():
-            if key() is None:
-                del mapping[key]
-                val.remove(key)
+        dead = self._dead
+        if not dead:
+            return
+        parent = self._parent
+        members = self._members
+        roots = {}
+        while dead:
+            key = dead.pop()
+            if key in parent:
+                roots[self._find(key)] = True
+
+        # rebuild every set that lost a member around a live root
+        for root in roots:
+            group = members.pop(root)
+            live = [x for x in group if x() is not None]
+            for x in group:
+                del parent[x]
+            if live:
+                root = live[0]
+                for x in live:
+                    parent[x] = root
+                members[root] = live
 
     def join(self, a, *args):
         """
         Join given arguments into the same set.  Accepts one or more
         arguments.
         """
-        mapping = self._mapping
-        set_a = mapping.setdefault(ref(a), [ref(a)])
+        self.clean()
 
+        parent = self._parent
+        members = self._members
+        root_a = self._find(self._add(a))
         for arg in args:
-            set_b = mapping.get(ref(arg))
-            if set_b is None:
-                set_a.append(ref(arg))
-                mapping[ref(arg)] = set_a
-            elif set_b is not set_a:
-                if len(set_b) > len(set_a):
-                    set_a, set_b = set_b, set_a
-                set_a.extend(set_b)
-                for elem in set_b:
-                    mapping[elem] = set_a
-
-        self.clean()
+            root_b = self._find(self._add(arg))
+            if root_b is root_a:
+                continue
+            # hang the smaller set below the root of the larger one
+            if len(members[root_b]) > len(members[root_a]):
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            members[root_a].extend(members.pop(root_b))
 
     def joined(self, a, b):
         """
@@ -1454,9 +1575,8 @@ class Grouper(object):
         """
         self.clean()
 
-        mapping = self._mapping
         try:
-            return mapping[ref(a)] is mapping[ref(b)]
+            return self._find(ref(a)) is self._find(ref(b))
         except KeyError:
             return False
 
@@ -1468,20 +1588,8 @@ class Grouper(object):
         """
         self.clean()
 
-        class Token: pass
-        token = Token()
-
-        # Mark each group as we come across if by appending a token,
-        # and don't yield it twice
-        for group in self._mapping.itervalues():
-            if not group[-1] is token:
-                yield [x() for x in group]
-                group.append(token)
-
-        # Cleanup the tokens
-        for group in self._mapping.itervalues():
-            if group[-1] is token:
-                del group[-1]
+        for group in self._members.values():
+            yield [x() for x in group]
 
     def get_siblings(self, a):
         """
@@ -1489,8 +1597,11 @@ class Grouper(object):
         """
         self.clean()
 
-        siblings = self._mapping.get(ref(a), [ref(a)])
-        return [x() for x in siblings]
+        try:
+            root = self._find(ref(a))
+        except KeyError:
+            return [a]
+        return [x() for x in self._members[root]]
 
 
 def simple_linear_interpolation(a, steps):
@@ -1883,6 +1994,66 @@ class ThinWrap(object) :
             object.__getattribute__(self, '_origobj').__setattr__(attr, value)
 
 
+def cpu_count():
+    """
+    Return the number of CPUs, or 1 if it cannot be found.
+    """
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+def overrides(obj, cls, *names):
+    """
+    Return *True* if the class of *obj* overrides any of the methods
+    *names* of its base class *cls*.  Classes which format many values
+    at once use this to fall back to formatting each value with a
+    derived class's methods.
+    """
+    for name in names:
+        if getattr(obj.__class__, name).im_func is not \
+           getattr(cls, name).im_func:
+            return True
+    return False
+
+def map_threaded(func, items, nthreads=None):
+    """
+    Return ``[func(item) for item in items]``, calling *func* from up to
+    *nthreads* threads (default: the number of CPUs).  This only runs
+    faster if *func* releases the GIL, as the contour tracer and the
+    delaunay interpolation weights do.  The
+    first exception raised by *func* is re-raised.
+    """
+    if nthreads is None:
+        nthreads = cpu_count()
+    results = [None]*len(items)
+    todo = range(len(items))
+    todo.reverse()
+    errors = []
+
+    def worker():
+        while not errors:
+            try:
+                i = todo.pop()
+            except IndexError:
+                return
+            try:
+                results[i] = func(items[i])
+            except:
+                errors.append(sys.exc_info())
+
+    threads = [threading.Thread(target=worker)
+               for i in range(min(nthreads, len(items)) - 1)]
+    for thread in threads:
+        thread.start()
+    worker()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+    return results
+
 
 if __name__=='__main__':
     assert( allequal([1,1,1]) )
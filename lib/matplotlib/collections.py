@@ -59,7 +59,12 @@ class Collection(artist.Artist, cm.ScalarMappable):
     scalar mappable will be made to set the face colors.
     """
     _offsets = np.array([], np.float_)
+    _offsetbuffer = None
     _transOffset = transforms.IdentityTransform()
+    # caches of the paths and offsets with the non-affine part of their
+    # transforms applied; see _prepare_points
+    _transformed_paths = None
+    _transformed_offsets = None
     _transforms = []
 
     zorder = 1
@@ -144,12 +149,18 @@ class Collection(artist.Artist, cm.ScalarMappable):
         return self._transforms
 
     def get_datalim(self, transData):
+        return self._get_datalim(transData, self._offsets)
+
+    def _get_datalim(self, transData, offsets):
         transform = self.get_transform()
         transOffset = self._transOffset
-        offsets = self._offsets
         paths = self.get_paths()
         if not transform.is_affine:
-            paths = [transform.transform_path_non_affine(p) for p in paths]
+            if isinstance(paths, mpath.PackedPaths):
+                paths = paths.transformed_non_affine(transform)
+            else:
+                paths = [transform.transform_path_non_affine(p)
+                         for p in paths]
             transform = transform.get_affine()
         if not transOffset.is_affine:
             offsets = transOffset.transform_non_affine(offsets)
@@ -169,14 +180,23 @@ class Collection(artist.Artist, cm.ScalarMappable):
         return bbox
 
     def _prepare_points(self):
-        """Point prep for drawing and hit testing"""
+        """
+        Point prep for drawing and hit testing
+
+        The non-affine parts of the transforms are applied to the
+        paths and offsets once and cached, until the paths, the
+        offsets or the non-affine part of a transform change, so
+        panning and zooming only apply the affine parts again.
+        """
 
         transform = self.get_transform()
         transOffset = self._transOffset
         offsets = self._offsets
         paths = self.get_paths()
+        cache = True
 
         if self.have_units():
+            cache = False
             paths = []
             for path in self.get_paths():
                 vertices = path.vertices
@@ -192,11 +212,28 @@ class Collection(artist.Artist, cm.ScalarMappable):
         offsets = np.asarray(offsets, np.float_)
 
         if not transform.is_affine:
-            paths = [transform.transform_path_non_affine(path) for path in paths]
-            transform = transform.get_affine()
+            tpaths = self._transformed_paths
+            if (tpaths is None or tpaths._paths is not paths
+                or tpaths._transform is not transform):
+                tpaths = transforms.TransformedPaths(paths, transform)
+                if cache:
+                    self._transformed_paths = tpaths
+            paths, transform = tpaths.get_transformed_paths_and_affine()
         if not transOffset.is_affine:
-            offsets = transOffset.transform_non_affine(offsets)
-            transOffset = transOffset.get_affine()
+            if len(offsets.shape) == 2 and offsets.shape[1] == 2:
+                toffsets = self._transformed_offsets
+                if (toffsets is None or toffsets._path.vertices is not offsets
+                    or toffsets._transform is not transOffset):
+                    toffsets = transforms.TransformedPath(
+                        mpath.Path(offsets), transOffset)
+                    if cache:
+                        self._transformed_offsets = toffsets
+                offsets, transOffset = \
+                    toffsets.get_transformed_points_and_affine()
+                offsets = offsets.vertices
+            else:
+                offsets = transOffset.transform_non_affine(offsets)
+                transOffset = transOffset.get_affine()
 
         return transform, transOffset, offsets, paths
 
@@ -266,6 +303,39 @@ class Collection(artist.Artist, cm.ScalarMappable):
         else:
             self._uniform_offsets = offsets
 
+    def append_offsets(self, offsets, maxlen=None):
+        """
+        Append *offsets*, an xy pair or a sequence of them, to the
+        offsets of the collection.  If *maxlen* is not *None*, only
+        the last *maxlen* offsets are kept.
+
+        This takes amortized constant time per offset, for collections
+        fed by streaming data: the offsets are kept in a growing
+        buffer and the data limits of the axes are only extended by
+        the new items.  Per-item properties, e.g., colors, cycle over
+        the items as usual; update them separately if needed.
+        """
+        offsets = np.asarray(offsets, np.float_)
+        if len(offsets.shape) == 1:
+            offsets = offsets[np.newaxis,:]  # Make it Nx2.
+        if self._uniform_offsets is None:
+            current = self._offsets
+        else:
+            current = self._uniform_offsets
+        buf = self._offsetbuffer
+        if buf is None or buf.view() is not current:
+            buf = self._offsetbuffer = cbook.GrowableArray(
+                current.reshape((-1, 2)))
+        buf.maxlen = maxlen
+        if self._uniform_offsets is None:
+            self._offsets = buf.extend(offsets)
+            if self.axes is not None and self in self.axes.collections:
+                if self._paths and len(self._paths) and len(offsets):
+                    self.axes.update_datalim(
+                        self._get_datalim(self.axes.transData, offsets))
+        else:
+            self._uniform_offsets = buf.extend(offsets)
+
     def get_offsets(self):
         """
         Return the offsets for the collection.
@@ -533,7 +603,8 @@ class PathCollection(Collection):
     def __init__(self, paths, **kwargs):
         """
         *paths* is a sequence of :class:`matplotlib.path.Path`
-        instances.
+        instances, or a :class:`matplotlib.path.PackedPaths`, which
+        stores many paths in a few arrays.
 
         %(Collection)s
         """
@@ -573,27 +644,9 @@ class PolyCollection(Collection):
 
     def set_verts(self, verts, closed=True):
         '''This allows one to delay initialization of the vertices.'''
-        if np.ma.isMaskedArray(verts):
-            verts = verts.astype(np.float_).filled(np.nan)
-            # This is much faster than having Path do it one at a time.
-        if closed:
-            self._paths = []
-            for xy in verts:
-                if len(xy):
-                    if np.ma.isMaskedArray(xy):
-                        xy = np.ma.concatenate([xy, np.zeros((1,2))])
-                    else:
-                        xy = np.asarray(xy)
-                        xy = np.concatenate([xy, np.zeros((1,2))])
-                    codes = np.empty(xy.shape[0], dtype=mpath.Path.code_type)
-                    codes[:] = mpath.Path.LINETO
-                    codes[0] = mpath.Path.MOVETO
-                    codes[-1] = mpath.Path.CLOSEPOLY
-                    self._paths.append(mpath.Path(xy, codes))
-                else:
-                    self._paths.append(mpath.Path(xy))
-        else:
-            self._paths = [mpath.Path(xy) for xy in verts]
+        # The polygons are packed into one vertex array, which the
+        # backends and the hit testing read without a Path per polygon.
+        self._paths = mpath.PackedPaths.from_polygons(verts, closed)
 
     set_paths = set_verts
 
@@ -487,8 +487,7 @@ class ColorbarBase(cm.ScalarMappable):
         formatter.axis.get_minpos = lambda : intv[0]
         b = np.array(locator())
         b, ticks = self._locate(b)
-        formatter.set_locs(b)
-        ticklabels = [formatter(t, i) for i, t in enumerate(b)]
+        ticklabels = formatter.format_ticks(b)
         offset_string = formatter.get_offset()
         return ticks, ticklabels, offset_string
 
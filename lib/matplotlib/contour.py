@@ -683,6 +683,9 @@ class ContourSet(cm.ScalarMappable, ContourLabeler):
             raise ValueError('Either colors or cmap must be None')
         if self.origin == 'image': self.origin = mpl.rcParams['image.origin']
 
+        # packed (vertices, codes, starts) arrays for each level, if
+        # _get_allsegs_and_allkinds traced them
+        self._packed = None
         self._process_args(*args, **kwargs)
         self._process_levels()
 
@@ -718,9 +721,14 @@ class ContourSet(cm.ScalarMappable, ContourLabeler):
             if self.allkinds is None:
                 self.allkinds = [None]*len(self.allsegs)
 
-            for level, level_upper, segs, kinds in \
-                    zip(lowers, uppers, self.allsegs, self.allkinds):
-                paths = self._make_paths(segs, kinds)
+            if self._packed is not None:
+                allpaths = [mpath.PackedPaths(*packed)
+                            for packed in self._packed]
+            else:
+                allpaths = [self._make_paths(segs, kinds) for segs, kinds
+                            in zip(self.allsegs, self.allkinds)]
+
+            for level, level_upper, paths in zip(lowers, uppers, allpaths):
                 # Default zorder taken from Collection
                 zorder = kwargs.get('zorder', 1)
                 col = collections.PathCollection(paths,
@@ -1074,6 +1082,11 @@ class QuadContourSet(ContourSet):
       layers:
         same as levels for line contours; half-way between
         levels for filled contours.  See _process_colors method.
+
+    The levels are traced in parallel threads, one per CPU.  Passing
+    a QuadContourSet instead of the data, eg ``contour(cs, levels=v)``,
+    reuses its contour generator and any levels it has already traced,
+    so that only new levels are traced.
     """
     def __init__(self, ax, *args, **kwargs):
         """
@@ -1096,6 +1109,7 @@ class QuadContourSet(ContourSet):
                 self.levels = args[0].levels
             self.zmin = args[0].zmin
             self.zmax = args[0].zmax
+            self._traced = args[0]._traced
         else:
             x, y, z = self._contour_args(args, kwargs)
 
@@ -1109,32 +1123,58 @@ class QuadContourSet(ContourSet):
             if _mask is ma.nomask:
                 _mask = None
             C = _cntr.Cntr(x, y, z.filled(), _mask)
+            self._traced = {}
         self.Cntr = C
 
     def _get_allsegs_and_allkinds(self):
         """
         Create and return allsegs and allkinds by calling underlying C code.
         """
-        allsegs = []
         if self.filled:
             lowers, uppers = self._get_lowers_and_uppers()
-            allkinds = []
-            for level, level_upper in zip(lowers, uppers):
-                nlist = self.Cntr.trace(level, level_upper, nchunk = self.nchunk)
-                nseg = len(nlist)//2
-                segs = nlist[:nseg]
-                kinds = nlist[nseg:]
-                allsegs.append(segs)
-                allkinds.append(kinds)
+            keys = [(level, level_upper, self.nchunk)
+                    for level, level_upper in zip(lowers, uppers)]
         else:
+            keys = [(level, None, 0) for level in self.levels]
+        self._packed = self._trace_levels(keys)
+
+        allsegs = []
+        allkinds = []
+        for vertices, codes, starts in self._packed:
+            # views of the packed arrays, one per contour
+            bounds = zip(starts[:-1], starts[1:])
+            allsegs.append([vertices[i0:i1] for i0, i1 in bounds])
+            allkinds.append([codes[i0:i1] for i0, i1 in bounds])
+        if not self.filled:
             allkinds = None
-            for level in self.levels:
-                nlist = self.Cntr.trace(level)
-                nseg = len(nlist)//2
-                segs = nlist[:nseg]
-                allsegs.append(segs)
         return allsegs, allkinds
 
+    def _trace_levels(self, keys):
+        """
+        Return the packed (*vertices*, *codes*, *starts*) arrays for
+        each (*level*, *level_upper*, *nchunk*) in *keys*; *level_upper*
+        is None for contour lines.
+
+        Levels which the contour set this one was made from had
+        already traced are reused; the others are traced in parallel.
+        """
+        def trace(key):
+            level, level_upper, nchunk = key
+            if level_upper is None:
+                return self.Cntr.trace(level, packed=True)
+            return self.Cntr.trace(level, level_upper, nchunk=nchunk,
+                                   packed=True)
+
+        todo = [key for key in keys if key not in self._traced]
+        traced = dict(zip(todo, cbook.map_threaded(trace, todo)))
+        for key in keys:
+            if key not in traced:
+                traced[key] = self._traced[key]
+        # only keep this set's levels, so that a chain of contour
+        # sets made from each other does not grow without bound
+        self._traced = traced
+        return [traced[key] for key in keys]
+
     def _contour_args(self, args, kwargs):
         if self.filled: fn = 'contourf'
         else:           fn = 'contour'
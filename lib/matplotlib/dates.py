@@ -171,6 +171,12 @@ MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = (
     MO, TU, WE, TH, FR, SA, SU)
 WEEKDAYS = (MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY)
 
+# the rrule frequencies RRuleLocator finds ticks for with array
+# operations, and the lengths of the fixed ones
+_regular_freqs = (YEARLY, MONTHLY, DAILY, HOURLY, MINUTELY, SECONDLY)
+_period_seconds = {DAILY: SEC_PER_DAY, HOURLY: SEC_PER_HOUR,
+                   MINUTELY: SEC_PER_MIN, SECONDLY: 1}
+
 
 
 
@@ -216,6 +222,61 @@ def _from_ordinalf(x, tz=None):
 
     return dt
 
+def _wall_seconds(dt):
+    'Return the wall clock time of :class:`datetime` *dt* in whole seconds.'
+    return (dt.toordinal()*SEC_PER_DAY + dt.hour*SEC_PER_HOUR +
+            dt.minute*SEC_PER_MIN + dt.second)
+
+def _utc_microseconds(dt):
+    'Return the UTC time of :class:`datetime` *dt* in microseconds.'
+    delta = dt.utcoffset()
+    if delta is not None:
+        dt = dt - delta
+    return _wall_seconds(dt)*1000000 + dt.microsecond
+
+def _fixed_utcoffset(tzinfo):
+    """
+    Return the UTC offset in seconds of *tzinfo* if it is the same for
+    all dates, as for UTC and the :mod:`pytz` timezones of localized
+    datetimes, or *None*.
+    """
+    if tzinfo is None or isinstance(tzinfo, _UTC):
+        return 0
+    offset = getattr(tzinfo, '_utcoffset', None)
+    if offset is None or not hasattr(tzinfo, 'zone'):
+        return None
+    return offset.days*SEC_PER_DAY + offset.seconds
+
+def _civil_from_ordinal(n):
+    """
+    Return the year, month and day arrays of the Gregorian ordinals
+    *n*, as :meth:`datetime.date.fromordinal` would for each.
+    """
+    # days since 0000-03-01, split into 400 year eras
+    z = np.asarray(n, np.int64) + 305
+    era = z // 146097
+    doe = z - era*146097
+    yoe = (doe - doe//1460 + doe//36524 - doe//146096) // 365
+    doy = doe - (365*yoe + yoe//4 - yoe//100)
+    mp = (5*doy + 2) // 153
+    day = doy - (153*mp + 2)//5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era*400 + (month <= 2)
+    return year, month, day
+
+def _ordinal_from_civil(year, month, day):
+    """
+    Return the Gregorian ordinals of the *year*, *month* and *day*
+    arrays; invalid days overflow into the next month.
+    """
+    month = np.asarray(month, np.int64)
+    year = np.asarray(year, np.int64) - (month <= 2)
+    era = year // 400
+    yoe = year - era*400
+    doy = (153*((month + 9) % 12) + 2)//5 + day - 1
+    doe = yoe*365 + yoe//4 - yoe//100 + doy
+    return era*146097 + doe - 305
+
 class strpdate2num:
     """
     Use this class to parse date strings to matplotlib datenums when
@@ -305,6 +366,7 @@ def drange(dstart, dend, delta):
 
 ### date tickers and formatters ###
 
+_illegal_date_msg = 'DateFormatter found a value of x=0, which is an illegal date.  This usually occurs because you have not informed the axis that it is plotting dates, eg with ax.xaxis_date()'
 
 
 class DateFormatter(ticker.Formatter):
@@ -331,10 +393,22 @@ class DateFormatter(ticker.Formatter):
 
     def __call__(self, x, pos=0):
         if x==0:
-            raise ValueError('DateFormatter found a value of x=0, which is an illegal date.  This usually occurs because you have not informed the axis that it is plotting dates, eg with ax.xaxis_date()')
+            raise ValueError(_illegal_date_msg)
         dt = num2date(x, self.tz)
         return self.strftime(dt, self.fmt)
 
+    def format_ticks(self, values):
+        'Return the tick labels for all the tick locations *values*'
+        if cbook.overrides(self, DateFormatter, '__call__', 'strftime'):
+            return ticker.Formatter.format_ticks(self, values)
+        self.set_locs(values)
+        if len(values)==0:
+            return []
+        if not np.asarray(values).all():
+            raise ValueError(_illegal_date_msg)
+        fmt = self._clean_fmt(self.fmt)
+        return [self._strftime(dt, fmt) for dt in num2date(values, self.tz)]
+
     def set_tzinfo(self, tz):
         self.tz = tz
 
@@ -356,8 +430,13 @@ class DateFormatter(ticker.Formatter):
     # calendar.
 
     def strftime(self, dt, fmt):
+        return self._strftime(dt, self._clean_fmt(fmt))
+
+    def _clean_fmt(self, fmt):
         fmt = self.illegal_s.sub(r"\1", fmt)
-        fmt = fmt.replace("%s", "s")
+        return fmt.replace("%s", "s")
+
+    def _strftime(self, dt, fmt):
         if dt.year > 1900:
             return cbook.unicode_safe(dt.strftime(fmt))
 
@@ -472,7 +551,18 @@ class AutoDateFormatter(ticker.Formatter):
            }
 
     def __call__(self, x, pos=0):
+        self._formatter = DateFormatter(self._get_fmt(), self._tz)
+        return self._formatter(x, pos)
 
+    def format_ticks(self, values):
+        'Return the tick labels for all the tick locations *values*'
+        if cbook.overrides(self, AutoDateFormatter, '__call__'):
+            return ticker.Formatter.format_ticks(self, values)
+        self.set_locs(values)
+        self._formatter = DateFormatter(self._get_fmt(), self._tz)
+        return self._formatter.format_ticks(values)
+
+    def _get_fmt(self):
         scale = float( self._locator._get_unit() )
 
         fmt = self.defaultfmt
@@ -481,9 +571,7 @@ class AutoDateFormatter(ticker.Formatter):
            if k>=scale:
               fmt = self.scaled[k]
               break
-
-        self._formatter = DateFormatter(fmt, self._tz)
-        return self._formatter(x, pos)
+        return fmt
 
 
 
@@ -585,10 +673,163 @@ class RRuleLocator(DateLocator):
             raise RuntimeError(
                 'RRuleLocator estimated to generate %d ticks from %s to %s: exceeds Locator.MAXTICKS * 2 (%d) ' % (estimate, dmin, dmax, self.MAXTICKS * 2))
 
-        dates = self.rule.between(dmin, dmax, True)
-        if len(dates) == 0:
+        ticks = self._regular_ticks(dmin, dmax)
+        if ticks is None:
+            ticks = date2num(self.rule.between(dmin, dmax, True))
+        if len(ticks) == 0:
             return date2num([dmin, dmax])
-        return self.raise_if_exceeds(date2num(dates))
+        return self.raise_if_exceeds(ticks)
+
+    def _regular_ticks(self, dmin, dmax):
+        """
+        Return the date numbers of the rule occurrences from *dmin* to
+        *dmax*, computed with array operations, or *None* if the rule
+        is not a regular one, whose occurrences the rrule must find.
+
+        A regular rule has a yearly to secondly frequency and only
+        positive bymonth, bymonthday, byhour, byminute and bysecond
+        parts.  As for the rrule, the periods count from the start of
+        the rule, the occurrences in a period are those matching all
+        the parts, and are in the timezone of the start of the rule.
+        If the rule has a count, only that many occurrences from its
+        start are kept, so ticks are capped as with the rrule.
+        """
+        rule = self.rule._rrule
+        freq = rule._freq
+        if (freq not in _regular_freqs or rule._byweekno or
+            rule._byyearday or rule._byweekday or rule._bynweekday or
+            rule._byeaster or rule._bysetpos or rule._bynmonthday or
+            (freq <= MONTHLY and not rule._bymonthday)):
+            return None
+
+        parts = []
+        for part in (rule._bymonth, rule._bymonthday, rule._byhour,
+                     rule._byminute, rule._bysecond):
+            if part:
+                part = np.asarray(part, np.int64)
+            else:
+                part = None
+            parts.append(part)
+        bymonth, bymonthday, byhour, byminute, bysecond = parts
+
+        # the times of day of the occurrences in a period, in seconds
+        times = np.zeros(1, np.int64)
+        for part, seconds, partfreq in ((byhour, SEC_PER_HOUR, HOURLY),
+                                        (byminute, SEC_PER_MIN, MINUTELY),
+                                        (bysecond, 1, SECONDLY)):
+            if freq < partfreq:
+                times = (times[:,np.newaxis] + seconds*part).ravel()
+
+        # work in wall clock seconds, like the rrule.  Datetimes with
+        # the same tzinfo compare by wall clock time; for others, if
+        # the timezone offset may change, keep a day either side.
+        tzinfo = rule._dtstart.tzinfo
+        offset = _fixed_utcoffset(tzinfo)
+        if offset is not None:
+            lo = -(-_utc_microseconds(dmin) // 1000000) + offset
+            hi = _utc_microseconds(dmax) // 1000000 + offset
+        else:
+            lo = _wall_seconds(dmin)
+            hi = _wall_seconds(dmax) + 1
+            if dmin.tzinfo is not tzinfo:
+                lo -= SEC_PER_DAY
+            if dmax.tzinfo is not tzinfo:
+                hi += SEC_PER_DAY
+        start = _wall_seconds(rule._dtstart)
+        lo = max(lo, start)
+        if lo > hi:
+            return np.zeros(0)
+        interval = rule._interval
+        # a count is reached from the start of the rule, not from lo
+        count = rule._count
+        first_lo = lo
+        if count is not None:
+            first_lo = start
+
+        if freq >= DAILY:
+            length = _period_seconds[freq]
+            first = start - start % length
+            step = length * interval
+            kmin = max(0, -((first + length - first_lo) // step))
+            kmax = (hi - first) // step
+            if (kmax - kmin + 1) * len(times) > self.MAXTICKS * 100:
+                return None
+            starts = first + step*np.arange(kmin, kmax + 1, dtype=np.int64)
+        else:
+            # the periods are months or years; find their days
+            year, month, day = _civil_from_ordinal(
+                [start // SEC_PER_DAY, first_lo // SEC_PER_DAY,
+                 hi // SEC_PER_DAY])
+            if freq == MONTHLY:
+                first, plo, phi = year*12 + month - 1
+            else:
+                first, plo, phi = year
+            kmin = max(0, -((first - plo) // interval))
+            kmax = (phi - first) // interval
+            periods = first + interval*np.arange(kmin, kmax + 1,
+                                                 dtype=np.int64)
+            if freq == MONTHLY:
+                years, months = periods // 12, periods % 12 + 1
+            else:
+                months = np.arange(1, 13, dtype=np.int64)
+                if bymonth is not None:
+                    months = np.unique(bymonth)
+                years = np.repeat(periods, len(months))
+                months = np.tile(months, len(periods))
+            mdays = np.unique(bymonthday)
+            n = len(mdays)
+            if len(years) * n * len(times) > self.MAXTICKS * 100:
+                return None
+            mdays = np.tile(mdays, len(years))
+            years, months = np.repeat(years, n), np.repeat(months, n)
+            days = _ordinal_from_civil(years, months, mdays)
+            # skip the days, such as February 30, which do not exist
+            starts = days[_civil_from_ordinal(days)[2] == mdays] * SEC_PER_DAY
+
+        candidates = (starts[:,np.newaxis] + times).ravel()
+        candidates = candidates[(candidates >= first_lo) &
+                                (candidates <= hi) &
+                                (candidates >= SEC_PER_DAY) &
+                                (candidates < 3652060 * SEC_PER_DAY)]
+
+        # keep the occurrences matching all the parts
+        days, seconds = divmod(candidates, SEC_PER_DAY)
+        year, month, day = _civil_from_ordinal(days)
+        keep = np.ones(len(candidates), bool)
+        for field, part, size in ((month, bymonth, 13),
+                                  (day, bymonthday, 32),
+                                  (seconds // SEC_PER_HOUR, byhour, 24),
+                                  (seconds // SEC_PER_MIN % 60, byminute, 60),
+                                  (seconds % 60, bysecond, 60)):
+            if part is not None:
+                allowed = np.zeros(size, bool)
+                allowed[part] = True
+                keep &= allowed[field]
+        candidates = np.sort(candidates[keep])
+        if count is not None:
+            candidates = candidates[:count]
+            candidates = candidates[candidates >= lo]
+
+        if offset is None:
+            # the offset depends on the date; convert each occurrence
+            days, seconds = divmod(candidates, SEC_PER_DAY)
+            year, month, day = _civil_from_ordinal(days)
+            dates = []
+            for i in range(len(candidates)):
+                hour, second = divmod(int(seconds[i]), SEC_PER_HOUR)
+                minute, second = divmod(second, SEC_PER_MIN)
+                dt = datetime.datetime(int(year[i]), int(month[i]),
+                                       int(day[i]), hour, minute, second,
+                                       tzinfo=tzinfo)
+                if dmin <= dt <= dmax:
+                    dates.append(dt)
+            return date2num(dates)
+
+        # convert as _to_ordinalf does
+        days, seconds = divmod(candidates - offset, SEC_PER_DAY)
+        return days + (seconds // SEC_PER_HOUR / HOURS_PER_DAY +
+                       seconds // SEC_PER_MIN % 60 / MINUTES_PER_DAY +
+                       seconds % 60 / SECONDS_PER_DAY)
 
     def _get_unit(self):
         """
@@ -1,6 +1,7 @@
 #include "Python.h"
 #include <stdlib.h>
 #include <map>
+#include <vector>
 #include <iostream>
 
 #include "VoronoiDiagramGenerator.h"
@@ -542,14 +543,16 @@ static PyObject *nn_interpolate_unstructured_method(PyObject *self, PyObject *ar
         return NULL;
     }
 
+    size = PyArray_Size(intx);
+    Py_BEGIN_ALLOW_THREADS
     NaturalNeighbors nn(npoints, ntriangles,
         (double*)PyArray_DATA(x), (double*)PyArray_DATA(y),
         (double*)PyArray_DATA(centers), (int*)PyArray_DATA(nodes),
         (int*)PyArray_DATA(neighbors));
-    size = PyArray_Size(intx);
     nn.interpolate_unstructured((double*)PyArray_DATA(z), size,
         (double*)PyArray_DATA(intx), (double*)PyArray_DATA(inty),
         (double*)PyArray_DATA(intz), defvalue);
+    Py_END_ALLOW_THREADS
 
     Py_XDECREF(x);
     Py_XDECREF(y);
@@ -577,13 +580,18 @@ static PyObject *nn_interpolate_method(PyObject *self, PyObject *args)
     PyObject *pyx, *pyy, *pyz, *pycenters, *pynodes, *pyneighbors, *grid;
     PyObject *x = NULL, *y = NULL, *z = NULL, *centers = NULL, *nodes = NULL, *neighbors = NULL;
     double x0, x1, y0, y1, defvalue;
-    int xsteps, ysteps;
+    int xsteps, ysteps, row0 = 0, row1 = -1;
     int npoints, ntriangles;
     intp dims[2];
 
-    if (!PyArg_ParseTuple(args, "ddiddidOOOOOO", &x0, &x1, &xsteps,
+    if (!PyArg_ParseTuple(args, "ddiddidOOOOOO|ii", &x0, &x1, &xsteps,
         &y0, &y1, &ysteps, &defvalue, &pyx, &pyy, &pyz, &pycenters, &pynodes,
-        &pyneighbors)) {
+        &pyneighbors, &row0, &row1)) {
+        return NULL;
+    }
+    if (row1 == -1) row1 = ysteps;
+    if ((row0 < 0) || (row1 < row0) || (row1 > ysteps)) {
+        PyErr_SetString(PyExc_ValueError, "rows out of range");
         return NULL;
     }
     x = PyArray_FROMANY(pyx, PyArray_DOUBLE, 1, 1, NPY_IN_ARRAY);
@@ -636,7 +644,7 @@ static PyObject *nn_interpolate_method(PyObject *self, PyObject *args)
         return NULL;
     }
 
-    dims[0] = ysteps;
+    dims[0] = row1 - row0;
     dims[1] = xsteps;
     grid = PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
     if (!grid) {
@@ -644,6 +652,9 @@ static PyObject *nn_interpolate_method(PyObject *self, PyObject *args)
         return NULL;
     }
 
+    // Only plain C++ from here on, so several threads may each fill in
+    // some of the rows of the same grid.
+    Py_BEGIN_ALLOW_THREADS
     NaturalNeighbors nn(npoints, ntriangles,
         (double*)PyArray_DATA(x), (double*)PyArray_DATA(y),
         (double*)PyArray_DATA(centers), (int*)PyArray_DATA(nodes),
@@ -652,7 +663,8 @@ static PyObject *nn_interpolate_method(PyObject *self, PyObject *args)
         x0, x1, xsteps,
         y0, y1, ysteps,
         (double*)PyArray_DATA(grid),
-        defvalue, 0);
+        defvalue, 0, row0, row1);
+    Py_END_ALLOW_THREADS
 
     CLEANUP
 
@@ -661,6 +673,203 @@ static PyObject *nn_interpolate_method(PyObject *self, PyObject *args)
 }
 #undef CLEANUP
 
+// The barycentric coordinates of each point in the triangle containing it,
+// stored as by NaturalNeighbors::weights_unstructured().
+static void linear_weights_unstructured(int size, double *intx, double *inty,
+    double *x, double *y, int *nodes, int *neighbors,
+    vector<int> &qs, vector<double> &weights, vector<int> &starts)
+{
+    int i, j, t, start_triangle;
+    double x0, y0, det, l1, l2;
+
+    start_triangle = 0;
+    starts.push_back(qs.size());
+    for (i=0; i<size; i++) {
+        t = walking_triangles(start_triangle, intx[i], inty[i],
+            x, y, nodes, neighbors);
+        if (t >= 0) {
+            x0 = x[INDEX3(nodes,t,0)];
+            y0 = y[INDEX3(nodes,t,0)];
+            det = ((x[INDEX3(nodes,t,1)] - x0)*(y[INDEX3(nodes,t,2)] - y0) -
+                   (x[INDEX3(nodes,t,2)] - x0)*(y[INDEX3(nodes,t,1)] - y0));
+            l1 = ((intx[i] - x0)*(y[INDEX3(nodes,t,2)] - y0) -
+                  (x[INDEX3(nodes,t,2)] - x0)*(inty[i] - y0)) / det;
+            l2 = ((x[INDEX3(nodes,t,1)] - x0)*(inty[i] - y0) -
+                  (intx[i] - x0)*(y[INDEX3(nodes,t,1)] - y0)) / det;
+            for (j=0; j<3; j++) qs.push_back(INDEX3(nodes,t,j));
+            weights.push_back(1.0 - l1 - l2);
+            weights.push_back(l1);
+            weights.push_back(l2);
+            start_triangle = t;
+        }
+        starts.push_back(qs.size());
+    }
+}
+
+#define CLEANUP \
+    Py_XDECREF(x);\
+    Py_XDECREF(y);\
+    Py_XDECREF(intx);\
+    Py_XDECREF(inty);\
+    Py_XDECREF(centers);\
+    Py_XDECREF(nodes);\
+    Py_XDECREF(neighbors);\
+    Py_XDECREF(pyqs);\
+    Py_XDECREF(pyweights);\
+    Py_XDECREF(pystarts);
+
+// Shared by nn_weights_unstructured and linear_weights_unstructured, whose
+// arguments differ only in the circumcenters the natural neighbors need.
+static PyObject *weights_unstructured(PyObject *args, bool natural)
+{
+    PyObject *pyx, *pyy, *pycenters = NULL, *pynodes, *pyneighbors, *pyintx, *pyinty;
+    PyObject *x = NULL, *y = NULL, *centers = NULL, *nodes = NULL,
+        *neighbors = NULL, *intx = NULL, *inty = NULL;
+    PyObject *pyqs = NULL, *pyweights = NULL, *pystarts = NULL;
+    npy_intp dims[1];
+    int size, npoints, ntriangles, ok;
+
+    if (natural) {
+        ok = PyArg_ParseTuple(args, "OOOOOOO", &pyintx, &pyinty,
+            &pyx, &pyy, &pycenters, &pynodes, &pyneighbors);
+    } else {
+        ok = PyArg_ParseTuple(args, "OOOOOO", &pyintx, &pyinty,
+            &pyx, &pyy, &pynodes, &pyneighbors);
+    }
+    if (!ok) {
+        return NULL;
+    }
+    x = PyArray_FROMANY(pyx, PyArray_DOUBLE, 1, 1, NPY_IN_ARRAY);
+    if (!x) {
+        PyErr_SetString(PyExc_ValueError, "x must be a 1-D array of floats");
+        CLEANUP
+        return NULL;
+    }
+    y = PyArray_FROMANY(pyy, PyArray_DOUBLE, 1, 1, NPY_IN_ARRAY);
+    if (!y) {
+        PyErr_SetString(PyExc_ValueError, "y must be a 1-D array of floats");
+        CLEANUP
+        return NULL;
+    }
+    npoints = PyArray_DIM(x, 0);
+    if (PyArray_DIM(y, 0) != npoints) {
+        PyErr_SetString(PyExc_ValueError, "x,y arrays must be of equal length");
+        CLEANUP
+        return NULL;
+    }
+    nodes = PyArray_FROMANY(pynodes, PyArray_INT, 2, 2, NPY_IN_ARRAY);
+    if (!nodes) {
+        PyErr_SetString(PyExc_ValueError, "nodes must be a 2-D array of ints");
+        CLEANUP
+        return NULL;
+    }
+    neighbors = PyArray_FROMANY(pyneighbors, PyArray_INT, 2, 2, NPY_IN_ARRAY);
+    if (!neighbors) {
+        PyErr_SetString(PyExc_ValueError, "neighbors must be a 2-D array of ints");
+        CLEANUP
+        return NULL;
+    }
+    ntriangles = PyArray_DIM(neighbors, 0);
+    if (PyArray_DIM(nodes, 0) != ntriangles) {
+        PyErr_SetString(PyExc_ValueError, "nodes,neighbors must be of equal length");
+        CLEANUP
+        return NULL;
+    }
+    if (natural) {
+        centers = PyArray_FROMANY(pycenters, PyArray_DOUBLE, 2, 2, NPY_IN_ARRAY);
+        if (!centers) {
+            PyErr_SetString(PyExc_ValueError, "centers must be a 2-D array of floats");
+            CLEANUP
+            return NULL;
+        }
+        if (PyArray_DIM(centers, 0) != ntriangles) {
+            PyErr_SetString(PyExc_ValueError, "centers,nodes,neighbors must be of equal length");
+            CLEANUP
+            return NULL;
+        }
+    }
+    intx = PyArray_FROMANY(pyintx, PyArray_DOUBLE, 1, 1, NPY_IN_ARRAY);
+    if (!intx) {
+        PyErr_SetString(PyExc_ValueError, "intx must be a 1-D array of floats");
+        CLEANUP
+        return NULL;
+    }
+    inty = PyArray_FROMANY(pyinty, PyArray_DOUBLE, 1, 1, NPY_IN_ARRAY);
+    if (!inty) {
+        PyErr_SetString(PyExc_ValueError, "inty must be a 1-D array of floats");
+        CLEANUP
+        return NULL;
+    }
+    size = PyArray_DIM(intx, 0);
+    if (PyArray_DIM(inty, 0) != size) {
+        PyErr_SetString(PyExc_ValueError, "intx,inty must have same shapes");
+        CLEANUP
+        return NULL;
+    }
+
+    vector<int> qs, starts;
+    vector<double> weights;
+    qs.reserve(7*size);
+    weights.reserve(7*size);
+    starts.reserve(size + 1);
+
+    // Only plain C++ from here on, so other threads may run while the
+    // weights are found.
+    Py_BEGIN_ALLOW_THREADS
+    if (natural) {
+        NaturalNeighbors nn(npoints, ntriangles,
+            (double*)PyArray_DATA(x), (double*)PyArray_DATA(y),
+            (double*)PyArray_DATA(centers), (int*)PyArray_DATA(nodes),
+            (int*)PyArray_DATA(neighbors));
+        nn.weights_unstructured(size,
+            (double*)PyArray_DATA(intx), (double*)PyArray_DATA(inty),
+            qs, weights, starts);
+    } else {
+        linear_weights_unstructured(size,
+            (double*)PyArray_DATA(intx), (double*)PyArray_DATA(inty),
+            (double*)PyArray_DATA(x), (double*)PyArray_DATA(y),
+            (int*)PyArray_DATA(nodes), (int*)PyArray_DATA(neighbors),
+            qs, weights, starts);
+    }
+    Py_END_ALLOW_THREADS
+
+    dims[0] = qs.size();
+    pyqs = PyArray_SimpleNew(1, dims, PyArray_INT);
+    pyweights = PyArray_SimpleNew(1, dims, PyArray_DOUBLE);
+    dims[0] = starts.size();
+    pystarts = PyArray_SimpleNew(1, dims, PyArray_INT);
+    if (!pyqs || !pyweights || !pystarts) {
+        CLEANUP
+        return NULL;
+    }
+    if (qs.size()) {
+        memcpy(PyArray_DATA(pyqs), &qs[0], qs.size()*sizeof(int));
+        memcpy(PyArray_DATA(pyweights), &weights[0], weights.size()*sizeof(double));
+    }
+    memcpy(PyArray_DATA(pystarts), &starts[0], starts.size()*sizeof(int));
+
+    Py_XDECREF(x);
+    Py_XDECREF(y);
+    Py_XDECREF(intx);
+    Py_XDECREF(inty);
+    Py_XDECREF(centers);
+    Py_XDECREF(nodes);
+    Py_XDECREF(neighbors);
+    return Py_BuildValue("NNN", pyqs, pyweights, pystarts);
+}
+
+#undef CLEANUP
+
+static PyObject *nn_weights_unstructured_method(PyObject *self, PyObject *args)
+{
+    return weights_unstructured(args, true);
+}
+
+static PyObject *linear_weights_unstructured_method(PyObject *self, PyObject *args)
+{
+    return weights_unstructured(args, false);
+}
+
 static PyObject *delaunay_method(PyObject *self, PyObject *args)
 {
     PyObject *pyx, *pyy, *mesh;
@@ -720,9 +929,24 @@ static PyMethodDef delaunay_methods[] = {
     {"linear_interpolate_grid", (PyCFunction)linear_interpolate_method, METH_VARARGS,
         ""},
     {"nn_interpolate_grid", (PyCFunction)nn_interpolate_method, METH_VARARGS,
-        ""},
+        "Interpolate by natural neighbors on a regular grid, or on rows\n"
+        "row0 to row1-1 of it if they are given.\n\n"
+        "grid = nn_interpolate_grid(x0, x1, xsteps, y0, y1, ysteps, defvalue,\n"
+        "    x, y, z, centers, nodes, neighbors[, row0, row1])\n"},
     {"nn_interpolate_unstructured", (PyCFunction)nn_interpolate_unstructured_method, METH_VARARGS,
         ""},
+    {"nn_weights_unstructured", (PyCFunction)nn_weights_unstructured_method, METH_VARARGS,
+        "Find the natural neighbor coordinates of a set of points.\n\n"
+        "qs, weights, starts = nn_weights_unstructured(intx, inty, x, y, centers, nodes, neighbors)\n\n"
+        "intx, inty -- shape-(size,) arrays of floats giving the points\n"
+        "qs, weights -- the indices into x and y of the natural neighbors of the points,\n"
+        "    and their coordinates; those of point i are qs[starts[i]:starts[i+1]]\n"
+        "starts -- shape-(size+1,) array of integers; points outside the convex hull\n"
+        "    have no neighbors\n"},
+    {"linear_weights_unstructured", (PyCFunction)linear_weights_unstructured_method, METH_VARARGS,
+        "Find the barycentric coordinates of a set of points.\n\n"
+        "qs, weights, starts = linear_weights_unstructured(intx, inty, x, y, nodes, neighbors)\n\n"
+        "As nn_weights_unstructured, with the nodes of the triangle containing each point.\n"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -2,8 +2,10 @@ import numpy as np
 
 from matplotlib._delaunay import compute_planes, linear_interpolate_grid, nn_interpolate_grid
 from matplotlib._delaunay import nn_interpolate_unstructured
+from matplotlib._delaunay import nn_weights_unstructured, linear_weights_unstructured
+from matplotlib.cbook import map_threaded, cpu_count
 
-__all__ = ['LinearInterpolator', 'NNInterpolator']
+__all__ = ['LinearInterpolator', 'NNInterpolator', 'PointInterpolator']
 
 def slice2gridspec(key):
     """Convert a 2-tuple of slices to start,stop,steps for x and y.
@@ -89,20 +91,31 @@ class NNInterpolator(object):
     """Interpolate a function defined on the nodes of a triangulation by
     the natural neighbors method.
 
-    NNInterpolator(triangulation, z, default_value=numpy.nan)
+    NNInterpolator(triangulation, z, default_value=numpy.nan, nthreads=None)
 
     triangulation -- Triangulation instance
     z -- the function values at each node of the triangulation
     default_value -- a float giving the default value should the interpolating
       point happen to fall outside of the convex hull of the triangulation
+    nthreads -- the number of threads to interpolate from (default: the
+      number of CPUs)
 
-    At the moment, the only regular rectangular grids are supported for
-    interpolation.
+    Interpolation on a regular rectangular grid,
 
         vals = interp[ystart:ystop:ysteps*1j, xstart:xstop:xsteps*1j]
 
-    vals would then be a (ysteps, xsteps) array containing the interpolated
-    values. These arguments are interpreted the same way as numpy.mgrid.
+    gives a (ysteps, xsteps) array containing the interpolated values.
+    These arguments are interpreted the same way as numpy.mgrid.  The grid
+    is split into bands of rows, which are filled in from the threads.
+
+    Interpolation at arbitrary points,
+
+        vals = interp(intx, inty)
+
+    gives an array with the shape of intx.  The points are sorted so that
+    each one is near the last before they are located in the triangulation,
+    then split into batches for the threads.  This makes scattered points
+    much cheaper to locate, and does not change the values.
 
     Natural Neighbors Interpolation
     -------------------------------
@@ -137,24 +150,158 @@ class NNInterpolator(object):
     the circumcircles of each Delaunay triangle that node participates in.
     """
 
-    def __init__(self, triangulation, z, default_value=np.nan):
+    def __init__(self, triangulation, z, default_value=np.nan, nthreads=None):
         self.triangulation = triangulation
         self.z = np.asarray(z, dtype=np.float64)
         self.default_value = default_value
+        if nthreads is None:
+            nthreads = cpu_count()
+        self.nthreads = nthreads
+
+    def _nbatches(self, size):
+        # a few batches per thread even out the work when some parts of
+        # the domain are much more expensive than others
+        if self.nthreads <= 1:
+            return 1
+        return max(1, min(4*self.nthreads, size//1000))
 
     def __getitem__(self, key):
         x0, x1, xstep, y0, y1, ystep = slice2gridspec(key)
-        grid = nn_interpolate_grid(x0, x1, xstep, y0, y1, ystep, self.default_value,
-            self.triangulation.x, self.triangulation.y, self.z,
-            self.triangulation.circumcenters,
-            self.triangulation.triangle_nodes,
-            self.triangulation.triangle_neighbors)
-        return grid
+        tri = self.triangulation
+        def band(rows):
+            return nn_interpolate_grid(x0, x1, xstep, y0, y1, ystep,
+                self.default_value, tri.x, tri.y, self.z, tri.circumcenters,
+                tri.triangle_nodes, tri.triangle_neighbors, rows[0], rows[1])
+
+        nbands = min(self._nbatches(xstep*ystep), ystep)
+        if nbands <= 1:
+            return band((0, ystep))
+        edges = np.linspace(0, ystep, nbands+1).astype(int)
+        return np.vstack(map_threaded(band, zip(edges[:-1], edges[1:]),
+                                      self.nthreads))
 
     def __call__(self, intx, inty):
-        intz = nn_interpolate_unstructured(intx, inty, self.default_value,
-            self.triangulation.x, self.triangulation.y, self.z,
-            self.triangulation.circumcenters,
-            self.triangulation.triangle_nodes,
-            self.triangulation.triangle_neighbors)
-        return intz
+        intx = np.asarray(intx, dtype=np.float64)
+        inty = np.asarray(inty, dtype=np.float64)
+        if intx.shape != inty.shape:
+            raise ValueError("intx,inty must have same shapes")
+        tri = self.triangulation
+        def batch(index):
+            return nn_interpolate_unstructured(flatx[index], flaty[index],
+                self.default_value, tri.x, tri.y, self.z, tri.circumcenters,
+                tri.triangle_nodes, tri.triangle_neighbors)
+
+        flatx = intx.ravel()
+        flaty = inty.ravel()
+        order = _locality_order(flatx, flaty)
+        nbatches = self._nbatches(len(order))
+        edges = np.linspace(0, len(order), nbatches+1).astype(int)
+        batches = [order[i0:i1] for i0, i1 in zip(edges[:-1], edges[1:])]
+        intz = np.empty(len(order), np.float64)
+        for index, vals in zip(batches,
+                               map_threaded(batch, batches, self.nthreads)):
+            intz[index] = vals
+        return intz.reshape(intx.shape)
+
+def _locality_order(x, y):
+    """Return the indices that sort the points (x, y) into a path that
+    sweeps back and forth across about sqrt(len(x)) horizontal bands, so
+    that consecutive points are close together.
+    """
+    n = len(x)
+    if n < 3:
+        return np.arange(n)
+    ymin = y.min()
+    height = y.max() - ymin
+    if not np.isfinite(height) or height == 0:
+        return np.argsort(x)
+    nbands = int(np.sqrt(n))
+    band = np.minimum(((y - ymin) * (nbands / height)).astype(int), nbands-1)
+    # alternate bands are swept right to left
+    sweep = np.where(band % 2, -x, x)
+    return np.lexsort((sweep, band))
+
+class PointInterpolator(object):
+    """Interpolate any number of functions defined on the nodes of a
+    triangulation at one fixed set of points.
+
+    PointInterpolator(triangulation, intx, inty, method='nn', nthreads=None)
+
+    triangulation -- Triangulation instance
+    intx, inty -- arrays of floats of the same shape giving the points
+    method -- 'nn' for natural neighbors interpolation, as NNInterpolator,
+      or 'linear' for linear interpolation, as LinearInterpolator
+    nthreads -- the number of threads to find the weights from (default: the
+      number of CPUs)
+
+    Both interpolants are a weighted sum of the function values at a few
+    nodes near each point, and the weights do not depend on the function
+    values.  They are found once, when the interpolator is made, so that
+
+        vals = interp(z, default_value=numpy.nan)
+
+    for the function values z at each node of the triangulation only has to
+    form the sums.  vals has the shape of intx, and default_value wherever a
+    point falls outside the convex hull of the triangulation.
+
+    Attributes:
+      nodes, weights -- arrays giving the index into z and the weight of each
+        term of the sums
+      starts -- array of len(intx.flat)+1 integers; the terms for the i'th
+        point are nodes[starts[i]:starts[i+1]]
+    """
+    def __init__(self, triangulation, intx, inty, method='nn', nthreads=None):
+        intx = np.asarray(intx, dtype=np.float64)
+        inty = np.asarray(inty, dtype=np.float64)
+        if intx.shape != inty.shape:
+            raise ValueError("intx,inty must have same shapes")
+        if method not in ('nn', 'linear'):
+            raise ValueError("method must be 'nn' or 'linear'")
+        self.triangulation = triangulation
+        self.shape = intx.shape
+        intx = intx.ravel()
+        inty = inty.ravel()
+
+        tri = triangulation
+        def find_weights(bounds):
+            i0, i1 = bounds
+            if method == 'nn':
+                return nn_weights_unstructured(intx[i0:i1], inty[i0:i1],
+                    tri.x, tri.y, tri.circumcenters,
+                    tri.triangle_nodes, tri.triangle_neighbors)
+            return linear_weights_unstructured(intx[i0:i1], inty[i0:i1],
+                tri.x, tri.y, tri.triangle_nodes, tri.triangle_neighbors)
+
+        if nthreads is None:
+            nthreads = cpu_count()
+        # a few chunks per thread even out the work when some parts of
+        # the points are much more expensive than others
+        nchunks = max(1, min(4*nthreads, len(intx)//1000))
+        edges = np.linspace(0, len(intx), nchunks+1).astype(int)
+        chunks = map_threaded(find_weights, zip(edges[:-1], edges[1:]),
+                              nthreads)
+
+        starts = [np.zeros(1, int)]
+        offset = 0
+        for nodes, weights, chunk_starts in chunks:
+            starts.append(chunk_starts[1:] + offset)
+            offset += len(nodes)
+        self.nodes = np.concatenate([chunk[0] for chunk in chunks])
+        self.weights = np.concatenate([chunk[1] for chunk in chunks])
+        self.starts = np.concatenate(starts)
+        if tri.j_unique is not None:
+            self.nodes = tri.j_unique[self.nodes]
+
+        counts = np.diff(self.starts)
+        self._rows = np.repeat(np.arange(len(counts)), counts)
+        self._outside = counts == 0
+
+    def __call__(self, z, default_value=np.nan):
+        z = np.asarray(z, dtype=np.float64)
+        if z.shape != self.triangulation.old_shape:
+            raise ValueError("z must be the same shape as x and y")
+        vals = np.zeros(len(self._outside), np.float64)
+        sums = np.bincount(self._rows, self.weights*z[self.nodes])
+        vals[:len(sums)] = sums
+        vals[self._outside] = default_value
+        return vals.reshape(self.shape)
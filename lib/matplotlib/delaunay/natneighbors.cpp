@@ -47,11 +47,13 @@ int NaturalNeighbors::find_containing_triangle(double targetx, double targety, i
     return final_triangle;
 }
 
-double NaturalNeighbors::interpolate_one(double *z, double targetx, double targety,
-    double defvalue, int &start_triangle)
+bool NaturalNeighbors::find_areas(double targetx, double targety,
+    int &start_triangle, vector<int> &qs, vector<double> &areas)
 {
+    qs.clear();
+    areas.clear();
     int t = find_containing_triangle(targetx, targety, start_triangle);
-    if (t == -1) return defvalue;
+    if (t == -1) return false;
 
     start_triangle = t;
     vector<int> circumtri;
@@ -89,11 +91,6 @@ double NaturalNeighbors::interpolate_one(double *z, double targetx, double targe
     }
 
     vector<int>::iterator it;
-    double f = 0.0;
-    double A = 0.0;
-    double tA=0.0, yA=0.0, cA=0.0; // Kahan summation temps for A
-    double tf=0.0, yf=0.0, cf=0.0; // Kahan summation temps for f
-
     vector<int> edge;
     bool onedge = false;
     bool onhull = false;
@@ -119,10 +116,14 @@ double NaturalNeighbors::interpolate_one(double *z, double targetx, double targe
                 // node
                 if ((fabs(targetx - this->x[INDEX3(this->nodes, t, j)]) < TOLERANCE_EPS)
                  && (fabs(targety - this->y[INDEX3(this->nodes, t, j)]) < TOLERANCE_EPS)) {
-                    return z[INDEX3(this->nodes, t, j)];
+                    qs.assign(1, INDEX3(this->nodes, t, j));
+                    areas.assign(1, 1.0);
+                    return true;
                 } else if ((fabs(targetx - this->x[INDEX3(this->nodes, t, k)]) < TOLERANCE_EPS)
                         && (fabs(targety - this->y[INDEX3(this->nodes, t, k)]) < TOLERANCE_EPS)) {
-                    return z[INDEX3(this->nodes, t, k)];
+                    qs.assign(1, INDEX3(this->nodes, t, k));
+                    areas.assign(1, 1.0);
+                    return true;
                 } else if (!onedge) {
                     onedge = true;
                     edge.push_back(INDEX3(this->nodes, t, j));
@@ -142,16 +143,8 @@ double NaturalNeighbors::interpolate_one(double *z, double targetx, double targe
                                   INDEX2(c, j, 0), INDEX2(c, j, 1),
                                   INDEX2(c, k, 0), INDEX2(c, k, 1));
 
-
-                yA = ati - cA;
-                tA = A + yA;
-                cA = (tA - A) - yA;
-                A = tA;
-
-                yf = ati*z[q] - cf;
-                tf = f + yf;
-                cf = (tf - f) - yf;
-                f = tf;
+                qs.push_back(q);
+                areas.push_back(ati);
             }
         }
     }
@@ -166,7 +159,11 @@ double NaturalNeighbors::interpolate_one(double *z, double targetx, double targe
         if (onhull) {
             double a = (hypot(targetx-x[edge[0]], targety-y[edge[0]]) / 
                         hypot(x[edge[1]]-x[edge[0]], y[edge[1]]-y[edge[0]]));
-            return (1-a) * z[edge[0]] + a*z[edge[1]];
+            qs.assign(1, edge[0]);
+            areas.assign(1, 1-a);
+            qs.push_back(edge[1]);
+            areas.push_back(a);
+            return true;
         }
 
         set<int> T(circumtri.begin(), circumtri.end());
@@ -243,15 +240,48 @@ double NaturalNeighbors::interpolate_one(double *z, double targetx, double targe
         double a0 = poly0.area();
         double a1 = poly1.area();
 
-
-        f += a0*z[edge[0]];
-        A += a0;
-        f += a1*z[edge[1]];
-        A += a1;
+        qs.push_back(edge[0]);
+        areas.push_back(a0);
+        qs.push_back(edge[1]);
+        areas.push_back(a1);
 
         // Anticlimactic, isn't it?
     }
 
+    return true;
+}
+
+double NaturalNeighbors::interpolate_one(double *z, double targetx, double targety,
+    double defvalue, int &start_triangle)
+{
+    vector<int> qs;
+    vector<double> areas;
+    return interpolate_one(z, targetx, targety, defvalue, start_triangle,
+        qs, areas);
+}
+
+double NaturalNeighbors::interpolate_one(double *z, double targetx, double targety,
+    double defvalue, int &start_triangle, vector<int> &qs, vector<double> &areas)
+{
+    if (!find_areas(targetx, targety, start_triangle, qs, areas)) return defvalue;
+
+    double f = 0.0;
+    double A = 0.0;
+    double tA=0.0, yA=0.0, cA=0.0; // Kahan summation temps for A
+    double tf=0.0, yf=0.0, cf=0.0; // Kahan summation temps for f
+
+    for (size_t i=0; i<qs.size(); i++) {
+        yA = areas[i] - cA;
+        tA = A + yA;
+        cA = (tA - A) - yA;
+        A = tA;
+
+        yf = areas[i]*z[qs[i]] - cf;
+        tf = f + yf;
+        cf = (tf - f) - yf;
+        f = tf;
+    }
+
     f /= A;
     return f;
 }
@@ -260,25 +290,28 @@ void NaturalNeighbors::interpolate_grid(double *z,
     double x0, double x1, int xsteps,
     double y0, double y1, int ysteps,
     double *output,
-    double defvalue, int start_triangle)
+    double defvalue, int start_triangle, int row0, int row1)
 {
     int i, ix, iy, rowtri, coltri, tri;
     double dx, dy, targetx, targety;
+    vector<int> qs;
+    vector<double> areas;
 
     dx = (x1 - x0) / (xsteps-1);
     dy = (y1 - y0) / (ysteps-1);
 
-    rowtri = 0;
+    if (row1 == -1) row1 = ysteps;
+    rowtri = start_triangle;
     i = 0;
-    for (iy=0; iy<ysteps; iy++) {
+    for (iy=row0; iy<row1; iy++) {
         targety = y0 + dy*iy;
         rowtri = find_containing_triangle(x0, targety, rowtri);
         tri = rowtri;
         for (ix=0; ix<xsteps; ix++) {
             targetx = x0 + dx*ix;
             coltri = tri;
-            INDEXN(output, xsteps, iy, ix) = interpolate_one(z, targetx, targety,
-                defvalue, coltri);
+            INDEXN(output, xsteps, (iy-row0), ix) = interpolate_one(z, targetx, targety,
+                defvalue, coltri, qs, areas);
             if (coltri != -1) tri = coltri;
         }
     }
@@ -288,12 +321,42 @@ void NaturalNeighbors::interpolate_unstructured(double *z, int size,
     double *intx, double *inty, double *output, double defvalue)
 {
     int i, tri1, tri2;
+    vector<int> qs;
+    vector<double> areas;
+
+    tri1 = 0;
+    tri2 = 0;
+    for (i=0; i<size; i++) {
+        tri2 = tri1;
+        output[i] = interpolate_one(z, intx[i], inty[i], defvalue, tri2,
+            qs, areas);
+        if (tri2 != -1) tri1 = tri2;
+    }
+}
+
+void NaturalNeighbors::weights_unstructured(int size,
+    double *intx, double *inty,
+    vector<int> &qs, vector<double> &weights, vector<int> &starts)
+{
+    int i, tri1, tri2;
+    size_t j;
+    vector<int> pointqs;
+    vector<double> areas;
 
     tri1 = 0;
     tri2 = 0;
+    starts.push_back(qs.size());
     for (i=0; i<size; i++) {
         tri2 = tri1;
-        output[i] = interpolate_one(z, intx[i], inty[i], defvalue, tri2);
+        if (find_areas(intx[i], inty[i], tri2, pointqs, areas)) {
+            double A = 0.0;
+            for (j=0; j<areas.size(); j++) A += areas[j];
+            for (j=0; j<pointqs.size(); j++) {
+                qs.push_back(pointqs[j]);
+                weights.push_back(areas[j] / A);
+            }
+        }
+        starts.push_back(qs.size());
         if (tri2 != -1) tri1 = tri2;
     }
 }
@@ -2,6 +2,7 @@
 #define _NATNEIGHBORS_H
 
 #include <list>
+#include <vector>
 using namespace std;
 
 class NaturalNeighbors
@@ -11,23 +12,44 @@ public:
         double *centers, int *nodes, int *neighbors);
     ~NaturalNeighbors();
 
+    // Find the nodes whose Voronoi polygons a point inserted at the target
+    // would steal area from, and the areas stolen, which are proportional to
+    // the natural neighbor coordinates of the target.  Returns false if the
+    // target is outside the convex hull.
+    bool find_areas(double targetx, double targety, int &start_triangle,
+        vector<int> &qs, vector<double> &areas);
+
     double interpolate_one(double *z, double targetx, double targety,
         double defvalue, int &start_triangle);
 
+    // Fill output with rows row0 to row1-1 (default: all) of the grid.
     void interpolate_grid(double *z, 
         double x0, double x1, int xsteps,
         double y0, double y1, int ysteps,
-        double *output, double defvalue, int start_triangle);
+        double *output, double defvalue, int start_triangle,
+        int row0=0, int row1=-1);
 
     void interpolate_unstructured(double *z, int size, 
         double *intx, double *inty, double *output, double defvalue);
 
+    // Append the natural neighbor coordinates of each point to qs and
+    // weights, and the index of the end of its coordinates to starts, so that
+    // the interpolant at point i is the sum of weights[j]*z[qs[j]] for j from
+    // starts[i] to starts[i+1]-1.  This does not use any Python objects.
+    void weights_unstructured(int size, double *intx, double *inty,
+        vector<int> &qs, vector<double> &weights, vector<int> &starts);
+
 private:
     int npoints, ntriangles;
     double *x, *y, *centers, *radii2;
     int *nodes, *neighbors;
 
     int find_containing_triangle(double targetx, double targety, int start_triangle);
+
+    // interpolate_one, reusing the given vectors for the areas
+    double interpolate_one(double *z, double targetx, double targety,
+        double defvalue, int &start_triangle,
+        vector<int> &qs, vector<double> &areas);
 };
 
 #endif // _NATNEIGHBORS_H
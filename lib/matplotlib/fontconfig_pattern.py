@@ -19,10 +19,15 @@ information.
 # dependency problems, or an undesired dependency on traits even
 # when the traits-based config framework is not used.
 
-import re
+import re, threading
 from matplotlib.pyparsing import Literal, ZeroOrMore, \
     Optional, Regex, StringEnd, ParseException, Suppress
 
+# pyparsing's packrat cache is global, and matplotlib's parsers keep
+# their results on the parser instance, so every pyparsing-based
+# parser (this one and mathtext) serializes on this lock
+parser_lock = threading.RLock()
+
 family_punc = r'\\\-:,'
 family_unescape = re.compile(r'\\([%s])' % family_punc).sub
 family_escape = re.compile(r'([%s])' % family_punc).sub
@@ -120,13 +125,17 @@ class FontconfigPatternParser:
         of key/value pairs useful for initializing a
         :class:`font_manager.FontProperties` object.
         """
-        props = self._properties = {}
+        parser_lock.acquire()
         try:
-            self._parser.parseString(pattern)
-        except self.ParseException, e:
-            raise ValueError("Could not parse font string: '%s'\n%s" % (pattern, e))
-
-        self._properties = None
+            props = self._properties = {}
+            try:
+                self._parser.parseString(pattern)
+            except self.ParseException, e:
+                raise ValueError("Could not parse font string: '%s'\n%s" % (pattern, e))
+
+            self._properties = None
+        finally:
+            parser_lock.release()
         return props
 
     def _family(self, s, loc, tokens):
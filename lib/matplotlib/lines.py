@@ -11,6 +11,7 @@ from numpy import ma
 from matplotlib import verbose
 import artist
 from artist import Artist
+import cbook
 from cbook import iterable, is_string_like, is_numlike, ls_mapper, dedent,\
 flatten, is_math_text
 from colors import colorConverter
@@ -414,6 +415,110 @@ class Line2D(Artist):
         self.set_xdata(x)
         self.set_ydata(y)
 
+    def append_data(self, x, y, maxlen=None):
+        """
+        Append the points *x*, *y* (scalars or 1D sequences) to the
+        data of the line.  If *maxlen* is not *None*, only the last
+        *maxlen* points are kept.
+
+        Unlike :meth:`set_data` with the full arrays, this takes
+        amortized constant time per point for streaming data: the
+        points are added to a growing buffer, and the path, the
+        sorted-x state used to draw only the visible part of the line
+        and the data limits of the axes are updated from the new
+        points only.  The data limits only ever grow, like with
+        :meth:`~matplotlib.axes.Axes.update_datalim`; call
+        :meth:`~matplotlib.axes.Axes.relim` to shrink them to the
+        points kept.
+
+        Lines with masked data fall back to concatenating the full
+        arrays.
+        """
+        if self._invalidx or self._invalidy:
+            self.recache()
+
+        xorig, yorig = np.atleast_1d(x), np.atleast_1d(y)
+        x = np.atleast_1d(self.convert_xunits(xorig)).ravel()
+        y = np.atleast_1d(self.convert_yunits(yorig)).ravel()
+        if len(x)==1 and len(y)>1:
+            x = x * np.ones(y.shape, float)
+        if len(y)==1 and len(x)>1:
+            y = y * np.ones(x.shape, float)
+        if len(x) != len(y):
+            raise RuntimeError('xdata and ydata must be the same length')
+
+        if (ma.isMaskedArray(self._xy) or ma.isMaskedArray(x) or
+            ma.isMaskedArray(y)):
+            keep = slice(maxlen and -maxlen, None)
+            self.set_data(ma.concatenate((self._x, x))[keep],
+                          ma.concatenate((self._y, y))[keep])
+            self.recache()
+            new = Path(ma.column_stack((x, y)))
+        else:
+            x, y = np.asarray(x, float), np.asarray(y, float)
+            new = np.column_stack((x, y))
+            if self._xybuffer is None:
+                self._xybuffer = cbook.GrowableArray(self._xy, maxlen)
+            buf = self._xybuffer
+            buf.maxlen = maxlen
+            if self.have_units():
+                # keep the unit-space data in buffers of their own, so
+                # a later recache converts all of it again
+                xorig = self._broadcast_orig(xorig, len(x))
+                yorig = self._broadcast_orig(yorig, len(y))
+                if self._origbuffers is None:
+                    self._origbuffers = (
+                        self._orig_buffer(self._xorig, xorig, maxlen),
+                        self._orig_buffer(self._yorig, yorig, maxlen))
+
+            if len(x) and self._x_sorted is not None:
+                self._x_sorted = (self._x_sorted and self._is_sorted(x) and
+                                  (not len(self._x) or x[0] >= self._x[-1]))
+            self._xy = buf.extend(new)
+            self._x = self._xy[:, 0]
+            self._y = self._xy[:, 1]
+            if self._x_sorted is None and len(self._x) > 100:
+                self._x_sorted = self._is_sorted(self._x)
+            self._update_subslice()
+
+            if self.have_units():
+                xbuf, ybuf = self._origbuffers
+                xbuf.maxlen = ybuf.maxlen = maxlen
+                self._xorig = xbuf.extend(xorig)
+                self._yorig = ybuf.extend(yorig)
+            else:
+                self._xorig, self._yorig = self._x, self._y
+
+            old = self._path
+            self._path = Path._fast_from_codes_and_verts(self._xy, None, {
+                'should_simplify': (rcParams['path.simplify'] and
+                                    len(self._xy) >= 128),
+                'has_nonfinite': (old.has_nonfinite or
+                                  not np.isfinite(new).all()),
+                'interpolation_steps': old._interpolation_steps})
+            self._transformed_path = None
+            new = Path(new)
+
+        if self.axes is not None and self in self.axes.lines:
+            self.axes._update_line_limits(self, new)
+
+    def _broadcast_orig(self, orig, n):
+        'return the 1D unit-space data *orig* repeated to length *n*'
+        orig = np.asarray(orig).ravel()
+        if len(orig) == 1 and n > 1:
+            orig = orig.repeat(n)
+        return orig
+
+    def _orig_buffer(self, orig, new, maxlen):
+        """
+        Return a :class:`~matplotlib.cbook.GrowableArray` holding the
+        unit-space data *orig* of the line, with a dtype which can
+        also hold the *new* points to be appended.
+        """
+        orig = self._broadcast_orig(orig, len(self._xy))
+        dtype = np.concatenate((orig[:0], new[:0])).dtype
+        return cbook.GrowableArray(orig, maxlen, dtype)
+
     def recache_always(self):
         self.recache(always=True)
 
@@ -455,21 +560,30 @@ class Line2D(Artist):
         self._x = self._xy[:, 0] # just a view
         self._y = self._xy[:, 1] # just a view
 
-        self._subslice = False
-        if (self.axes and len(x) > 100 and self._is_sorted(x) and
-            self.axes.name == 'rectilinear' and
-            self.axes.get_xscale() == 'linear' and
-            self._markevery is None):
-            self._subslice = True
+        # only long lines are subsliced; leave short ones unchecked
+        self._x_sorted = None
+        if len(x) > 100:
+            self._x_sorted = self._is_sorted(x)
+        self._update_subslice()
         if hasattr(self, '_path'):
             interpolation_steps = self._path._interpolation_steps
         else:
             interpolation_steps = 1
         self._path = Path(self._xy, None, interpolation_steps)
+        self._xybuffer = None
+        self._origbuffers = None
         self._transformed_path = None
         self._invalidx = False
         self._invalidy = False
 
+    def _update_subslice(self):
+        # draw only the visible part of long lines with sorted x
+        self._subslice = bool(self.axes and len(self._x) > 100 and
+                              self._x_sorted and
+                              self.axes.name == 'rectilinear' and
+                              self.axes.get_xscale() == 'linear' and
+                              self._markevery is None)
+
     def _transform_path(self, subslice=None):
         # Masked arrays are now handled by the Path class itself
         if subslice is not None:
@@ -1145,6 +1259,10 @@ class Line2D(Artist):
         self._draw_triangle(renderer, gc, path, path_trans, 'right')
 
 
+    _square_path_bottom = Path([[0.0, 0.0], [1.0, 0.0], [1.0, 0.5],
+                                [0.0, 0.5], [0.0, 0.0]])
+    _square_path_top = Path([[0.0, 0.5], [1.0, 0.5], [1.0, 1.0],
+                             [0.0, 1.0], [0.0, 0.5]])
     def _draw_square(self, renderer, gc, path, path_trans):
         gc.set_snap(renderer.points_to_pixels(self._markersize) >= 2.0)
         side = renderer.points_to_pixels(self._markersize)
@@ -1164,15 +1282,16 @@ class Line2D(Artist):
             elif fs=='left': rotate = 270.
             else: rotate = 90.
 
-            bottom = Path([[0.0, 0.0], [1.0, 0.0], [1.0, 0.5], [0.0, 0.5], [0.0, 0.0]])
-            top = Path([[0.0, 0.5], [1.0, 0.5], [1.0, 1.0], [0.0, 1.0], [0.0, 0.5]])
             transform = transform.rotate_deg(rotate)
-            renderer.draw_markers(gc, bottom, transform,
+            renderer.draw_markers(gc, self._square_path_bottom, transform,
                                   path, path_trans, rgbFace)
-            renderer.draw_markers(gc, top, transform,
+            renderer.draw_markers(gc, self._square_path_top, transform,
                                   path, path_trans, rgbFace_alt)
 
 
+    # halves of the unit square, split along its diagonal
+    _diamond_path_right = Path([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
+    _diamond_path_left = Path([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]])
     def _draw_diamond(self, renderer, gc, path, path_trans):
         gc.set_snap(renderer.points_to_pixels(self._markersize) >= 5.0)
         side = renderer.points_to_pixels(self._markersize)
@@ -1184,9 +1303,6 @@ class Line2D(Artist):
             renderer.draw_markers(gc, Path.unit_rectangle(), transform,
                                   path, path_trans, rgbFace)
         else:
-            right = Path([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
-            left = Path([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]])
-
             if fs=='bottom': rotate = 270.
             elif fs=='top': rotate = 90.
             elif fs=='left': rotate = 180.
@@ -1195,9 +1311,9 @@ class Line2D(Artist):
             transform = transform.rotate_deg(rotate)
             rgbFace_alt = self._get_rgb_face(alt=True)
 
-            renderer.draw_markers(gc, right, transform,
+            renderer.draw_markers(gc, self._diamond_path_right, transform,
                                   path, path_trans, rgbFace)
-            renderer.draw_markers(gc, left, transform,
+            renderer.draw_markers(gc, self._diamond_path_left, transform,
                                   path, path_trans, rgbFace_alt)
 
 
@@ -1214,9 +1330,6 @@ class Line2D(Artist):
             renderer.draw_markers(gc, Path.unit_rectangle(), transform,
                                   path, path_trans, rgbFace)
         else:
-            right = Path([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
-            left = Path([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]])
-
             if fs=='bottom': rotate = 270.
             elif fs=='top': rotate = 90.
             elif fs=='left': rotate = 180.
@@ -1226,12 +1339,50 @@ class Line2D(Artist):
             transform = transform.rotate_deg(rotate).scale(offset * 0.6, offset)
             rgbFace_alt = self._get_rgb_face(alt=True)
 
-            renderer.draw_markers(gc, right, transform,
+            renderer.draw_markers(gc, self._diamond_path_right, transform,
                                   path, path_trans, rgbFace)
-            renderer.draw_markers(gc, left, transform,
+            renderer.draw_markers(gc, self._diamond_path_left, transform,
                                   path, path_trans, rgbFace_alt)
 
 
+    def _half_paths(top, bottom, left, right):
+        # the paths drawn in the fill color and in the alternate fill
+        # color, for each fillstyle
+        return {'top': (top, bottom), 'bottom': (bottom, top),
+                'left': (left, right), 'right': (right, left)}
+
+    verts = Path.unit_regular_polygon(5).vertices
+    y = (1+np.sqrt(5))/4.
+    _pentagon_paths = _half_paths(
+        Path([verts[0], verts[1], verts[4], verts[0]]),
+        Path([verts[1], verts[2], verts[3], verts[4], verts[1]]),
+        Path([verts[0], verts[1], verts[2], [0,-y], verts[0]]),
+        Path([verts[0], verts[4], verts[3], [0,-y], verts[0]]))
+
+    verts = Path.unit_regular_star(5, innerCircle=0.381966).vertices
+    _star_paths = _half_paths(
+        Path(np.vstack((verts[0:4,:], verts[7:10,:], verts[0]))),
+        Path(np.vstack((verts[3:8,:], verts[3]))),
+        Path(np.vstack((verts[0:6,:], verts[0]))),
+        Path(np.vstack((verts[0], verts[5:10,:], verts[0]))))
+
+    # not drawing inside lines
+    verts = Path.unit_regular_polygon(6).vertices
+    x = abs(np.cos(5*np.pi/6.))
+    _hexagon1_paths = _half_paths(
+        Path(np.vstack(([-x,0],verts[(1,0,5),:],[x,0]))),
+        Path(np.vstack(([-x,0],verts[2:5,:],[x,0]))),
+        Path(verts[(0,1,2,3),:]),
+        Path(verts[(0,5,4,3),:]))
+
+    x, y = np.sqrt(3)/4, 3/4.
+    _hexagon2_paths = _half_paths(
+        Path(verts[(1,0,5,4,1),:]),
+        Path(verts[(1,2,3,4),:]),
+        Path(np.vstack(([x,y],verts[(0,1,2),:],[-x,-y],[x,y]))),
+        Path(np.vstack(([x,y],verts[(5,4,3),:],[-x,-y]))))
+    del _half_paths, verts, x, y
+
     def _draw_pentagon(self, renderer, gc, path, path_trans):
         gc.set_snap(renderer.points_to_pixels(self._markersize) >= 5.0)
         offset = 0.5 * renderer.points_to_pixels(self._markersize)
@@ -1246,23 +1397,7 @@ class Line2D(Artist):
             renderer.draw_markers(gc, polypath, transform,
                                   path, path_trans, rgbFace)
         else:
-            verts = polypath.vertices
-
-            y = (1+np.sqrt(5))/4.
-            top = Path([verts[0], verts[1], verts[4], verts[0]])
-            bottom = Path([verts[1], verts[2], verts[3], verts[4], verts[1]])
-            left = Path([verts[0], verts[1], verts[2], [0,-y], verts[0]])
-            right = Path([verts[0], verts[4], verts[3], [0,-y], verts[0]])
-
-            if fs == 'top':
-                mpath, mpath_alt = top, bottom
-            elif fs == 'bottom':
-                mpath, mpath_alt = bottom, top
-            elif fs == 'left':
-                mpath, mpath_alt = left, right
-            else:
-                mpath, mpath_alt = right, left
-
+            mpath, mpath_alt = self._pentagon_paths[fs]
             rgbFace_alt = self._get_rgb_face(alt=True)
             renderer.draw_markers(gc, mpath, transform,
                                   path, path_trans, rgbFace)
@@ -1284,22 +1419,7 @@ class Line2D(Artist):
             renderer.draw_markers(gc, polypath, transform,
                                   path, path_trans, rgbFace)
         else:
-            verts = polypath.vertices
-
-            top = Path(np.vstack((verts[0:4,:], verts[7:10,:], verts[0])))
-            bottom = Path(np.vstack((verts[3:8,:], verts[3])))
-            left = Path(np.vstack((verts[0:6,:], verts[0])))
-            right = Path(np.vstack((verts[0], verts[5:10,:], verts[0])))
-
-            if fs == 'top':
-                mpath, mpath_alt = top, bottom
-            elif fs == 'bottom':
-                mpath, mpath_alt = bottom, top
-            elif fs == 'left':
-                mpath, mpath_alt = left, right
-            else:
-                mpath, mpath_alt = right, left
-
+            mpath, mpath_alt = self._star_paths[fs]
             rgbFace_alt = self._get_rgb_face(alt=True)
             renderer.draw_markers(gc, mpath, transform,
                                   path, path_trans, rgbFace)
@@ -1321,24 +1441,7 @@ class Line2D(Artist):
             renderer.draw_markers(gc, polypath, transform,
                                   path, path_trans, rgbFace)
         else:
-            verts = polypath.vertices
-
-            # not drawing inside lines
-            x = abs(np.cos(5*np.pi/6.))
-            top = Path(np.vstack(([-x,0],verts[(1,0,5),:],[x,0])))
-            bottom = Path(np.vstack(([-x,0],verts[2:5,:],[x,0])))
-            left = Path(verts[(0,1,2,3),:])
-            right = Path(verts[(0,5,4,3),:])
-
-            if fs == 'top':
-                mpath, mpath_alt = top, bottom
-            elif fs == 'bottom':
-                mpath, mpath_alt = bottom, top
-            elif fs == 'left':
-                mpath, mpath_alt = left, right
-            else:
-                mpath, mpath_alt = right, left
-
+            mpath, mpath_alt = self._hexagon1_paths[fs]
             rgbFace_alt = self._get_rgb_face(alt=True)
             renderer.draw_markers(gc, mpath, transform,
                                   path, path_trans, rgbFace)
@@ -1360,24 +1463,7 @@ class Line2D(Artist):
             renderer.draw_markers(gc, polypath, transform,
                                   path, path_trans, rgbFace)
         else:
-            verts = polypath.vertices
-
-            # not drawing inside lines
-            x, y = np.sqrt(3)/4, 3/4.
-            top = Path(verts[(1,0,5,4,1),:])
-            bottom = Path(verts[(1,2,3,4),:])
-            left = Path(np.vstack(([x,y],verts[(0,1,2),:],[-x,-y],[x,y])))
-            right = Path(np.vstack(([x,y],verts[(5,4,3),:],[-x,-y])))
-
-            if fs == 'top':
-                mpath, mpath_alt = top, bottom
-            elif fs == 'bottom':
-                mpath, mpath_alt = bottom, top
-            elif fs == 'left':
-                mpath, mpath_alt = left, right
-            else:
-                mpath, mpath_alt = right, left
-
+            mpath, mpath_alt = self._hexagon2_paths[fs]
             rgbFace_alt = self._get_rgb_face(alt=True)
             renderer.draw_markers(gc, mpath, transform,
                                   path, path_trans, rgbFace)
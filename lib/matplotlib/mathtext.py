@@ -42,6 +42,7 @@ from matplotlib.cbook import Bunch, get_realpath_and_stat, \
     is_string_like, maxdict
 from matplotlib.ft2font import FT2Font, FT2Image, KERNING_DEFAULT, LOAD_FORCE_AUTOHINT, LOAD_NO_HINTING
 from matplotlib.font_manager import findfont, FontProperties
+from matplotlib.fontconfig_pattern import parser_lock
 from matplotlib._mathtext_data import latex_to_bakoma, \
         latex_to_standard, tex2uni, latex_to_cmex, stix_virtual_fonts
 from matplotlib import get_data_path, rcParams
@@ -2932,17 +2933,21 @@ class MathTextParser(object):
 
         fontsize = prop.get_size_in_points()
 
-        # This is a class variable so we don't rebuild the parser
-        # with each request.
-        if self._parser is None:
-            self.__class__._parser = Parser()
-
-        box = self._parser.parse(s, font_output, fontsize, dpi)
-        font_output.set_canvas_size(box.width, box.height, box.depth)
-        result = font_output.get_results(box)
+        parser_lock.acquire()
+        try:
+            # This is a class variable so we don't rebuild the parser
+            # with each request.
+            if self._parser is None:
+                self.__class__._parser = Parser()
+
+            box = self._parser.parse(s, font_output, fontsize, dpi)
+            font_output.set_canvas_size(box.width, box.height, box.depth)
+            result = font_output.get_results(box)
+            # Free up the transient data structures
+            self._parser.clear()
+        finally:
+            parser_lock.release()
         self._cache[cacheKey] = result
-        # Free up the transient data structures
-        self._parser.clear()
 
         # Fix cyclical references
         font_output.destroy()
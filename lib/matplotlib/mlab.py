@@ -23,6 +23,10 @@ MATLAB compatible functions
   interpolate irregularly distributed data to a
              regular grid.
 
+:class:`GridInterpolator`
+  interpolate many sets of values at the same irregularly
+             distributed points to a regular grid.
+
 :func:`prctile`
   find the percentiles of a sequence
 
@@ -38,6 +42,9 @@ MATLAB compatible functions
 :func:`specgram`
   Spectrogram (power spectral density over segments of time)
 
+:func:`specgram_chunks`
+  Spectrogram of a long signal, a chunk of segments at a time
+
 Miscellaneous functions
 -------------------------
 
@@ -142,10 +149,11 @@ care--function signatures may differ):
 """
 
 from __future__ import division
-import csv, warnings, copy, os, operator
+import csv, warnings, copy, os, operator, re
 
 import numpy as np
 ma = np.ma
+from numpy.lib.stride_tricks import as_strided
 from matplotlib import verbose
 
 import matplotlib.nxutils as nxutils
@@ -200,14 +208,50 @@ def detrend_linear(y):
     a = y.mean() - b*x.mean()
     return y - (b*x + a)
 
+def _stride_windows(x, NFFT, step, n):
+    """
+    Return an (*n*, *NFFT*) view of the 1-D array *x*, whose rows are
+    the *n* segments of length *NFFT* starting every *step* samples.
+    Nothing is copied, so the view must not be written to.
+    """
+    if len(x) < (n-1)*step + NFFT:
+        raise ValueError("the data are too short for %d segments" % n)
+    return as_strided(x, shape=(n, NFFT),
+                      strides=(step*x.strides[0], x.strides[0]))
+
+def _detrend_segments(segs, detrend):
+    """
+    Return each row of the 2-D array *segs* detrended by the function
+    *detrend*.  :func:`detrend_none`, :func:`detrend_mean` and
+    :func:`detrend_linear` are applied to all of the rows at once; any
+    other function is called on one row at a time.
+    """
+    if detrend is detrend_none:
+        return segs
+    if detrend is detrend_mean:
+        return segs - segs.mean(axis=1)[:,np.newaxis]
+    if detrend is detrend_linear:
+        x = np.arange(segs.shape[1], dtype=np.float_)
+        x -= x.mean()
+        # conjugated for complex data, as np.cov is in detrend_linear
+        b = np.dot(np.conjugate(segs), x) / np.dot(x, x)
+        return segs - segs.mean(axis=1)[:,np.newaxis] - b[:,np.newaxis]*x
+    return np.array([detrend(seg) for seg in segs])
+
+#The number of elements in a block of segments which the spectral
+#helpers detrend, window and transform at once; the temporaries take a
+#few times as much memory as the input.
+_spectral_block_size = 2**20
+
 #This is a helper function that implements the commonality between the
 #psd, csd, and spectrogram.  It is *NOT* meant to be used outside of mlab
-def _spectral_helper(x, y, NFFT=256, Fs=2, detrend=detrend_none,
+def _spectral_blocks(x, y, NFFT=256, Fs=2, detrend=detrend_none,
         window=window_hanning, noverlap=0, pad_to=None, sides='default',
-        scale_by_freq=None):
+        scale_by_freq=None, nsegments=None):
     #The checks for if y is x are so that we can use the same function to
     #implement the core of psd(), csd(), and spectrogram() without doing
-    #extra calculations.  We return the unaveraged Pxy, freqs, and t.
+    #extra calculations.  We yield the unaveraged Pxy, freqs, and t for
+    #successive blocks of up to nsegments segments.
     same_data = y is x
 
     #Make sure we're dealing with a numpy array. If y and x were the same
@@ -257,46 +301,66 @@ def _spectral_helper(x, y, NFFT=256, Fs=2, detrend=detrend_none,
     else:
         windowVals = window(np.ones((NFFT,), x.dtype))
 
+    # Scale the spectrum by the norm of the window to compensate for
+    # windowing loss; see Bendat & Piersol Sec 11.5.2.
+    windowNorm = 1 / (np.abs(windowVals)**2).sum()
+
     step = NFFT - noverlap
     ind = np.arange(0, len(x) - NFFT + 1, step)
-    n = len(ind)
-    Pxy = np.zeros((numFreqs,n), np.complex_)
+    if nsegments is None:
+        nsegments = max(1, _spectral_block_size // pad_to)
 
-    # do the ffts of the slices
-    for i in range(n):
-        thisX = x[ind[i]:ind[i]+NFFT]
-        thisX = windowVals * detrend(thisX)
+    freqs = float(Fs) / pad_to * np.arange(numFreqs)
+    centered = (np.iscomplexobj(x) and sides == 'default') or sides == 'twosided'
+    if centered:
+        # center the frequency range at zero
+        freqs = np.concatenate((freqs[numFreqs//2:] - Fs, freqs[:numFreqs//2]))
+
+    # do the ffts of a block of slices at a time; each block is a strided
+    # view of the data, so only its own samples are read
+    for i in range(0, len(ind), nsegments):
+        blockind = ind[i:i+nsegments]
+        start, stop = blockind[0], blockind[-1] + NFFT
+        thisX = _stride_windows(x[start:stop], NFFT, step, len(blockind))
+        thisX = windowVals * _detrend_segments(thisX, detrend)
         fx = np.fft.fft(thisX, n=pad_to)
 
         if same_data:
             fy = fx
         else:
-            thisY = y[ind[i]:ind[i]+NFFT]
-            thisY = windowVals * detrend(thisY)
+            thisY = _stride_windows(y[start:stop], NFFT, step, len(blockind))
+            thisY = windowVals * _detrend_segments(thisY, detrend)
             fy = np.fft.fft(thisY, n=pad_to)
-        Pxy[:,i] = np.conjugate(fx[:numFreqs]) * fy[:numFreqs]
+        Pxy = (np.conjugate(fx[:,:numFreqs]) * fy[:,:numFreqs]).T
+        Pxy *= windowNorm
 
-    # Scale the spectrum by the norm of the window to compensate for
-    # windowing loss; see Bendat & Piersol Sec 11.5.2.
-    Pxy *= 1 / (np.abs(windowVals)**2).sum()
+        # Also include scaling factors for one-sided densities and dividing
+        # by the sampling frequency, if desired. Scale everything, except
+        # the DC component and the NFFT/2 component:
+        Pxy[1:-1] *= scaling_factor
 
-    # Also include scaling factors for one-sided densities and dividing by the
-    # sampling frequency, if desired. Scale everything, except the DC component
-    # and the NFFT/2 component:
-    Pxy[1:-1] *= scaling_factor
+        #But do scale those components by Fs, if required
+        if scale_by_freq:
+            Pxy[[0,-1]] /= Fs
 
-    #But do scale those components by Fs, if required
-    if scale_by_freq:
-        Pxy[[0,-1]] /= Fs
+        t = 1./Fs * (blockind + NFFT / 2.)
 
-    t = 1./Fs * (ind + NFFT / 2.)
-    freqs = float(Fs) / pad_to * np.arange(numFreqs)
+        if centered:
+            Pxy = np.concatenate((Pxy[numFreqs//2:, :], Pxy[:numFreqs//2, :]), 0)
 
-    if (np.iscomplexobj(x) and sides == 'default') or sides == 'twosided':
-        # center the frequency range at zero
-        freqs = np.concatenate((freqs[numFreqs//2:] - Fs, freqs[:numFreqs//2]))
-        Pxy = np.concatenate((Pxy[numFreqs//2:, :], Pxy[:numFreqs//2, :]), 0)
+        yield Pxy, freqs, t
 
+def _spectral_helper(x, y, NFFT=256, Fs=2, detrend=detrend_none,
+        window=window_hanning, noverlap=0, pad_to=None, sides='default',
+        scale_by_freq=None):
+    #Collect the blocks of _spectral_blocks into the whole unaveraged
+    #Pxy, freqs, and t.
+    blocks = list(_spectral_blocks(x, y, NFFT, Fs, detrend, window,
+        noverlap, pad_to, sides, scale_by_freq))
+    Pxy, freqs, t = blocks[0]
+    if len(blocks) > 1:
+        Pxy = np.concatenate([block[0] for block in blocks], 1)
+        t = np.concatenate([block[2] for block in blocks])
     return Pxy, freqs, t
 
 #Split out these keyword docs so that they can be used elsewhere
@@ -463,6 +527,42 @@ def specgram(x, NFFT=256, Fs=2, detrend=detrend_none, window=window_hanning,
 
     return Pxx, freqs, t
 
+@docstring.dedent_interpd
+def specgram_chunks(x, NFFT=256, Fs=2, detrend=detrend_none,
+        window=window_hanning, noverlap=128, pad_to=None, sides='default',
+        scale_by_freq=None, nsegments=1024):
+    """
+    Compute the spectrogram of *x* as :func:`specgram` does, a chunk
+    of up to *nsegments* segments at a time.  This is a generator
+    yielding a tuple (*Pxx*, *freqs*, *t*) for each chunk, whose
+    columns and times follow on from those of the last one;
+    concatenating them gives the result of :func:`specgram`.
+
+    Only the samples of one chunk are read from *x* at a time, so it
+    may be a :class:`numpy.memmap` of a signal larger than memory, as
+    long as each chunk of the spectrogram is used and discarded in
+    turn::
+
+        x = np.memmap('signal.dat', dtype=np.float32, mode='r')
+        for Pxx, freqs, t in specgram_chunks(x, NFFT=1024, Fs=Fs):
+            peaks = freqs[Pxx.argmax(axis=0)]
+
+    %(PSD)s
+
+    *nsegments*: integer
+        The largest number of segments in a chunk.
+
+    .. seealso::
+
+        :func:`specgram`
+            The whole spectrogram at once.
+    """
+    assert(NFFT > noverlap)
+
+    for Pxx, freqs, t in _spectral_blocks(x, x, NFFT, Fs, detrend, window,
+            noverlap, pad_to, sides, scale_by_freq, nsegments):
+        yield Pxx.real, freqs, t
+
 _coh_error = """Coherence is calculated by averaging over *NFFT*
 length segments.  Your signal is too short for your choice of *NFFT*.
 """
@@ -515,7 +615,7 @@ def cohere_pairs( X, ij, NFFT=256, Fs=2, detrend=detrend_none,
                   window=window_hanning, noverlap=0,
                   preferSpeedOverMemory=True,
                   progressCallback=donothing_callback,
-                  returnPxx=False):
+                  returnPxx=False, nthreads=None, maxCacheBytes=None):
 
     u"""
     Call signature::
@@ -550,6 +650,16 @@ def cohere_pairs( X, ij, NFFT=256, Fs=2, detrend=detrend_none,
     than 10x faster than naively crunching all possible pairs through
     :func:`cohere`.
 
+    The cross spectral densities are computed for a batch of pairs at
+    a time, from up to *nthreads* threads (default: the number of
+    CPUs).
+
+    *maxCacheBytes* is an optional limit on the memory taken by the
+    cached FFTs.  If the FFTs of all of the columns would take more,
+    the columns are split into groups, only two of which are cached
+    at once, and the FFTs of each group are computed again for each
+    other group that it has pairs with.
+
     Returns::
 
        (Cxy, Phase, freqs)
@@ -607,7 +717,7 @@ def cohere_pairs( X, ij, NFFT=256, Fs=2, detrend=detrend_none,
     allColumns = set()
     for i,j in ij:
         allColumns.add(i); allColumns.add(j)
-    Ncols = len(allColumns)
+    allColumns = sorted(allColumns)
 
     # for real X, ignore the negative frequencies
     if np.iscomplexobj(X): numFreqs = NFFT
@@ -621,48 +731,106 @@ def cohere_pairs( X, ij, NFFT=256, Fs=2, detrend=detrend_none,
         windowVals = window
     else:
         windowVals = window(np.ones(NFFT, X.dtype))
-    ind = range(0, numRows-NFFT+1, NFFT-noverlap)
-    numSlices = len(ind)
-    FFTSlices = {}
-    FFTConjSlices = {}
-    Pxx = {}
-    slices = range(numSlices)
+    step = NFFT-noverlap
+    numSlices = len(range(0, numRows-NFFT+1, step))
     normVal = np.linalg.norm(windowVals)**2
-    for iCol in allColumns:
-        progressCallback(i/Ncols, 'Cacheing FFTs')
-        Slices = np.zeros( (numSlices,numFreqs), dtype=np.complex_)
-        for iSlice in slices:
-            thisSlice = X[ind[iSlice]:ind[iSlice]+NFFT, iCol]
-            thisSlice = windowVals*detrend(thisSlice)
-            Slices[iSlice,:] = np.fft.fft(thisSlice)[:numFreqs]
-
-        FFTSlices[iCol] = Slices
+
+    def column_slices(iCol):
+        thisSlice = _stride_windows(X[:,iCol], NFFT, step, numSlices)
+        thisSlice = windowVals*_detrend_segments(thisSlice, detrend)
+        return np.fft.fft(thisSlice)[:,:numFreqs]
+
+    # split the columns into groups small enough that the FFTs of two
+    # of them fit in the cache
+    columnBytes = numSlices*numFreqs*np.dtype(np.complex_).itemsize
+    if preferSpeedOverMemory:
+        columnBytes *= 2
+    if maxCacheBytes is None:
+        groupSize = max(1, len(allColumns))
+    else:
+        groupSize = max(1, int(maxCacheBytes // (2*columnBytes)))
+    groups = [allColumns[k:k+groupSize]
+              for k in range(0, len(allColumns), groupSize)]
+    groupOf = {}
+    position = {}
+    for g, columns in enumerate(groups):
+        for k, iCol in enumerate(columns):
+            groupOf[iCol] = g
+            position[iCol] = k
+
+    pairsOf = {}
+    for i,j in ij:
+        key = min(groupOf[i], groupOf[j]), max(groupOf[i], groupOf[j])
+        pairsOf.setdefault(key, []).append((i,j))
+
+    Pxx = {}
+    def cache_group(g):
+        # the FFTs of the slices of each column of a group, and their
+        # conjugates if preferSpeedOverMemory
+        Slices = np.empty((len(groups[g]), numSlices, numFreqs), np.complex_)
+        for k, thisSlices in enumerate(cbook.map_threaded(
+                column_slices, groups[g], nthreads)):
+            Slices[k] = thisSlices
+        for k, iCol in enumerate(groups[g]):
+            if iCol not in Pxx:
+                Pxx[iCol] = np.divide(np.mean(abs(Slices[k])**2), normVal)
         if preferSpeedOverMemory:
-            FFTConjSlices[iCol] = np.conjugate(Slices)
-        Pxx[iCol] = np.divide(np.mean(abs(Slices)**2), normVal)
-    del Slices, ind, windowVals
+            return Slices, np.conjugate(Slices)
+        return Slices, None
+
+    # do the pairs in batches small enough that their products of
+    # slices take about as much memory as a block of spectral segments
+    batchSize = max(1, _spectral_block_size//(numSlices*numFreqs))
 
-    # compute the coherences and phases for all pairs using the
-    # cached FFTs
     Cxy = {}
     Phase = {}
     count = 0
     N = len(ij)
-    for i,j in ij:
-        count +=1
-        if count%10==0:
-            progressCallback(count/N, 'Computing coherences')
-
-        if preferSpeedOverMemory:
-            Pxy = FFTSlices[i] * FFTConjSlices[j]
-        else:
-            Pxy = FFTSlices[i] * np.conjugate(FFTSlices[j])
-        if numSlices>1: Pxy = np.mean(Pxy)
-        #Pxy = np.divide(Pxy, normVal)
-        Pxy /= normVal
-        #Cxy[(i,j)] = np.divide(np.absolute(Pxy)**2, Pxx[i]*Pxx[j])
-        Cxy[i,j] = abs(Pxy)**2 / (Pxx[i]*Pxx[j])
-        Phase[i,j] =  np.arctan2(Pxy.imag, Pxy.real)
+    for ga in range(len(groups)):
+        progressCallback(ga/len(groups), 'Cacheing FFTs')
+        cacheA = cache_group(ga)
+        for gb in range(ga, len(groups)):
+            pairs = pairsOf.get((ga, gb))
+            if not pairs:
+                continue
+            if gb == ga:
+                cacheB = cacheA
+            else:
+                cacheB = cache_group(gb)
+            # compute the coherences and phases for a batch of pairs
+            # using the cached FFTs, first of the pairs whose i is in
+            # group ga and then of the others
+            for cacheI, cacheJ, theseij in (
+                (cacheA, cacheB, [(i,j) for i,j in pairs if groupOf[i]==ga]),
+                (cacheB, cacheA, [(i,j) for i,j in pairs if groupOf[i]!=ga])):
+                def batch_csd(batch):
+                    I = [position[i] for i,j in batch]
+                    J = [position[j] for i,j in batch]
+                    if preferSpeedOverMemory:
+                        Pxy = cacheI[0][I] * cacheJ[1][J]
+                    else:
+                        Pxy = cacheI[0][I] * np.conjugate(cacheJ[0][J])
+                    if numSlices>1:
+                        Pxy = np.mean(Pxy.reshape(len(batch), -1), axis=1)
+                    Pxy /= normVal
+                    return Pxy
+                batches = [theseij[k:k+batchSize]
+                           for k in range(0, len(theseij), batchSize)]
+                for batch, Pxy in zip(batches, cbook.map_threaded(
+                        batch_csd, batches, nthreads)):
+                    # one Pxx per pair, shaped to broadcast against Pxy
+                    shape = (len(batch),) + (1,)*(Pxy.ndim-1)
+                    PxxI = np.array([Pxx[i] for i,j in batch]).reshape(shape)
+                    PxxJ = np.array([Pxx[j] for i,j in batch]).reshape(shape)
+                    thisCxy = abs(Pxy)**2 / (PxxI*PxxJ)
+                    thisPhase = np.arctan2(Pxy.imag, Pxy.real)
+                    for k, (i,j) in enumerate(batch):
+                        Cxy[i,j] = thisCxy[k]
+                        Phase[i,j] = thisPhase[k]
+                    count += len(batch)
+                    progressCallback(count/N, 'Computing coherences')
+            del cacheB
+        del cacheA
 
     freqs = Fs/NFFT*np.arange(numFreqs)
     if returnPxx:
@@ -1850,33 +2018,59 @@ def rec_groupby(r, groupby, stats):
     for each outname name in the *stats* argument, with the associated
     stat summary output.
     """
-    # build a dictionary from groupby keys-> list of indices into r with
-    # those keys
-    rowd = dict()
-    for i, row in enumerate(r):
-        key = tuple([row[attr] for attr in groupby])
-        rowd.setdefault(key, []).append(i)
-
-    # sort the output by groupby keys
-    keys = rowd.keys()
-    keys.sort()
-
-    rows = []
-    for key in keys:
-        row = list(key)
-        # get the indices for this groupby key
-        ind = rowd[key]
-        thisr = r[ind]
-        # call each stat function for this groupby slice
-        row.extend([func(thisr[attr]) for attr, func, outname in stats])
-        rows.append(row)
+    # sort the rows by the groupby keys, keeping the rows of each group
+    # in their original order, and find where each group starts
+    codes = _rec_key_codes([r[attr] for attr in groupby])
+    order = np.argsort(codes, kind='mergesort')
+    codes = codes[order]
+    first = np.ones(len(codes), bool)
+    first[1:] = codes[1:] != codes[:-1]
+    bounds = np.append(np.nonzero(first)[0], len(codes))
 
     # build the output record array with groupby and outname attributes
-    attrs, funcs, outnames = zip(*stats)
     names = list(groupby)
-    names.extend(outnames)
-    return np.rec.fromrecords(rows, names=names)
+    arrays = [r[attr][order[bounds[:-1]]] for attr in groupby]
+    for attr, func, outname in stats:
+        names.append(outname)
+        arrays.append(_rec_group_stat(r[attr][order], func, bounds))
+    return np.rec.fromarrays(arrays, names=names)
 
+def _rec_key_codes(columns):
+    """
+    Number the distinct keys formed by the rows of the equal length
+    arrays in *columns*.  Equal keys get the same number, and the
+    numbers sort in the order of the keys.
+    """
+    codes = np.zeros(len(columns[0]), np.int_)
+    for col in columns:
+        # sort by the keys so far, then by this column
+        order = np.argsort(col, kind='mergesort')
+        order = order[np.argsort(codes[order], kind='mergesort')]
+        c, x = codes[order], col[order]
+        new = np.ones(len(order), bool)
+        new[1:] = (c[1:] != c[:-1]) | (x[1:] != x[:-1])
+        codes[order] = np.cumsum(new) - 1
+    return codes
+
+# reductions rec_groupby computes for all groups at once
+_rec_group_ufuncs = {np.sum:np.add, np.min:np.minimum, np.max:np.maximum}
+
+def _rec_group_stat(x, func, bounds):
+    """
+    Return the array of *func* of the groups *x[bounds[i]:bounds[i+1]]*
+    """
+    starts = bounds[:-1]
+    if func is len:
+        return np.diff(bounds)
+    if len(starts) and x.dtype.kind in 'biuf':
+        if func in _rec_group_ufuncs:
+            # accumulate in the type func would
+            dtype = func(x[:1]).dtype
+            return _rec_group_ufuncs[func].reduceat(x, starts, dtype=dtype)
+        if func is np.mean:
+            return (np.add.reduceat(x, starts, dtype=np.float_) /
+                    np.diff(bounds))
+    return np.array([func(x[i0:i1]) for i0, i1 in zip(starts, bounds[1:])])
 
 
 def rec_summarize(r, summaryfuncs):
@@ -1931,29 +2125,32 @@ def rec_join(key, r1, r2, jointype='inner', defaults=None, r1postfix='1', r2post
         if name not in r2.dtype.names:
             raise ValueError('r2 does not have key field %s'%name)
 
-    def makekey(row):
-        return tuple([row[name] for name in key])
-
-    r1d = dict([(makekey(row),i) for i,row in enumerate(r1)])
-    r2d = dict([(makekey(row),i) for i,row in enumerate(r2)])
-
-    r1keys = set(r1d.keys())
-    r2keys = set(r2d.keys())
-
-    common_keys = r1keys & r2keys
+    # number the keys of both arrays together, then look up each key
+    # of r1 among the sorted keys of r2
+    n1 = len(r1)
+    codes = _rec_key_codes([np.concatenate((r1[name], r2[name]))
+                            for name in key])
+    codes1, codes2 = codes[:n1], codes[n1:]
+    order2 = np.argsort(codes2, kind='mergesort')
+    sorted2 = codes2[order2]
+    pos = np.minimum(np.searchsorted(sorted2, codes1), max(len(r2)-1, 0))
+    if len(r2):
+        common = sorted2[pos] == codes1
+    else:
+        common = np.zeros(n1, bool)
 
-    r1ind = np.array([r1d[k] for k in common_keys])
-    r2ind = np.array([r2d[k] for k in common_keys])
+    r1ind = np.nonzero(common)[0]
+    r2ind = order2[pos[common]]
 
-    common_len = len(common_keys)
+    common_len = len(r1ind)
     left_len = right_len = 0
     if jointype == "outer" or jointype == "leftouter":
-        left_keys = r1keys.difference(r2keys)
-        left_ind = np.array([r1d[k] for k in left_keys])
+        left_ind = np.nonzero(~common)[0]
         left_len = len(left_ind)
     if jointype == "outer":
-        right_keys = r2keys.difference(r1keys)
-        right_ind = np.array([r2d[k] for k in right_keys])
+        unmatched = np.ones(len(r2), bool)
+        unmatched[r2ind] = False
+        right_ind = np.nonzero(unmatched)[0]
         right_len = len(right_ind)
 
     def key_desc(name):
@@ -1962,9 +2159,8 @@ def rec_join(key, r1, r2, jointype='inner', defaults=None, r1postfix='1', r2post
         if dt1.type != np.string_:
             return (name, dt1.descr[0][1])
 
-        dt2 = r1.dtype[name]
-        assert dt2==dt1
-        if dt1.num>dt2.num:
+        dt2 = r2.dtype[name]
+        if dt1.itemsize>dt2.itemsize:
             return (name, dt1.descr[0][1])
         else:
             return (name, dt2.descr[0][1])
@@ -2023,7 +2219,13 @@ def rec_join(key, r1, r2, jointype='inner', defaults=None, r1postfix='1', r2post
         if jointype == "outer" and right_len:
             newrec[newfield][-right_len:] = r2[field][right_ind]
 
-    newrec.sort(order=key)
+    # sort the rows by key
+    newcodes = [codes1[r1ind]]
+    if left_len:
+        newcodes.append(codes1[left_ind])
+    if right_len:
+        newcodes.append(codes2[right_ind])
+    newrec = newrec[np.argsort(np.concatenate(newcodes), kind='mergesort')]
 
     return newrec
 
@@ -2082,9 +2284,44 @@ def recs_join(key, name, recs, jointype='outer', missing=0., postfixes=None):
     return np.rec.fromrecords(results, names=names)
 
 
+def _csv2rec_names(headers):
+    """
+    Return the record array field names for the header row *headers*
+    of a CSV file.  The headers are lower cased, spaces are converted
+    to underscores, illegal attribute name characters are removed, and
+    repeated names are numbered.
+    """
+    # map column names that clash with builtins -- TODO - extend this list
+    itemd = {
+        'return' : 'return_',
+        'file' : 'file_',
+        'print' : 'print_',
+        }
+
+    # remove these chars
+    delete = set("""~!@#$%^&*()-=+~\|]}[{';: /?.>,<""")
+    delete.add('"')
+
+    names = []
+    seen = dict()
+    for i, item in enumerate(headers):
+        item = item.strip().lower().replace(' ', '_')
+        item = ''.join([c for c in item if c not in delete])
+        if not len(item):
+            item = 'column%d'%i
+
+        item = itemd.get(item, item)
+        cnt = seen.get(item, 0)
+        if cnt>0:
+            names.append(item + '_%d'%cnt)
+        else:
+            names.append(item)
+        seen[item] = cnt+1
+    return names
+
 def csv2rec(fname, comments='#', skiprows=0, checkrows=0, delimiter=',',
             converterd=None, names=None, missing='', missingd=None,
-            use_mrecords=False):
+            use_mrecords=False, chunksize=None, memmap=None):
     """
     Load data from comma/space/tab delimited file in *fname* into a
     numpy record array and return the record array.
@@ -2123,9 +2360,32 @@ def csv2rec(fname, comments='#', skiprows=0, checkrows=0, delimiter=',',
 
     - *use_mrecords*: if True, return an mrecords.fromrecords record array if any of the data are missing
 
+    - *chunksize*: if not *None*, read the file *chunksize* rows at a
+      time with :func:`csv2rec_chunks`, which converts whole columns
+      with numpy and is much faster for large files.  *checkrows* is
+      ignored, and *use_mrecords* is not supported.
+
+    - *memmap*: if not *None*, a filename to write the records to as
+      they are read, in chunks of *chunksize* rows (default 100000); a
+      record array memory-mapped from the file is returned.  This only
+      works if none of the columns hold dates or the results of
+      custom converters, which are Python objects.
+
       If no rows are found, *None* is returned -- see :file:`examples/loadrec.py`
     """
 
+    if chunksize is not None or memmap is not None:
+        if use_mrecords:
+            raise ValueError('use_mrecords is not supported when reading '
+                             'in chunks')
+        if chunksize is None:
+            chunksize = 100000
+        args = (fname, chunksize, comments, skiprows, delimiter,
+                converterd, names, missing, missingd)
+        if memmap is not None:
+            return _csv2rec_memmap(args, memmap)
+        return _csv2rec_concatenate(args)
+
     if converterd is None:
         converterd = dict()
 
@@ -2230,13 +2490,6 @@ def csv2rec(fname, comments='#', skiprows=0, checkrows=0, delimiter=',',
         else: return func
 
 
-    # map column names that clash with builtins -- TODO - extend this list
-    itemd = {
-        'return' : 'return_',
-        'file' : 'file_',
-        'print' : 'print_',
-        }
-
     def get_converters(reader):
 
         converters = None
@@ -2273,25 +2526,7 @@ def csv2rec(fname, comments='#', skiprows=0, checkrows=0, delimiter=',',
             headers = row
             break
 
-        # remove these chars
-        delete = set("""~!@#$%^&*()-=+~\|]}[{';: /?.>,<""")
-        delete.add('"')
-
-        names = []
-        seen = dict()
-        for i, item in enumerate(headers):
-            item = item.strip().lower().replace(' ', '_')
-            item = ''.join([c for c in item if c not in delete])
-            if not len(item):
-                item = 'column%d'%i
-
-            item = itemd.get(item, item)
-            cnt = seen.get(item, 0)
-            if cnt>0:
-                names.append(item + '_%d'%cnt)
-            else:
-                names.append(item)
-            seen[item] = cnt+1
+        names = _csv2rec_names(headers)
 
     else:
         if cbook.is_string_like(names):
@@ -2339,23 +2574,413 @@ def csv2rec(fname, comments='#', skiprows=0, checkrows=0, delimiter=',',
         r = np.rec.fromrecords(rows, names=names)
     return r
 
+#The kinds of column csv2rec_chunks converts to, in the order that they
+#are promoted in when a value does not convert to the current kind.
+_csv_kinds = ['bool', 'int', 'float', 'date', 'datetime', 'str']
+
+def _csv_convert(kind, col, miss, converter=None):
+    """
+    Convert the string array *col* to a column of *kind*, filling in the
+    values flagged in the bool array *miss* as :func:`csv2rec` does;
+    raise ValueError if any other value does not convert.  Columns with
+    a *converter* function convert one value at a time.
+    """
+    if converter is not None:
+        values = []
+        for v, m in zip(col.tolist(), miss.tolist()):
+            if m:
+                values.append(None)
+            else:
+                values.append(converter(v))
+        return np.array(values)
+    if kind == 'bool':
+        istrue = col == 'True'
+        if not (istrue | (col == 'False') | miss).all():
+            raise ValueError('invalid bool')
+        return istrue
+    if kind == 'int':
+        return np.where(miss, '-1', col).astype(np.int_)
+    if kind == 'float':
+        return np.where(miss, 'nan', col).astype(np.float_)
+    if kind == 'str':
+        col = col.copy()
+        col[miss] = ''
+        return col
+
+    # parse each distinct date string once
+    import dateutil.parser
+    import datetime
+    parsed = {}
+    for v in set(col[~miss].tolist()):
+        d = dateutil.parser.parse(v)
+        if kind == 'date':
+            if d.hour>0 or d.minute>0 or d.second>0:
+                raise ValueError('not a date')
+            d = d.date()
+        parsed[v] = d
+    parsed[None] = datetime.date(1,1,1)
+    col = np.asarray(col, object)
+    col[miss] = None
+    result = np.empty(len(col), object)
+    result[:] = [parsed[v] for v in col.tolist()]
+    return result
+
+def _csv_merge_dtypes(a, b):
+    """
+    Return a dtype that columns of dtype *a* and of dtype *b* can both
+    be cast to.
+    """
+    if a == b:
+        return a
+    if a.kind == 'S' and b.kind == 'S':
+        if a.itemsize >= b.itemsize:
+            return a
+        return b
+    if a.kind in 'bif' and b.kind in 'bif':
+        return np.find_common_type([a, b], [])
+    return np.dtype(object)
+
+def _csv2rec_chunks(fname, chunksize=100000, comments='#', skiprows=0,
+                    delimiter=',', converterd=None, names=None, missing='',
+                    missingd=None, kinds=None, state=None, close=True):
+    # The body of csv2rec_chunks.  If given, kinds is a list of the
+    # column kinds to start from, and the dict state is updated with
+    # the final kinds, with whether any column was promoted to a kind
+    # which earlier chunks could not be cast to, and with the rows of
+    # the missing values of each chunk which a later promotion must
+    # fill in again.  The file handle is closed at the end if close.
+    if converterd is None:
+        converterd = {}
+    if missingd is None:
+        missingd = {}
+    if state is None:
+        state = {}
+    state['restart'] = False
+
+    fh = cbook.to_filehandle(fname)
+    lines = fh
+    if delimiter==' ':
+        # treat runs of spaces as a single separator, as csv2rec does
+        lines = (' '.join(line.split()) for line in fh)
+    reader = csv.reader(lines, delimiter=delimiter)
+    for i in range(skiprows):
+        for row in reader:
+            break
+
+    if names is None:
+        for row in reader:
+            if len(row) and row[0].startswith(comments):
+                continue
+            names = _csv2rec_names(row)
+            break
+        else:
+            if close:
+                fh.close()
+            return
+    elif cbook.is_string_like(names):
+        names = [n.strip() for n in names.split(',')]
+    numCols = len(names)
+
+    converters = []
+    for j, name in enumerate(names):
+        func = converterd.get(j)
+        if func is None:
+            func = converterd.get(name)
+        converters.append(func)
+    if kinds is None:
+        kinds = ['bool']*numCols
+    kinds = list(kinds)
+    state['kinds'] = kinds
+    dtypes = [None]*numCols
+
+    while 1:
+        rows = []
+        for row in reader:
+            if not len(row) or row[0].startswith(comments):
+                continue
+            if len(row) != numCols:
+                row = (row + ['']*numCols)[:numCols]
+            rows.append(row)
+            if len(rows) == chunksize:
+                break
+        if not len(rows):
+            break
+
+        columns = []
+        missingrows = []
+        for j, col in enumerate(zip(*rows)):
+            col = np.array(col)
+            if col.dtype.kind != 'S':
+                # eg an empty string array in numpy < 1.2
+                col = col.astype('S1')
+            name = names[j]
+            miss = col == ''
+            if missing:
+                miss |= col == missing
+            if missingd.get(name) is not None:
+                miss |= col == missingd[name]
+            while converters[j] is None:
+                try:
+                    col = _csv_convert(kinds[j], col, miss)
+                except (ValueError, OverflowError):
+                    if kinds[j] == 'str':
+                        raise
+                    kind = _csv_kinds[_csv_kinds.index(kinds[j])+1]
+                    if dtypes[j] is not None and kind not in ('int', 'float'):
+                        # earlier chunks cannot be cast to this one
+                        state['restart'] = True
+                        dtypes[j] = None
+                    kinds[j] = kind
+                else:
+                    break
+            else:
+                col = _csv_convert(None, col, miss, converters[j])
+            if converters[j] is None and col.dtype.kind in 'bi':
+                missingrows.append(np.nonzero(miss)[0])
+            else:
+                missingrows.append(None)
+            if dtypes[j] is None:
+                dtypes[j] = col.dtype
+            else:
+                dtypes[j] = _csv_merge_dtypes(dtypes[j], col.dtype)
+            columns.append(col)
+
+        dtype = np.dtype(zip(names, dtypes))
+        r = np.empty(len(rows), dtype)
+        for name, col in zip(names, columns):
+            r[name] = col
+        state['missing'] = missingrows
+        yield r.view(np.recarray)
+    if close:
+        fh.close()
+
+def csv2rec_chunks(fname, chunksize=100000, comments='#', skiprows=0,
+                   delimiter=',', converterd=None, names=None, missing='',
+                   missingd=None):
+    """
+    Load data from comma/space/tab delimited file in *fname* into
+    numpy record arrays of up to *chunksize* rows, as :func:`csv2rec`
+    does.  This is a generator yielding the record array of each chunk
+    in turn, so only one chunk of the file need be in memory at once.
+
+    The arguments are as for :func:`csv2rec`.  Rather than converting
+    one value at a time, the columns of a chunk are converted with
+    numpy in bulk, to the first of bool, int, float, date, datetime
+    and str that all of their values convert to, starting from the
+    kind of the column in the last chunk; so the first chunk is the
+    sample the kinds are inferred from.  Bool, int and float columns
+    of a chunk can be cast to the numeric kind of a later one, and the
+    widths of string columns only grow.  A column which becomes dates,
+    datetimes or strings in a later chunk cannot be cast, and
+    :func:`csv2rec` with a *chunksize* reads the file again in that
+    case; a file handle which cannot seek is first copied to a
+    temporary file.  When casting, it fills in missing values as the
+    new kind.
+
+    Missing values are filled in as by :func:`csv2rec`, with False for
+    bools.  Columns with a converter in *converterd* are converted one
+    value at a time, as a missing value is converted to None.
+
+    If no rows are found, nothing is yielded.
+    """
+    return _csv2rec_chunks(fname, chunksize, comments, skiprows, delimiter,
+                           converterd, names, missing, missingd)
+
+# the values csv2rec fills in for missing values, by dtype kind
+_csv_fills = {'b':False, 'i':-1, 'f':np.nan, 'S':''}
+
+def _csv_fill_missing(r, dtype, missing):
+    """
+    Fill in again the missing values of the record array *r*, which
+    was cast from *dtype*; *missing* is the list of the rows of the
+    missing values of each field, or of *None*.
+    """
+    for name, rows in zip(r.dtype.names, missing):
+        newdtype = r.dtype[name]
+        if (rows is not None and len(rows) and dtype[name] != newdtype
+            and newdtype.kind in _csv_fills):
+            r[name][rows] = _csv_fills[newdtype.kind]
+
+def _csv2rec_source(fname):
+    """
+    Return a filename or file handle to read *fname* from, and the
+    position to seek the handle back to in order to read it again, or
+    *None* for a filename.  Handles which cannot seek are copied to a
+    temporary file.
+    """
+    if cbook.is_string_like(fname):
+        return fname, None
+    try:
+        return fname, fname.tell()
+    except (AttributeError, IOError):
+        import tempfile
+        fh = tempfile.TemporaryFile()
+        for line in fname:
+            fh.write(line)
+        fname.close()
+        fh.seek(0)
+        return fh, 0
+
+def _csv2rec_passes(args, func):
+    """
+    Call ``func(chunks, state)`` with the chunks of
+    ``_csv2rec_chunks(*args)`` and the state they update, and again
+    with the file read from the start with the final kinds for as long
+    as a column is promoted to a kind earlier chunks cannot be cast
+    to; *func* should stop iterating as soon as *state['restart']* is
+    set.  The kinds only move forward, so this ends.  Return the
+    result of the last call.
+    """
+    fh, start = _csv2rec_source(args[0])
+    args = (fh,) + tuple(args[1:])
+    close = start is None
+    kinds = None
+    while 1:
+        state = {}
+        result = func(_csv2rec_chunks(*args, **dict(kinds=kinds, state=state,
+                                                    close=close)),
+                      state)
+        if not state['restart']:
+            break
+        if not close:
+            fh.seek(start)
+        kinds = state['kinds']
+    if not close:
+        fh.close()
+    return result
+
+def _csv2rec_concatenate(args):
+    """
+    Return the record array of all of the chunks of
+    ``_csv2rec_chunks(*args)`` cast to the dtype of the last one, or
+    *None* if there are none.
+    """
+    def collect(chunks, state):
+        result = []
+        for chunk in chunks:
+            if state['restart']:
+                break
+            result.append((chunk, state['missing']))
+        return result
+
+    chunks = _csv2rec_passes(args, collect)
+    if not len(chunks):
+        return None
+    dtype = chunks[-1][0].dtype
+    r = np.empty(sum([len(chunk) for chunk, missing in chunks]), dtype)
+    i = 0
+    for chunk, missing in chunks:
+        part = chunk.astype(dtype)
+        _csv_fill_missing(part, chunk.dtype, missing)
+        r[i:i+len(chunk)] = part
+        i += len(chunk)
+    return r.view(np.recarray)
+
+def _csv2rec_memmap(args, filename):
+    """
+    Write the records of all of the chunks of ``_csv2rec_chunks(*args)``
+    to *filename* and return a record array memory-mapped from it, or
+    *None* if there are none.
+    """
+    def write(chunks, state):
+        # the dtype and number of records written, rewriting those
+        # already written whenever the dtype of a chunk changes
+        dtype = None
+        n = 0
+        missing = None
+        fd = open(filename, 'wb')
+        for chunk in chunks:
+            if state['restart']:
+                break
+            if chunk.dtype.hasobject:
+                fd.close()
+                raise ValueError('cannot memory-map columns of dates or '
+                                 'custom conversions')
+            if dtype is None:
+                dtype = chunk.dtype
+                missing = [[] for name in dtype.names]
+            elif chunk.dtype != dtype:
+                fd.close()
+                allrows = []
+                for rows in missing:
+                    if len(rows):
+                        allrows.append(np.concatenate(rows))
+                    else:
+                        allrows.append(None)
+                _recast_memmap(filename, dtype, chunk.dtype, n, allrows)
+                dtype = chunk.dtype
+                fd = open(filename, 'ab')
+            chunk.tofile(fd)
+            for rows, chunkrows in zip(missing, state['missing']):
+                if chunkrows is not None and len(chunkrows):
+                    rows.append(chunkrows + n)
+            n += len(chunk)
+        fd.close()
+        return dtype, n
+
+    dtype, n = _csv2rec_passes(args, write)
+    if not n:
+        return None
+    return np.memmap(filename, dtype, 'r+', shape=(n,)).view(np.recarray)
+
+def _recast_memmap(filename, dtype, newdtype, n, missing):
+    """
+    Rewrite the *n* records of *dtype* in the file *filename* as records
+    of *newdtype*, filling in the missing values in the rows listed in
+    *missing* for each field again.
+    """
+    old = np.memmap(filename, dtype, 'r', shape=(n,))
+    tmpname = filename + '.tmp'
+    fd = open(tmpname, 'wb')
+    for i in range(0, n, 100000):
+        old[i:i+100000].astype(newdtype).tofile(fd)
+    fd.close()
+    del old
+    os.remove(filename)
+    os.rename(tmpname, filename)
+    new = np.memmap(filename, newdtype, 'r+', shape=(n,))
+    _csv_fill_missing(new, dtype, missing)
+    new.flush()
+    del new
+
 
 # a series of classes for describing the format intentions of various rec views
 class FormatObj:
     def tostr(self, x):
         return self.toval(x)
 
+    def tostr_column(self, x):
+        """
+        Return the list of :meth:`tostr` of each value in the array
+        *x*; derived classes convert whole columns at once where they
+        can.
+        """
+        return map(self.tostr, x)
+
     def toval(self, x):
         return str(x)
 
     def fromstr(self, s):
         return s
 
+# characters repr escapes in a string
+_repr_escaped = re.compile(r'[^\x20-\x7e]|\\')
+
 class FormatString(FormatObj):
     def tostr(self, x):
         val = repr(x)
         return val[1:-1]
 
+    def tostr_column(self, x):
+        if x.dtype.kind!='S' or cbook.overrides(self, FormatString, 'tostr'):
+            return FormatObj.tostr_column(self, x)
+        vals = x.tolist()
+        # strings which repr would escape are done one at a time
+        text = ''.join(vals)
+        if _repr_escaped.search(text) or ("'" in text and '"' in text):
+            return FormatObj.tostr_column(self, x)
+        return vals
+
 #class FormatString(FormatObj):
 #    def tostr(self, x):
 #        return '"%r"'%self.toval(x)
@@ -2384,6 +3009,12 @@ class FormatFloat(FormatFormatStr):
             x = x * self.scale
         return x
 
+    def tostr_column(self, x):
+        if (x.dtype.kind not in 'biuf' or
+            cbook.overrides(self, FormatFloat, 'tostr', 'toval')):
+            return FormatObj.tostr_column(self, x)
+        return map(self.fmt.__mod__, (x * self.scale).tolist())
+
     def fromstr(self, s):
         return float(s)/self.scale
 
@@ -2393,6 +3024,11 @@ class FormatInt(FormatObj):
     def tostr(self, x):
         return '%d'%int(x)
 
+    def tostr_column(self, x):
+        if x.dtype.kind not in 'biu' or cbook.overrides(self, FormatInt, 'tostr'):
+            return FormatObj.tostr_column(self, x)
+        return map('%d'.__mod__, x.tolist())
+
     def toval(self, x):
         return int(x)
 
@@ -2405,6 +3041,12 @@ class FormatBool(FormatObj):
     def toval(self, x):
         return str(x)
 
+    def tostr_column(self, x):
+        if (x.dtype.kind!='b' or
+            cbook.overrides(self, FormatBool, 'tostr', 'toval')):
+            return FormatObj.tostr_column(self, x)
+        return map(str, x.tolist())
+
     def fromstr(self, s):
         return bool(s)
 
@@ -2430,6 +3072,12 @@ class FormatDate(FormatObj):
         if x is None: return 'None'
         return x.strftime(self.fmt)
 
+    def tostr_column(self, x):
+        # format each distinct date once
+        vals = x.tolist()
+        strs = dict([(val, self.tostr(val)) for val in set(vals)])
+        return map(strs.__getitem__, vals)
+
     def fromstr(self, x):
         import dateutil.parser
         return dateutil.parser.parse(x).date()
@@ -2526,7 +3174,7 @@ def rec2txt(r, header=None, padding=3, precision=3, fields=None):
             return 0, length+padding, "%s" # left justify
 
         if ntype==np.int or ntype==np.int16 or ntype==np.int32 or ntype==np.int64 or ntype==np.int8 or ntype==np.int_:
-            length = max(len(colname),np.max(map(len,map(str,column))))
+            length = max(len(colname),np.max(map(len,map(str,column.tolist()))))
             return 1, length+padding, "%d" # right justify
 
         # JDH: my powerbook does not have np.float96 using np 1.3.0
@@ -2543,7 +3191,7 @@ def rec2txt(r, header=None, padding=3, precision=3, fields=None):
         """
         if ntype==np.float or ntype==np.float32 or ntype==np.float64 or (hasattr(np, 'float96') and (ntype==np.float96)) or ntype==np.float_:
             fmt = "%." + str(precision) + "f"
-            length = max(len(colname),np.max(map(len,map(lambda x:fmt%x,column))))
+            length = max(len(colname),np.max(map(len,map(fmt.__mod__,column.tolist()))))
             return 1, length+padding, fmt   # right justify
 
         return 0, max(len(colname),np.max(map(len,map(str,column))))+padding, "%s"
@@ -2579,18 +3227,33 @@ def rec2txt(r, header=None, padding=3, precision=3, fields=None):
 
             return item.rjust(pad)
 
+    def format_column(column, just_pad_prec_spacer):
+        # format a whole column as format does each item
+        just, pad, prec, spacer = just_pad_prec_spacer
+        if just == 0:
+            if column.dtype.kind == 'S':
+                column = column.tolist()
+            return map((spacer*' ' + '%%-%ds'%pad).__mod__, map(str, column))
+        if prec == "%d":
+            return map(('%%%dd'%pad).__mod__, column.tolist())
+        return map(('%%%d'%pad + prec[1:]).__mod__, column.tolist())
+
     textl = []
     textl.append(''.join([format(colitem,justify_pad_prec_spacer[j]) for j, colitem in enumerate(header)]))
-    for i, row in enumerate(r):
-        textl.append(''.join([format(colitem,justify_pad_prec_spacer[j]) for j, colitem in enumerate(row)]))
-        if i==0:
-            textl[0] = textl[0].rstrip()
+    columns = [format_column(r[colname], justify_pad_prec_spacer[j])
+               for j, colname in enumerate(r.dtype.names)]
+    textl.extend(map(''.join, zip(*columns)))
+    if len(r):
+        textl[0] = textl[0].rstrip()
 
     text = os.linesep.join(textl)
     return text
 
 
 
+#The number of rows rec2csv formats and writes at once.
+_rec2csv_block_size = 10000
+
 def rec2csv(r, fname, delimiter=',', formatd=None, missing='',
             missingd=None, withheader=True):
     """
@@ -2618,21 +3281,13 @@ def rec2csv(r, fname, delimiter=',', formatd=None, missing='',
     if missingd is None:
         missingd = dict()
 
-    def with_mask(func):
-        def newfunc(val, mask, mval):
-            if mask:
-                return mval
-            else:
-                return func(val)
-        return newfunc
-
     if r.ndim != 1:
         raise ValueError('rec2csv only operates on 1 dimensional recarrays')
 
     formatd = get_formatd(r, formatd)
-    funcs = []
+    formats = []
     for i, name in enumerate(r.dtype.names):
-        funcs.append(with_mask(csvformat_factory(formatd[name]).tostr))
+        formats.append(csvformat_factory(formatd[name]))
 
     fh, opened = cbook.to_filehandle(fname, 'wb', return_opened=True)
     writer = csv.writer(fh, delimiter=delimiter)
@@ -2650,13 +3305,33 @@ def rec2csv(r, fname, delimiter=',', formatd=None, missing='',
         row = r[0]
         ismasked = hasattr(row, '_fieldmask')
 
-    for row in r:
-        if ismasked:
-            row, rowmask = row.item(), row._fieldmask.item()
+    # fields the csv writer would quote
+    quoted = re.compile('[%s"\r\n]'%re.escape(delimiter))
+
+    # format the rows a block at a time, a column at a time
+    for start in range(0, len(r), _rec2csv_block_size):
+        block = r[start:start+_rec2csv_block_size]
+        columns = []
+        for format, name, mval in zip(formats, header, mvals):
+            x = block[name]
+            if ismasked:
+                mask = np.ma.getmaskarray(x)
+                x = np.ma.getdata(x)
+            strs = format.tostr_column(x)
+            if ismasked:
+                for i in np.nonzero(mask)[0]:
+                    strs[i] = mval
+            columns.append(strs)
+        rows = zip(*columns)
+        try:
+            text = ''.join(map(''.join, columns))
+        except TypeError:
+            # a format or missing value is not a string
+            text = None
+        if len(columns)>1 and text is not None and not quoted.search(text):
+            fh.write('\r\n'.join(map(delimiter.join, rows)) + '\r\n')
         else:
-            rowmask = [False] * len(row)
-        writer.writerow([func(val, mask, mval) for func, val, mask, mval
-                         in zip(funcs, row, rowmask, mvals)])
+            writer.writerows(rows)
     if opened:
         fh.close()
 
@@ -2694,6 +3369,12 @@ def griddata(x,y,z,xi,yi,interp='nn'):
     :mod:`matplotlib.delaunay` package is used - :mod:`mpl_tookits.natgrid`
     only provides natural neighbor interpolation.
 
+    The :mod:`matplotlib.delaunay` triangulation of the last set of
+    (*x*, *y*) points is kept, so calling :func:`griddata` again with
+    the same points and new *z* values does not triangulate them again.
+    To interpolate many sets of *z* values onto the same grid, a
+    :class:`GridInterpolator` is faster still.
+
     The natgrid matplotlib toolkit can be downloaded from
     http://sourceforge.net/project/showfiles.php?group_id=80706&package_id=142792
     """
@@ -2719,7 +3400,7 @@ def griddata(x,y,z,xi,yi,interp='nn'):
     # remove masked points.
     if hasattr(z,'mask'):
         # make sure mask is not a scalar boolean array.
-        if a.mask.ndim:
+        if z.mask.ndim:
             x = x.compress(z.mask == False)
             y = y.compress(z.mask == False)
             z = z.compressed()
@@ -2752,7 +3433,7 @@ def griddata(x,y,z,xi,yi,interp='nn'):
         if xi.ndim == 1:
             xi,yi = np.meshgrid(xi,yi)
         # triangulate data
-        tri = delaunay.Triangulation(x,y)
+        tri = _griddata_triangulation(x,y)
         # interpolate data
         if interp == 'nn':
             interp = tri.nn_interpolator(z)
@@ -2779,6 +3460,84 @@ def griddata(x,y,z,xi,yi,interp='nn'):
     return zo
 griddata._reported = False
 
+def _griddata_triangulation(x, y):
+    """
+    Return the :class:`matplotlib.delaunay.Triangulation` of the points
+    (*x*, *y*), reusing the last one made if it was of the same points.
+    """
+    import matplotlib.delaunay as delaunay
+    x = np.asarray(x, np.float_)
+    y = np.asarray(y, np.float_)
+    cached = _griddata_triangulation.cache
+    if (cached is not None and np.array_equal(cached[0], x)
+        and np.array_equal(cached[1], y)):
+        return cached[2]
+    tri = delaunay.Triangulation(x, y)
+    _griddata_triangulation.cache = x.copy(), y.copy(), tri
+    return tri
+_griddata_triangulation.cache = None
+
+class GridInterpolator:
+    """
+    ``interp = GridInterpolator(x, y, xi, yi)`` makes an object to
+    interpolate any number of sets of values at the nonuniformly
+    spaced points (*x*, *y*) onto the grid (*xi*, *yi*), as
+    :func:`griddata` does; ``zi = interp(z)`` gives the same result
+    as ``griddata(x, y, z, xi, yi)``.
+
+    The points are triangulated, and the weights that each grid point
+    gives the values at nearby points are found, only once, when the
+    interpolator is made; the weights are found in several threads,
+    one per CPU unless *nthreads* is given.  Each call then only has
+    to form the weighted sums, which is much faster than
+    :func:`griddata` when the grid is large.
+
+    *interp* is '`nn`' (default) for natural neighbor interpolation,
+    or '`linear`' for linear interpolation; unlike :func:`griddata`,
+    linear interpolation works for any grid, not only one with
+    constant spacing.  The interpolation is always done with the
+    :mod:`matplotlib.delaunay` package, even if the
+    :mod:`mpl_toolkits.natgrid` toolkit is installed.
+
+    A masked array is returned if any grid points are outside convex
+    hull defined by input data.  If *z* is a masked array with some
+    values masked, the remaining points must be triangulated again,
+    so the call falls back to :func:`griddata`.
+    """
+    def __init__(self, x, y, xi, yi, interp='nn', nthreads=None):
+        import matplotlib.delaunay as delaunay
+        xi = np.asarray(xi)
+        yi = np.asarray(yi)
+        if xi.ndim != yi.ndim:
+            raise TypeError("inputs xi and yi must have same number of dimensions (1 or 2)")
+        if xi.ndim != 1 and xi.ndim != 2:
+            raise TypeError("inputs xi and yi must be 1D or 2D.")
+        if not len(x)==len(y):
+            raise TypeError("inputs x,y must be 1D arrays of the same length")
+        if interp not in ('nn', 'linear'):
+            raise ValueError("interp keyword must be one of"
+            " 'linear' (for linear interpolation) or 'nn'"
+            " (for natural neighbor interpolation). Default is 'nn'.")
+        self.x, self.y = x, y
+        self.xi, self.yi = xi, yi
+        self.interp = interp
+        if xi.ndim == 1:
+            xi,yi = np.meshgrid(xi,yi)
+        self.triangulation = _griddata_triangulation(x, y)
+        self._interpolator = delaunay.PointInterpolator(
+            self.triangulation, xi, yi, interp, nthreads)
+
+    def __call__(self, z):
+        if len(z) != len(self.x):
+            raise TypeError("input z must be the same length as x and y")
+        if np.ma.getmask(z) is not np.ma.nomask and np.ma.getmask(z).any():
+            return griddata(self.x, self.y, z, self.xi, self.yi, self.interp)
+        zo = self._interpolator(np.ma.getdata(z))
+        # mask points on grid outside convex hull of input data.
+        if np.any(np.isnan(zo)):
+            zo = np.ma.masked_where(np.isnan(zo),zo)
+        return zo
+
 ##################################################
 # Linear interpolation algorithms
 ##################################################
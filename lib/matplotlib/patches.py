@@ -49,6 +49,11 @@ class Patch(artist.Artist):
     are *None*, they default to their rc params setting.
     """
     zorder = 1
+    # the path with the non-affine part of the transform applied, and
+    # a copy of the vertices it was made from; see _get_transformed_path
+    _transformed_path = None
+    _transformed_vertices = None
+
     def __str__(self):
         return str(self.__class__).split('.')[-1]
 
@@ -399,10 +404,7 @@ class Patch(artist.Artist):
         if self._hatch:
             gc.set_hatch(self._hatch )
 
-        path = self.get_path()
-        transform = self.get_transform()
-        tpath = transform.transform_path_non_affine(path)
-        affine = transform.get_affine()
+        tpath, affine = self._get_transformed_path()
 
         if self.get_path_effects():
             for path_effect in self.get_path_effects():
@@ -419,6 +421,31 @@ class Patch(artist.Artist):
         """
         raise NotImplementedError('Derived must override')
 
+    def _get_transformed_path(self):
+        """
+        Return the path with the non-affine part of the transform
+        applied, and the affine part of the transform.
+
+        For non-affine transforms, e.g., on log or geo axes, the
+        transformed path is kept until the path, its vertices or the
+        non-affine part of the transform change.
+        """
+        path = self.get_path()
+        transform = self.get_transform()
+        if transform.is_affine:
+            return (transform.transform_path_non_affine(path),
+                    transform.get_affine())
+
+        tpath = self._transformed_path
+        # spines and others move the vertices of their path in place
+        if (tpath is None or tpath._path is not path
+            or tpath._transform is not transform
+            or not np.array_equal(self._transformed_vertices, path.vertices)):
+            tpath = transforms.TransformedPath(path, transform)
+            self._transformed_path = tpath
+            self._transformed_vertices = path.vertices.copy()
+        return tpath.get_transformed_path_and_affine()
+
     def get_window_extent(self, renderer=None):
         return self.get_path().get_extents(self.get_transform())
 
@@ -80,6 +80,11 @@ class Path(object):
 
     code_type = np.uint8
 
+    # Many small paths are made while drawing, so they do without an
+    # instance dictionary.
+    __slots__ = ('vertices', 'codes', 'should_simplify', 'simplify_threshold',
+                 'has_nonfinite', '_interpolation_steps', '__weakref__')
+
     def __init__(self, vertices, codes=None, _interpolation_steps=1):
         """
         Create a new path with the given vertices and codes.
@@ -130,6 +135,32 @@ class Path(object):
         self.vertices = vertices
         self._interpolation_steps = _interpolation_steps
 
+    @classmethod
+    def _fast_from_codes_and_verts(cls, verts, codes, internals=None):
+        """
+        Create a Path from float *verts* and *codes* without checking,
+        copying or scanning them.  *internals* is a dictionary with the
+        *should_simplify*, *has_nonfinite* and *interpolation_steps*
+        attributes which the constructor would otherwise compute.
+        This is for callers which already know them, e.g., because
+        the vertices extend or transform those of another path.  If
+        *internals* is None, the path is taken to be finite and not
+        to need simplifying, as for the unit paths.
+        """
+        pth = cls.__new__(cls)
+        pth.vertices = verts
+        pth.codes = codes
+        pth.simplify_threshold = rcParams['path.simplify_threshold']
+        if internals is None:
+            pth.should_simplify = False
+            pth.has_nonfinite = False
+            pth._interpolation_steps = 1
+        else:
+            pth.should_simplify = internals['should_simplify']
+            pth.has_nonfinite = internals['has_nonfinite']
+            pth._interpolation_steps = internals['interpolation_steps']
+        return pth
+
     @classmethod
     def make_compound_path_from_polys(cls, XY):
         """
@@ -262,6 +293,12 @@ class Path(object):
                 transformed result and automatically update when the
                 transform changes.
         """
+        if transform.is_affine:
+            return Path._fast_from_codes_and_verts(
+                transform.transform(self.vertices), self.codes,
+                {'should_simplify': self.should_simplify,
+                 'has_nonfinite': self.has_nonfinite,
+                 'interpolation_steps': self._interpolation_steps})
         return Path(transform.transform(self.vertices), self.codes,
                     self._interpolation_steps)
 
@@ -347,6 +384,102 @@ class Path(object):
             new_codes = None
         return Path(vertices, new_codes)
 
+    def interpolated_transformed(self, transform, steps, tolerance=1e-4):
+        """
+        Returns a new path with the vertices mapped by *transform*, a
+        function of an Nx2 array of vertices, where each straight
+        segment is subdivided into up to *steps* pieces so that it
+        follows its curved image.
+
+        Unlike :meth:`interpolated`, the subdivision is adaptive: a
+        piece of a segment is only halved while the image of its
+        midpoint lies further than *tolerance* times the size of the
+        transformed path from the middle of its chord, so nearly
+        straight parts and short segments, e.g., of dense data, get
+        no extra vertices.  Does not subdivide curves.
+        """
+        vertices = self.vertices
+        codes = self.codes
+        tvertices = np.asarray(transform(vertices), np.float_)
+        depth = int(math.log(max(steps, 1), 2))
+        if depth == 0 or len(vertices) < 2:
+            return Path(tvertices, codes)
+
+        # the segments which are drawn as straight lines
+        if codes is None:
+            seg = np.arange(len(vertices) - 1)
+        else:
+            seg = np.nonzero((codes[1:] == self.LINETO) |
+                             (codes[1:] == self.CLOSEPOLY))[0]
+        # each piece is a parameter interval [t0, t1] of segment seg,
+        # with the images p0 and p1 of its ends
+        t0 = np.zeros(len(seg))
+        t1 = np.ones(len(seg))
+        p0 = tvertices[seg]
+        p1 = tvertices[seg + 1]
+        tol = None
+        new_seg, new_t, new_points = [], [], []
+        for level in range(depth):
+            if not len(seg):
+                break
+            t = (t0 + t1) / 2.0
+            start = vertices[seg]
+            delta = vertices[seg + 1] - start
+            points = start + delta * t[:, np.newaxis]
+            points = np.asarray(transform(points), np.float_)
+            quarters = []
+            if level == 0:
+                # the images of whole segments which come back to their
+                # chord at the midpoint, e.g., a great circle through
+                # the antipode of the centre, are caught at the quarters
+                for q in (0.25, 0.75):
+                    quarters.append((q, np.asarray(
+                        transform(start + delta * q), np.float_)))
+            if tol is None:
+                # the size of the path, including the midpoints of
+                # segments which are closed loops in the image
+                finite = np.concatenate(
+                    [tvertices, points] + [qp for q, qp in quarters])
+                finite = finite[np.isfinite(finite).all(1)]
+                if not len(finite):
+                    break
+                tol = tolerance * (finite.max(0) - finite.min(0)).max()
+            error = points - (p0 + p1) / 2.0
+            error = np.hypot(error[:, 0], error[:, 1])
+            for q, qpoints in quarters:
+                qerror = qpoints - (p0 + (p1 - p0) * q)
+                qerror = np.hypot(qerror[:, 0], qerror[:, 1])
+                qerror = np.where(np.isfinite(qerror), qerror, 0)
+                error = np.maximum(error, qerror)
+            # pieces with non-finite ends are never split
+            split = np.isfinite(error)
+            split[split] = error[split] > tol
+            seg, t0, t, t1 = seg[split], t0[split], t[split], t1[split]
+            p0, points, p1 = p0[split], points[split], p1[split]
+            new_seg.append(seg)
+            new_t.append(t)
+            new_points.append(points)
+            # both halves of the split pieces are checked again
+            seg = np.concatenate((seg, seg))
+            t0, t1 = np.concatenate((t0, t)), np.concatenate((t, t1))
+            p0, p1 = (np.concatenate((p0, points)),
+                      np.concatenate((points, p1)))
+
+        if not len(new_seg) or not sum([len(x) for x in new_seg]):
+            return Path(tvertices, codes)
+
+        # merge the new vertices in after the start of their segments
+        n = len(vertices)
+        key_seg = np.concatenate([np.arange(n)] + new_seg)
+        key_t = np.concatenate([np.zeros(n)] + new_t)
+        order = np.lexsort((key_t, key_seg))
+        tvertices = np.concatenate([tvertices] + new_points)[order]
+        if codes is not None:
+            count = len(key_seg) - n
+            codes = np.concatenate(
+                (codes, self.LINETO * np.ones(count, self.code_type)))[order]
+        return Path(tvertices, codes)
+
     def to_polygons(self, transform=None, width=0, height=0):
         """
         Convert this path to a list of polygons.  Each polygon is an
@@ -445,7 +578,7 @@ class Path(object):
             codes[-1] = cls.CLOSEPOLY
             path = cls(verts, codes)
             if numVertices <= 16:
-                cls._unit_regular_polygons[(numVertices, innerCircle)] = path
+                cls._unit_regular_stars[(numVertices, innerCircle)] = path
         return path
 
     @classmethod
@@ -644,7 +777,7 @@ class Path(object):
         vertices[vertex_offset+2:end:3, 0] = xB
         vertices[vertex_offset+2:end:3, 1] = yB
 
-        return cls(vertices, codes)
+        return cls._fast_from_codes_and_verts(vertices, codes)
 
     @classmethod
     def wedge(cls, theta1, theta2, n=None):
@@ -680,11 +813,172 @@ class Path(object):
         cls._hatch_dict[(hatchpattern, density)] = hatch_path
         return hatch_path
 
+class PackedPaths(object):
+    """
+    :class:`PackedPaths` is a sequence of :class:`Path` objects stored
+    in three numpy arrays instead of one :class:`Path` per item:
+      - *vertices*: an Nx2 float array of the vertices of all paths
+      - *codes*: an N-length uint8 array of vertex types, or None if
+        every path is a series of line segments
+      - *starts*: an (M+1)-length integer array; path *i* is made of
+        the vertices ``starts[i]:starts[i+1]``
+
+    It can be used wherever a collection takes a sequence of paths.
+    The Agg backend, :func:`get_path_collection_extents` and
+    :func:`point_in_path_collection` read the arrays directly; other
+    consumers index or iterate it, which makes a :class:`Path` that
+    shares the arrays for each item.  As for :class:`Path`, the
+    arrays should be treated as immutable.
+    """
+
+    def __init__(self, vertices, codes, starts):
+        """
+        Create a new set of paths from the *vertices*, *codes* and
+        *starts* arrays described above.
+        """
+        vertices = np.asarray(vertices, np.float_)
+        starts = np.asarray(starts, np.intp)
+        assert vertices.ndim == 2
+        assert vertices.shape[1] == 2
+        assert starts.ndim == 1 and len(starts)
+        assert starts[0] >= 0 and starts[-1] <= len(vertices)
+        if codes is not None:
+            codes = np.asarray(codes, Path.code_type)
+            assert codes.shape == (len(vertices),)
+
+        self.vertices = vertices
+        self.codes = codes
+        self.starts = starts
+        # collections are never simplified
+        self.should_simplify = False
+        self.simplify_threshold = rcParams['path.simplify_threshold']
+
+    @classmethod
+    def from_polygons(cls, verts, closed=True):
+        """
+        Pack a sequence of polygons, as taken by
+        :class:`~matplotlib.collections.PolyCollection`.  *verts* is
+        a sequence of Nx2 arrays or sequences of *xy* pairs, or a
+        (numpolys x numsides x 2) array, possibly masked; masked
+        vertices become NaNs.
+
+        If *closed* is *True*, each polygon is explicitly closed with
+        a ``CLOSEPOLY`` vertex, otherwise *codes* is None.
+        """
+        if ma.isMaskedArray(verts):
+            verts = verts.astype(np.float_).filled(np.nan)
+        if isinstance(verts, np.ndarray) and verts.ndim == 3:
+            lengths = np.empty(len(verts), np.intp)
+            lengths[:] = verts.shape[1]
+            xy = verts.reshape((-1, 2)).astype(np.float_)
+        else:
+            polys = list(verts)
+            # only convert the polygons which are not already Nx2 arrays
+            if [poly for poly in polys if type(poly) is not np.ndarray
+                or poly.ndim != 2 or poly.shape[1] != 2]:
+                for i, poly in enumerate(polys):
+                    if ma.isMaskedArray(poly):
+                        poly = poly.astype(np.float_).filled(np.nan)
+                    polys[i] = np.asarray(poly, np.float_).reshape((-1, 2))
+            lengths = np.array([len(poly) for poly in polys], np.intp)
+            if len(polys):
+                xy = np.concatenate(polys).astype(np.float_)
+            else:
+                xy = np.zeros((0, 2))
+
+        starts = np.zeros(len(lengths) + 1, np.intp)
+        if not closed:
+            np.cumsum(lengths, out=starts[1:])
+            return cls(xy, None, starts)
+
+        # each non-empty polygon gets one more vertex, for the CLOSEPOLY
+        nonempty = (lengths > 0).astype(np.intp)
+        np.cumsum(lengths + nonempty, out=starts[1:])
+        vertices = np.zeros((starts[-1], 2))
+        shift = np.cumsum(nonempty) - nonempty
+        vertices[np.arange(len(xy)) + np.repeat(shift, lengths)] = xy
+        codes = np.empty(len(vertices), Path.code_type)
+        codes.fill(Path.LINETO)
+        nonempty = nonempty.astype(bool)
+        codes[starts[:-1][nonempty]] = Path.MOVETO
+        codes[starts[1:][nonempty] - 1] = Path.CLOSEPOLY
+        return cls(vertices, codes, starts)
+
+    @classmethod
+    def from_paths(cls, paths):
+        """
+        Pack a sequence of :class:`Path` objects.
+        """
+        paths = list(paths)
+        starts = np.zeros(len(paths) + 1, np.intp)
+        np.cumsum([len(path.vertices) for path in paths], out=starts[1:])
+        if len(paths):
+            vertices = np.concatenate([path.vertices for path in paths])
+        else:
+            vertices = np.zeros((0, 2))
+
+        codes = None
+        if [path for path in paths if path.codes is not None]:
+            codes = np.empty(len(vertices), Path.code_type)
+            codes.fill(Path.LINETO)
+            for path, start in zip(paths, starts):
+                if path.codes is not None:
+                    codes[start:start + len(path.codes)] = path.codes
+                elif len(path.vertices):
+                    codes[start] = Path.MOVETO
+        return cls(vertices, codes, starts)
+
+    def transformed_non_affine(self, transform):
+        """
+        Return a :class:`PackedPaths` of the paths transformed by the
+        non-affine part of *transform*.
+
+        The vertices are transformed all at once where that gives the
+        same number of vertices, i.e., where the transform maps
+        points to points.  Otherwise, e.g., for transforms which
+        interpolate the paths, each path is transformed on its own.
+        """
+        path = Path(self.vertices, self.codes)
+        tpath = transform.transform_path_non_affine(path)
+        if tpath is path:
+            return self
+        if len(tpath.vertices) == len(self.vertices):
+            return PackedPaths(tpath.vertices, tpath.codes, self.starts)
+        return PackedPaths.from_paths(
+            [transform.transform_path_non_affine(path) for path in self])
+
+    def __repr__(self):
+        return "PackedPaths(%d paths, %d vertices)" % (len(self),
+                                                       len(self.vertices))
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+    def __getitem__(self, i):
+        """
+        Return path *i* as a :class:`Path` sharing the arrays.
+        """
+        n = len(self)
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("PackedPaths index out of range")
+        start, end = self.starts[i], self.starts[i + 1]
+        codes = self.codes
+        if codes is not None:
+            codes = codes[start:end]
+        return Path(self.vertices[start:end], codes)
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
 _get_path_collection_extents = get_path_collection_extents
 def get_path_collection_extents(*args):
     """
-    Given a sequence of :class:`Path` objects, returns the bounding
-    box that encapsulates all of them.
+    Given a sequence of :class:`Path` objects, or a
+    :class:`PackedPaths`, returns the bounding box that encapsulates
+    all of them.
     """
     from transforms import Bbox
     if len(args[1]) == 0:
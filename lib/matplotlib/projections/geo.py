@@ -245,9 +245,9 @@ class AitoffAxes(GeoAxes):
 
         def __init__(self, resolution):
             """
-            Create a new Aitoff transform.  Resolution is the number of steps
-            to interpolate between each input line segment to approximate its
-            path in curved Aitoff space.
+            Create a new Aitoff transform.  Resolution is the largest
+            number of steps to interpolate between each input line segment
+            to approximate its path in curved Aitoff space.
             """
             Transform.__init__(self)
             self._resolution = resolution
@@ -277,9 +277,8 @@ class AitoffAxes(GeoAxes):
         transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
 
         def transform_path(self, path):
-            vertices = path.vertices
-            ipath = path.interpolated(self._resolution)
-            return Path(self.transform(ipath.vertices), ipath.codes)
+            return path.interpolated_transformed(
+                self.transform, self._resolution)
         transform_path.__doc__ = Transform.transform_path.__doc__
 
         transform_path_non_affine = transform_path
@@ -330,9 +329,9 @@ class HammerAxes(GeoAxes):
 
         def __init__(self, resolution):
             """
-            Create a new Hammer transform.  Resolution is the number of steps
-            to interpolate between each input line segment to approximate its
-            path in curved Hammer space.
+            Create a new Hammer transform.  Resolution is the largest
+            number of steps to interpolate between each input line segment
+            to approximate its path in curved Hammer space.
             """
             Transform.__init__(self)
             self._resolution = resolution
@@ -356,9 +355,8 @@ class HammerAxes(GeoAxes):
         transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
 
         def transform_path(self, path):
-            vertices = path.vertices
-            ipath = path.interpolated(self._resolution)
-            return Path(self.transform(ipath.vertices), ipath.codes)
+            return path.interpolated_transformed(
+                self.transform, self._resolution)
         transform_path.__doc__ = Transform.transform_path.__doc__
 
         transform_path_non_affine = transform_path
@@ -416,28 +414,30 @@ class MollweideAxes(GeoAxes):
 
         def __init__(self, resolution):
             """
-            Create a new Mollweide transform.  Resolution is the number of steps
-            to interpolate between each input line segment to approximate its
-            path in curved Mollweide space.
+            Create a new Mollweide transform.  Resolution is the largest
+            number of steps to interpolate between each input line segment
+            to approximate its path in curved Mollweide space.
             """
             Transform.__init__(self)
             self._resolution = resolution
 
         def transform(self, ll):
-            def d(theta):
-                delta = -(theta + np.sin(theta) - pi_sin_l) / (1 + np.cos(theta))
-                return delta, abs(delta) > 0.001
-
             longitude = ll[:, 0:1]
             latitude  = ll[:, 1:2]
 
-            pi_sin_l = np.pi * np.sin(latitude)
-            theta = 2.0 * latitude
-            delta, large_delta = d(theta)
-            while np.any(large_delta):
-                theta += np.where(large_delta, delta, 0)
-                delta, large_delta = d(theta)
-            aux = theta / 2
+            # Solve theta + sin(theta) = pi sin(latitude) for the
+            # auxiliary angle with Newton's method, only iterating on
+            # the elements which have not converged yet
+            pi_sin_l = np.pi * np.sin(latitude.ravel())
+            theta = 2.0 * latitude.ravel()
+            todo = np.arange(len(theta))
+            while len(todo):
+                t = theta[todo]
+                delta = -(t + np.sin(t) - pi_sin_l[todo]) / (1 + np.cos(t))
+                large_delta = abs(delta) > 0.001
+                todo = todo[large_delta]
+                theta[todo] += delta[large_delta]
+            aux = theta.reshape(latitude.shape) / 2
 
             x = (2.0 * np.sqrt(2.0) * longitude * np.cos(aux)) / np.pi
             y = (np.sqrt(2.0) * np.sin(aux))
@@ -449,9 +449,8 @@ class MollweideAxes(GeoAxes):
         transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
 
         def transform_path(self, path):
-            vertices = path.vertices
-            ipath = path.interpolated(self._resolution)
-            return Path(self.transform(ipath.vertices), ipath.codes)
+            return path.interpolated_transformed(
+                self.transform, self._resolution)
         transform_path.__doc__ = Transform.transform_path.__doc__
 
         transform_path_non_affine = transform_path
@@ -502,9 +501,9 @@ class LambertAxes(GeoAxes):
 
         def __init__(self, center_longitude, center_latitude, resolution):
             """
-            Create a new Lambert transform.  Resolution is the number of steps
-            to interpolate between each input line segment to approximate its
-            path in curved Lambert space.
+            Create a new Lambert transform.  Resolution is the largest
+            number of steps to interpolate between each input line segment
+            to approximate its path in curved Lambert space.
             """
             Transform.__init__(self)
             self._resolution = resolution
@@ -538,9 +537,8 @@ class LambertAxes(GeoAxes):
         transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
 
         def transform_path(self, path):
-            vertices = path.vertices
-            ipath = path.interpolated(self._resolution)
-            return Path(self.transform(ipath.vertices), ipath.codes)
+            return path.interpolated_transformed(
+                self.transform, self._resolution)
         transform_path.__doc__ = Transform.transform_path.__doc__
 
         transform_path_non_affine = transform_path
@@ -39,6 +39,12 @@ class PolarAxes(Axes):
         def __init__(self, axis=None):
             Transform.__init__(self)
             self._axis = axis
+            if axis is not None:
+                # rmin is read from the view limits, so a change of
+                # them invalidates the transformed paths; this node is
+                # never revalidated itself, so it always passes it on
+                self.set_children(axis.viewLim)
+                self.pass_through = True
 
         def transform(self, tr):
             xy = np.empty(tr.shape, np.float_)
@@ -68,11 +74,9 @@ class PolarAxes(Axes):
         transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
 
         def transform_path(self, path):
-            vertices = path.vertices
-            if len(vertices) == 2 and vertices[0, 0] == vertices[1, 0]:
-                return Path(self.transform(vertices), path.codes)
-            ipath = path.interpolated(path._interpolation_steps)
-            return Path(self.transform(ipath.vertices), ipath.codes)
+            # radial segments stay straight, so they are not subdivided
+            return path.interpolated_transformed(
+                self.transform, path._interpolation_steps)
         transform_path.__doc__ = Transform.transform_path.__doc__
 
         transform_path_non_affine = transform_path
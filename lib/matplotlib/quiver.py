@@ -964,21 +964,37 @@ class Barbs(collections.PolyCollection):
             #that wraps back over itself
             empty_barb = np.concatenate((circ, circ[::-1]))
 
-        barb_list = []
-        for index, angle in np.ndenumerate(angles):
+        #The barbs differ only in their number of flags, barbs and half
+        #barbs, and in their angle.  So the polygon for each combination of
+        #features present is made once, and all the barbs with it are
+        #rotated at once.
+        angles = np.asarray(angles).ravel()
+        nflags = np.asarray(nflags).ravel()
+        nbarbs = np.asarray(nbarbs).ravel()
+        half_barb = np.asarray(half_barb).ravel()
+        empty_flag = np.asarray(empty_flag).ravel()
+        if not len(angles):
+            return []
+        signatures = (nflags * (nbarbs.max() + 1) + nbarbs) * 2 + half_barb
+
+        barb_list = [None] * len(angles)
+        for index in np.nonzero(empty_flag)[0]:
             #If the vector magnitude is too weak to draw anything, plot an
-            #empty circle instead
-            if empty_flag[index]:
-                #We can skip the transform since the circle has no preferred
-                #orientation
-                barb_list.append(empty_barb)
-                continue
+            #empty circle instead.  We can skip the transform since the
+            #circle has no preferred orientation
+            barb_list[index] = empty_barb
+
+        signatures = signatures[~empty_flag]
+        indices = np.nonzero(~empty_flag)[0]
+        for signature in np.unique(signatures):
+            which = indices[signatures == signature]
+            first = which[0]
 
             poly_verts = [(endx, endy)]
             offset = length
 
             #Add vertices for each flag
-            for i in range(nflags[index]):
+            for i in range(nflags[first]):
                 #The spacing that works for the barbs is a little to much for
                 #the flags, but this only occurs when we have more than 1 flag.
                 if offset != length: offset += spacing / 2.
@@ -991,7 +1007,7 @@ class Barbs(collections.PolyCollection):
             #Add vertices for each barb.  These really are lines, but works
             #great adding 3 vertices that basically pull the polygon out and
             #back down the line
-            for i in range(nbarbs[index]):
+            for i in range(nbarbs[first]):
                 poly_verts.extend([(endx, endy + offset),
                     (endx + full_height, endy + offset + full_width/2),
                     (endx, endy + offset)])
@@ -999,7 +1015,7 @@ class Barbs(collections.PolyCollection):
                 offset -= spacing
 
             #Add the vertices for half a barb, if needed
-            if half_barb[index]:
+            if half_barb[first]:
                 #If the half barb is the first on the staff, traditionally it is
                 #offset from the end to make it easy to distinguish from a barb
                 #with a full one
@@ -1010,12 +1026,18 @@ class Barbs(collections.PolyCollection):
                     (endx + full_height/2, endy + offset + full_width/4),
                     (endx, endy + offset)])
 
-            #Rotate the barb according the angle. Making the barb first and then
-            #rotating it made the math for drawing the barb really easy.  Also,
-            #the transform framework makes doing the rotation simple.
-            poly_verts = transforms.Affine2D().rotate(-angle).transform(
-                poly_verts)
-            barb_list.append(poly_verts)
+            #Rotate the barbs according to their angles. Making the barb first
+            #and then rotating it made the math for drawing the barb really
+            #easy.  This is the rotation of Affine2D().rotate(-angle), done
+            #for all the barbs at once.
+            poly_verts = np.asarray(poly_verts, np.float_)
+            cos = np.cos(-angles[which])[:, np.newaxis]
+            sin = np.sin(-angles[which])[:, np.newaxis]
+            rotated = np.empty((len(which), len(poly_verts), 2), np.float_)
+            rotated[:, :, 0] = cos * poly_verts[:, 0] - sin * poly_verts[:, 1]
+            rotated[:, :, 1] = sin * poly_verts[:, 0] + cos * poly_verts[:, 1]
+            for index, verts in zip(which, rotated):
+                barb_list[index] = verts
 
         return barb_list
 
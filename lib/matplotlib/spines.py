@@ -135,9 +135,11 @@ class Spine(mpatches.Patch):
 
     def _ensure_position_is_set(self):
         if self._position is None:
-            # default position
+            # default position; no ticks have been made for the axis
+            # since the spine was cleared, so the axis is not cleared
+            # again, which would lose any locators set since.
             self._position = ('outward',0.0) # in points
-            self.set_position(self._position)
+            self._set_position(self._position)
 
     def register_axis(self,axis):
         """register an axis
@@ -350,6 +352,13 @@ class Spine(mpatches.Patch):
         else:
             assert len(position)==2, "position should be 'center' or 2-tuple"
             assert position[0] in ['outward','axes','data']
+        self._set_position(position)
+
+        if self.axis is not None:
+            self.axis.cla()
+
+    def _set_position(self, position):
+        'set the spine position and transform, leaving the axis alone'
         self._position = position
         self._calc_offset_transform()
 
@@ -362,9 +371,6 @@ class Spine(mpatches.Patch):
                                                        t)
         self.set_transform(t2)
 
-        if self.axis is not None:
-            self.axis.cla()
-
     def get_position(self):
         """get the spine position"""
         self._ensure_position_is_set()
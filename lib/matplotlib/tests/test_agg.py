@@ -62,3 +62,232 @@ def report_memory(i):
 ##     # w/o text and w/o write_png: Average memory consumed per loop: 0.02
 ##     # w/o text and w/ write_png : Average memory consumed per loop: 0.3400
 ##     # w/ text and w/ write_png  : Average memory consumed per loop: 0.32
+
+def test_threaded_rendering():
+    """Test that figures rendered concurrently match serial output."""
+    import threading
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    def render():
+        fig = Figure(figsize=(3, 2))
+        ax = fig.add_subplot(111)
+        ax.plot(np.sqrt(np.arange(50)), 'o-')
+        ax.set_title(r'$\alpha_i > \beta_{ij}^2$')
+        ax.set_xlabel(r'$\sqrt{x} + \frac{1}{2}$')
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        return canvas.tostring_rgb()
+
+    expected = render()
+    results = []
+    errors = []
+
+    def worker():
+        try:
+            for i in range(5):
+                results.append(render())
+        except Exception, e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors, errors
+    assert len(results) == 40
+    for result in results:
+        assert result == expected
+
+def test_damage_tracking():
+    """Test that a damage tracked redraw matches a full redraw."""
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    def make_figure():
+        fig = Figure(figsize=(4, 3))
+        canvas = FigureCanvasAgg(fig)
+        canvas.set_damage_tracking(True)
+        x = np.linspace(0, 2 * np.pi, 100)
+        lines = []
+        for i in range(2):
+            ax = fig.add_subplot(2, 1, i + 1)
+            ax.plot(x, np.cos(x), 'k-')
+            line, = ax.plot(x, np.sin(x), 'ro-', lw=3, animated=True)
+            ax.set_xlim(0, 2 * np.pi)
+            ax.set_ylim(-1.5, 1.5)
+            lines.append(line)
+        return fig, canvas, lines
+
+    fig, canvas, lines = make_figure()
+    canvas.draw()
+
+    full_draws = []
+    fig_draw = fig.draw
+    def counting_draw(renderer):
+        full_draws.append(renderer)
+        fig_draw(renderer)
+    fig.draw = counting_draw
+
+    x = np.linspace(0, 2 * np.pi, 100)
+    for phase in (0.5, 1.0):
+        for line in lines:
+            line.set_ydata(np.sin(x + phase))
+        canvas.draw()
+    assert len(full_draws) == 0
+
+    expected_fig, expected_canvas, expected_lines = make_figure()
+    for line in expected_lines:
+        line.set_ydata(np.sin(x + 1.0))
+    expected_canvas.draw()
+    assert canvas.tostring_rgb() == expected_canvas.tostring_rgb()
+
+    # changing the view limits invalidates the cached background
+    lines[0].axes.set_ylim(-2, 2)
+    canvas.draw()
+    assert len(full_draws) == 1
+
+    # so do adding, hiding and animating artists
+    static, = lines[0].axes.plot(x, np.cos(2 * x), 'b-')
+    canvas.draw()
+    assert len(full_draws) == 2
+    static.set_visible(False)
+    canvas.draw()
+    assert len(full_draws) == 3
+    lines[1].set_visible(False)
+    canvas.draw()
+    assert len(full_draws) == 3
+    fig.text(0.5, 0.5, 'static')
+    canvas.draw()
+    assert len(full_draws) == 4
+
+    # other changes of static artists need invalidate_damage
+    lines[1].axes.grid(True)
+    canvas.invalidate_damage()
+    canvas.draw()
+    assert len(full_draws) == 5
+    lines[0].set_ydata(np.sin(x + 1.5))
+    canvas.draw()
+    assert len(full_draws) == 5
+    tracked = canvas.tostring_rgb()
+    canvas.invalidate_damage()
+    canvas.draw()
+    assert tracked == canvas.tostring_rgb()
+
+def test_damage_tracking_figure_artists():
+    """Test that animated artists of the figure itself are redrawn."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    def make_figure(track):
+        fig = Figure(figsize=(4, 3))
+        canvas = FigureCanvasAgg(fig)
+        canvas.set_damage_tracking(track)
+        ax = fig.add_subplot(111)
+        ax.plot([0, 1], [0, 1])
+        text = fig.text(0.5, 0.5, 'frame 0', size=20, animated=True)
+        return fig, canvas, text
+
+    fig, canvas, text = make_figure(True)
+    canvas.draw()
+    full_draws = []
+    fig_draw = fig.draw
+    def counting_draw(renderer):
+        full_draws.append(renderer)
+        fig_draw(renderer)
+    fig.draw = counting_draw
+    for i in range(1, 3):
+        text.set_text('frame %d' % i)
+        text.set_position((0.1 * i, 0.9 - 0.1 * i))
+        canvas.draw()
+    assert len(full_draws) == 0
+
+    expected_fig, expected_canvas, expected_text = make_figure(False)
+    expected_text.set_text('frame 2')
+    expected_text.set_position((0.2, 0.7))
+    expected_canvas.draw()
+    assert canvas.tostring_rgb() == expected_canvas.tostring_rgb()
+
+def test_print_redraws():
+    """Test that every print shows the changes made since the last."""
+    import cStringIO
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(3, 2))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    line, = ax.plot([1, 2, 3])
+    canvas.draw()
+
+    def png():
+        output = cStringIO.StringIO()
+        canvas.print_figure(output, format='png')
+        return output.getvalue()
+    before = png()
+    assert png() == before
+    line.set_color('r')
+    assert png() != before
+    before = png()
+    ax.grid(True)
+    assert png() != before
+    before = png()
+    ax.invert_xaxis()
+    assert png() != before
+    before = png()
+    ax.lines.pop(0)
+    assert png() != before
+
+def test_packed_paths():
+    """Test that packed polygons draw and hit test like separate paths."""
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.backend_bases import MouseEvent
+    from matplotlib.collections import PathCollection, PolyCollection
+    from matplotlib.path import Path, PackedPaths
+
+    np.random.seed(0)
+    verts = [np.random.rand(n, 2) + [i % 10, i // 10]
+             for i, n in enumerate(np.random.randint(3, 8, 100))]
+    verts[0] = [(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)]
+    verts[5] = []
+    verts[7] = np.ma.masked_array(verts[7][:3], [[0, 0], [1, 1], [0, 0]])
+
+    packed = PackedPaths.from_polygons(verts)
+    assert len(packed) == 100
+    assert len(packed[5]) == 0
+    assert np.isnan(packed[7].vertices[1]).all()
+    for path, xy in zip(packed, verts):
+        if len(xy):
+            assert (np.isnan(xy) | (path.vertices[:-1] == xy)).all()
+            assert path.codes[0] == Path.MOVETO
+            assert path.codes[-1] == Path.CLOSEPOLY
+    repacked = PackedPaths.from_paths(packed)
+    assert (repacked.starts == packed.starts).all()
+    assert (repacked.codes == packed.codes).all()
+    assert PackedPaths.from_polygons(np.ones((4, 3, 2)), False).codes is None
+
+    def render(collection):
+        fig = Figure(figsize=(3, 3))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        canvas.draw()
+        event = MouseEvent('button_press_event', canvas,
+                           *ax.transData.transform_point((0.5, 0.5)))
+        return (canvas.tostring_rgb(), collection.contains(event)[1]['ind'],
+                collection.get_datalim(ax.transData).get_points())
+
+    kwargs = dict(facecolors=['r', 'g', 'b'], edgecolors='k')
+    paths = [Path(path.vertices, path.codes) for path in packed]
+    expected = render(PathCollection(paths, **kwargs))
+    result = render(PolyCollection(verts, **kwargs))
+    assert result[0] == expected[0]
+    assert result[1] == expected[1] and len(result[1])
+    assert (result[2] == expected[2]).all()
@@ -512,6 +512,157 @@ def test_pcolormesh():
 
     fig.savefig('pcolormesh')
 
+def test_append_data():
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+    line, = ax.plot(np.arange(150.), np.zeros(150))
+    scatter = ax.scatter([0, 1], [0, 1])
+    fig.canvas.draw()
+
+    for i in range(150, 300):
+        line.append_data(i, np.sin(i), maxlen=200)
+    scatter.append_offsets([[2, 3], [4, 5]])
+
+    assert np.all(line.get_xdata() == np.arange(100., 300.))
+    assert np.all(line.get_path().vertices == line.get_xydata())
+    assert line._subslice
+    assert ax.dataLim.x1 == 299
+    assert ax.dataLim.y1 >= 5
+    assert len(scatter.get_offsets()) == 4
+    fig.canvas.draw()
+
+    # the appended line draws like one set up in one go
+    line2, = ax.plot(line.get_xdata(), line.get_ydata())
+    fig.canvas.draw()
+    assert np.all(line._transformed_path.get_fully_transformed_path().vertices ==
+                  line2._transformed_path.get_fully_transformed_path().vertices)
+
+def test_append_data_units():
+    import datetime
+    from matplotlib.dates import date2num
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+    start = datetime.datetime(2010, 1, 1)
+    days = [start + datetime.timedelta(days=i) for i in range(300)]
+    line, = ax.plot(days[:150], np.zeros(150))
+    fig.canvas.draw()
+
+    for i in range(150, 290):
+        line.append_data(days[i], i, maxlen=200)
+    line.append_data(days[290:], np.arange(290, 300), maxlen=200)
+    # the dates are buffered rather than copied on every call
+    xbuf, ybuf = line._origbuffers
+    assert line.get_xdata(orig=True).base is xbuf._buf
+    assert list(line.get_xdata(orig=True)) == days[100:]
+    assert np.all(line.get_xdata(orig=False) == date2num(days[100:]))
+    assert np.all(line.get_ydata(orig=False)[50:] == np.arange(150, 300))
+
+    # converting the originals again gives the same line
+    line.recache_always()
+    assert np.all(line.get_xdata(orig=False) == date2num(days[100:]))
+    assert np.all(line.get_ydata(orig=False)[50:] == np.arange(150, 300))
+    fig.canvas.draw()
+
+def test_relim_cached():
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+    lines = [ax.plot(np.arange(10) * i)[0] for i in range(1, 4)]
+    rects = ax.bar([0, 1], [1, 2])
+
+    computed = []
+    limits_path = ax._limits_path
+    def counting_limits_path(path):
+        computed.append(path)
+        return limits_path(path)
+    ax._limits_path = counting_limits_path
+
+    ax.relim()
+    del computed[:]
+    ax.relim()
+    assert len(computed) == 0
+    lines[0].set_ydata(np.arange(10) * 10)
+    rects[1].set_height(-5)
+    ax.relim()
+    assert len(computed) == 2
+    assert np.all(ax.dataLim.get_points() == [[0, -5], [9, 90]])
+
+    # changes made behind the setters' back are noticed too
+    poly, = ax.fill([0, 1, 1], [0, 0, 1])
+    ax.relim()
+    del computed[:]
+    poly.get_xy()[1] = [20, -10]
+    ax.relim()
+    assert len(computed) == 1
+    assert np.all(ax.dataLim.get_points() == [[0, -10], [20, 90]])
+
+def test_batched_ticks():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.ticker import MultipleLocator
+
+    def render(materialize):
+        fig = Figure(figsize=(4, 3))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.plot(np.arange(10), np.arange(10) ** 2)
+        ax.grid(True)
+        ax.xaxis.set_minor_locator(MultipleLocator(0.5))
+        ax.tick_params(labelright=True, direction='out')
+        if materialize:
+            for axis in (ax.xaxis, ax.yaxis):
+                axis.get_major_ticks()
+                axis.get_minor_ticks()
+        canvas.draw()
+        return ax, canvas.tostring_rgb()
+
+    ax, batched = render(False)
+    # no tick artists are made per location
+    assert len(ax.xaxis.majorTicks) == 1
+    assert len(ax.xaxis.minorTicks) == 1
+    ax, per_tick = render(True)
+    assert len(ax.xaxis.majorTicks) > 1
+    assert batched == per_tick
+
+@image_comparison(baseline_images=['geo_grid'], extensions=['png'])
+def test_geo_grid():
+    # the gridlines of curved projections are drawn one at a time, as
+    # their transforms need not pass nans between them through
+    from matplotlib.ticker import NullFormatter
+    fig = plt.figure()
+    for i, projection in enumerate(('aitoff', 'hammer')):
+        ax = fig.add_subplot(2, 1, i + 1, projection=projection)
+        ax.grid(True)
+        ax.xaxis.set_major_formatter(NullFormatter())
+        ax.yaxis.set_major_formatter(NullFormatter())
+    fig.savefig('geo_grid')
+
+def test_lazy_ticks():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    def render(eager):
+        fig = Figure(figsize=(4, 3))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        if eager:
+            ax.xaxis.get_major_ticks()
+            ax.yaxis.get_minor_ticks()
+        else:
+            # no tick is made until the ticks are asked for
+            assert ax.xaxis._majorTicks == []
+            assert ax.yaxis._minorTicks == []
+        ax.plot(np.arange(10), np.arange(10) ** 2)
+        ax.grid(True, color='r')
+        ax.tick_params(direction='out', length=6)
+        canvas.draw()
+        return ax, canvas.tostring_rgb()
+
+    ax, lazy = render(False)
+    assert ax.xaxis.majorTicks[0].gridline.get_color() == 'r'
+    assert ax.xaxis.majorTicks[0]._tickdir == 'out'
+    ax, eager = render(True)
+    assert lazy == eager
+
 if __name__=='__main__':
     import nose
     nose.runmodule(argv=['-s','--with-doctest'], exit=False)
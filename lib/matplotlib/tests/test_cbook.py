@@ -12,3 +12,37 @@ def test_is_string_like():
 
     assert cbook.is_string_like( "hello world" )
     assert_equal( cbook.is_string_like(10), False )
+
+def test_growable_array():
+    buf = cbook.GrowableArray(np.zeros((3, 2)), maxlen=50)
+    view = buf.view()
+    for i in range(100):
+        buf.extend([[i, -i]])
+    assert_equal( len(buf), 50 )
+    assert np.all( buf.view()[:, 0] == np.arange(50, 100) )
+    # earlier views are not overwritten
+    assert np.all( view == 0 )
+
+def test_grouper():
+    class Dummy:
+        pass
+    objs = [Dummy() for i in range(6)]
+    a, b, c, d, e, f = objs
+    g = cbook.Grouper()
+    g.join(a, b)
+    g.join(c, d)
+    g.join(b, d, e)
+    assert g.joined(a, e)
+    assert not g.joined(a, f)
+    assert f not in g
+    assert_equal( sorted(map(id, g.get_siblings(c))),
+                  sorted(map(id, objs[:5])) )
+    assert_equal( g.get_siblings(f), [f] )
+
+    # dead objects are dropped without splitting the set
+    del b, d, objs[3], objs[1]
+    assert_equal( len(list(g)), 1 )
+    assert_equal( sorted(map(id, g.get_siblings(a))), sorted(map(id, [a, c, e])) )
+    assert g.joined(c, e)
+    del a, c, e, objs[:]
+    assert_equal( list(g), [] )
@@ -0,0 +1,72 @@
+import numpy as np
+from nose.tools import assert_equal
+from matplotlib.figure import Figure
+import matplotlib.contour as mcontour
+import matplotlib.cbook as cbook
+
+def _data():
+    x, y = np.meshgrid(np.linspace(-3, 3, 60), np.linspace(-2, 2, 40))
+    z = np.ma.masked_greater(np.sin(2*x) * np.cos(3*y) + 0.1*x, 0.9)
+    return x, y, z
+
+def test_contour_packed():
+    x, y, z = _data()
+    ax = Figure().add_subplot(111)
+    cs = ax.contourf(x, y, z, [-1, -0.5, 0, 0.5, 1])
+    assert_equal( len(cs.allsegs), 4 )
+    for col, segs, kinds in zip(cs.collections, cs.allsegs, cs.allkinds):
+        paths = list(col.get_paths())
+        assert_equal( len(paths), len(segs) )
+        for path, seg, kind in zip(paths, segs, kinds):
+            assert (path.vertices == seg).all()
+            assert (path.codes == kind).all()
+
+    # the packed output is the same as the list of arrays
+    for level, level_upper, segs in zip([-1, 0], [-0.5, 0.5],
+                                        cs.allsegs[::2]):
+        nlist = cs.Cntr.trace(level, level_upper)
+        assert_equal( len(nlist), 2 * len(segs) )
+        for seg, xy in zip(segs, nlist):
+            assert (seg == xy).all()
+
+    # new levels reuse the levels already traced
+    cs2 = ax.contourf(cs, levels=[-1, -0.5, 0, 0.25, 1])
+    fresh = ax.contourf(x, y, z, [-1, -0.5, 0, 0.25, 1])
+    assert cs2.Cntr is cs.Cntr
+    assert cs2.allsegs[0][0].base is cs.allsegs[0][0].base
+    for segs2, segs in zip(cs2.allsegs, fresh.allsegs):
+        assert_equal( len(segs2), len(segs) )
+        for seg2, seg in zip(segs2, segs):
+            assert (seg2 == seg).all()
+
+def test_contour_empty_level():
+    x, y, z = _data()
+    ax = Figure().add_subplot(111)
+    # no contours at the last level, which is above the data
+    cs = ax.contour(x, y, z, [-0.5, 0, 0.5, 5])
+    assert_equal( len(cs.allsegs[-1]), 0 )
+    assert_equal( len(cs.collections[-1].get_paths()), 0 )
+    for level, segs in zip(cs.levels, cs.allsegs):
+        assert_equal( 2 * len(segs), len(cs.Cntr.trace(level)) )
+    cs.clabel(inline=False)
+
+def test_contour_threads():
+    x, y, z = _data()
+    cntr = mcontour._cntr.Cntr(x, y, z.filled(), np.ma.getmaskarray(z))
+    levels = np.linspace(-1, 1, 21)
+    def trace(level):
+        return cntr.trace(level, level + 0.2, packed=True)
+    serial = [trace(level) for level in levels]
+    threaded = cbook.map_threaded(trace, levels, nthreads=4)
+    for packed, packed2 in zip(serial, threaded):
+        for a, b in zip(packed, packed2):
+            assert (a == b).all()
+
+    def fail(level):
+        raise ValueError(level)
+    try:
+        cbook.map_threaded(fail, levels, nthreads=4)
+    except ValueError:
+        pass
+    else:
+        assert False, 'expected a ValueError'
@@ -141,6 +141,65 @@ def test_DateFormatter():
 
     fig.savefig( 'DateFormatter_fractionalSeconds' )
 
+def test_DateFormatter_format_ticks():
+    import matplotlib.dates as dates
+
+    d = [datetime.datetime(1850, 3, 1, 12), datetime.datetime(1899, 12, 31),
+         datetime.datetime(1999, 1, 1, 6, 30), datetime.datetime(2010, 5, 8)]
+    locs = dates.date2num(d)
+    formatter = dates.DateFormatter('%Y-%m-%d %H:%M')
+    labels = formatter.format_ticks(locs)
+    assert labels == [formatter(x) for x in locs]
+    assert labels[0] == '1850-03-01 12:00'
+    assert_raises(ValueError, formatter.format_ticks, [0, 1])
+
+    locator = dates.AutoDateLocator()
+    locator.create_dummy_axis()
+    locator.set_view_interval(locs[0], locs[-1])
+    formatter = dates.AutoDateFormatter(locator)
+    assert formatter.format_ticks(locs) == ['1850', '1899', '1999', '2010']
+
+def test_RRuleLocator_regular_ticks():
+    import matplotlib.dates as dates
+    import pytz
+
+    ordinals = np.arange(1, 3652060, 997)
+    year, month, day = dates._civil_from_ordinal(ordinals)
+    expected = [datetime.date.fromordinal(n) for n in ordinals]
+    assert [(d.year, d.month, d.day) for d in expected] == \
+           zip(year, month, day)
+    assert np.all(dates._ordinal_from_civil(year, month, day) == ordinals)
+
+    # the ticks found with arrays are the same as the rrule's
+    for tz in (dates.UTC, pytz.timezone('US/Eastern')):
+        for locator in (dates.MonthLocator(bymonthday=31, interval=2, tz=tz),
+                        dates.DayLocator(interval=3, tz=tz),
+                        dates.DayLocator(bymonthday=[1, 15, 30], tz=tz),
+                        dates.HourLocator(byhour=[0, 7, 13], tz=tz),
+                        dates.SecondLocator(interval=7, tz=tz)):
+            locator.create_dummy_axis()
+            unit = locator._get_unit()
+            locator.set_view_interval(733100.3, 733100.3 + 60*unit)
+            ticks = locator()
+            dmin, dmax = locator.viewlim_to_dt()
+            assert locator._regular_ticks(dmin, dmax) is not None
+            expected = dates.date2num(locator.rule.between(dmin, dmax, True))
+            assert np.all(ticks == expected)
+
+    # and are capped at the same count from the start of the rule
+    for locator, days in ((dates.DayLocator(interval=3), 100),
+                          (dates.MonthLocator(bymonthday=[1, 15]), 600),
+                          (dates.HourLocator(interval=2), 80 / 24.)):
+        locator.MAXTICKS = 50
+        locator.create_dummy_axis()
+        locator.set_view_interval(733100.3, 733100.3 + days)
+        ticks = locator()
+        dmin, dmax = locator.viewlim_to_dt()
+        assert locator._regular_ticks(dmin, dmax) is not None
+        expected = dates.date2num(locator.rule.between(dmin, dmax, True))
+        assert len(expected) and expected[-1] < 733100.3 + 0.75 * days
+        assert np.all(ticks == expected)
+
 #@image_comparison(baseline_images=['empty_date_bug'])
 @knownfailureif(True)
 def test_empty_date_with_year_formatter():
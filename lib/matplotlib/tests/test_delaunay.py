@@ -0,0 +1,43 @@
+import numpy as np
+from nose.tools import assert_equal
+import matplotlib.delaunay as delaunay
+from matplotlib.delaunay.testfuncs import data, cloverleaf
+
+def _interpolator(nthreads):
+    mesh = data.franke100
+    tri = delaunay.Triangulation(mesh.x, mesh.y)
+    return delaunay.NNInterpolator(tri, cloverleaf(tri.x, tri.y),
+                                   nthreads=nthreads)
+
+def test_nn_grid_tiles():
+    # the bands of rows filled in from several threads make the same
+    # grid as one pass over the whole grid
+    serial = _interpolator(1)[0:1:97j, 0:1:123j]
+    threaded = _interpolator(4)[0:1:97j, 0:1:123j]
+    assert_equal(threaded.shape, (97, 123))
+    assert np.all(np.isnan(serial) == np.isnan(threaded))
+    assert np.allclose(serial[~np.isnan(serial)],
+                       threaded[~np.isnan(threaded)], rtol=0, atol=1e-12)
+
+def test_nn_points_batched():
+    # scattered points are sorted and split into batches, but come back
+    # in their own order and shape
+    rng = np.random.RandomState(1)
+    x = rng.uniform(-0.1, 1.1, (50, 120))
+    y = rng.uniform(-0.1, 1.1, (50, 120))
+    interp = _interpolator(4)
+    vals = interp(x, y)
+    assert_equal(vals.shape, (50, 120))
+    grid = interp[0:1:11j, 0:1:11j]
+    # point by point, so the triangles are located in the old order
+    expected = np.array([interp(np.array([xx]), np.array([yy]))[0]
+                         for xx, yy in zip(x.flat[:500], y.flat[:500])])
+    actual = vals.flat[:500]
+    assert np.all(np.isnan(expected) == np.isnan(actual))
+    good = ~np.isnan(expected)
+    assert np.allclose(expected[good], actual[good], rtol=0, atol=1e-12)
+    gx, gy = np.meshgrid(np.linspace(0, 1, 11), np.linspace(0, 1, 11))
+    vals = interp(gx, gy)
+    assert np.all(np.isnan(vals) == np.isnan(grid))
+    good = ~np.isnan(grid)
+    assert np.allclose(vals[good], grid[good], rtol=0, atol=1e-12)
@@ -1,6 +1,6 @@
 import numpy as np
 import matplotlib.mlab as mlab
-import tempfile
+import os, tempfile
 from nose.tools import raises
 
 def test_colinear_pca():
@@ -55,3 +55,285 @@ def test_prctile():
     for pi, expectedi in zip(p,expected):
         actuali = mlab.prctile(ob1,pi)
         assert np.allclose( expectedi, actuali )
+
+def _scattered_data():
+    np.random.seed(0)
+    x = np.random.uniform(-2, 2, 200)
+    y = np.random.uniform(-2, 2, 200)
+    z = x*np.exp(-x**2 - y**2)
+    xi = np.linspace(-2.1, 2.1, 30)
+    yi = np.linspace(-2.1, 2.1, 40)
+    return x, y, z, xi, yi
+
+def test_grid_interpolator():
+    x, y, z, xi, yi = _scattered_data()
+    for interp in ('nn', 'linear'):
+        gridinterp = mlab.GridInterpolator(x, y, xi, yi, interp)
+        for zz in (z, np.cos(x)*y):
+            expected = mlab.griddata(x, y, zz, xi, yi, interp)
+            actual = gridinterp(zz)
+            assert actual.shape == (40, 30)
+            assert np.all(actual.mask == expected.mask)
+            assert np.allclose(actual.compressed(), expected.compressed())
+
+    # masked values fall back to triangulating the unmasked points again
+    zm = np.ma.masked_greater(z, 0.3)
+    expected = mlab.griddata(x, y, zm, xi, yi)
+    actual = mlab.GridInterpolator(x, y, xi, yi)(zm)
+    assert np.all(actual.mask == expected.mask)
+    assert np.allclose(actual.compressed(), expected.compressed())
+
+def test_griddata_reuses_triangulation():
+    x, y, z, xi, yi = _scattered_data()
+    mlab.griddata(x, y, z, xi, yi)
+    tri = mlab._griddata_triangulation(x, y)
+    mlab.griddata(x, y, 2*z, xi, yi)
+    assert mlab._griddata_triangulation(x, y) is tri
+    assert mlab._griddata_triangulation(x, y[::-1]) is not tri
+
+def test_spectral_blocks():
+    np.random.seed(0)
+    x = np.random.randn(5000) + 1j*np.random.randn(5000)
+    # other detrend functions are applied one segment at a time, the
+    # ones in mlab to a whole block of segments at once
+    for detrend, oneatatime in (
+            (mlab.detrend_mean, lambda seg: seg - seg.mean()),
+            (mlab.detrend_linear, lambda seg: mlab.detrend_linear(seg))):
+        for data in (x.real, x):
+            expected = mlab.specgram(data, 128, detrend=oneatatime,
+                                     noverlap=50)
+            old_size = mlab._spectral_block_size
+            mlab._spectral_block_size = 1000
+            try:
+                actual = mlab.specgram(data, 128, detrend=detrend,
+                                       noverlap=50)
+            finally:
+                mlab._spectral_block_size = old_size
+            for a, e in zip(actual, expected):
+                assert a.shape == e.shape
+                assert np.allclose(a, e, rtol=1e-12, atol=0)
+
+def test_specgram_chunks():
+    np.random.seed(0)
+    x = np.random.randn(10000)
+    Pxx, freqs, t = mlab.specgram(x, 64, Fs=10, noverlap=16)
+    chunks = list(mlab.specgram_chunks(x, 64, Fs=10, noverlap=16,
+                                       nsegments=30))
+    assert len(chunks) == 7
+    assert np.all(chunks[0][1] == freqs)
+    assert np.allclose(np.hstack([c[0] for c in chunks]), Pxx)
+    assert np.allclose(np.concatenate([c[2] for c in chunks]), t)
+
+def test_cohere_pairs():
+    np.random.seed(0)
+    X = np.random.randn(3000, 6)
+    X[:,1] += 0.5*X[:,0]
+    X[:,4] -= np.roll(X[:,3], 2)
+    ij = [(i, j) for i in range(6) for j in range(6) if i != j]
+
+    # the spectra averaged over all slices and frequencies
+    window = mlab.window_hanning(np.ones(128))
+    normVal = np.linalg.norm(window)**2
+    ffts = []
+    for k in range(6):
+        slices = [window*mlab.detrend_mean(X[i0:i0+128, k])
+                  for i0 in range(0, 3000-128+1, 96)]
+        ffts.append(np.fft.fft(slices)[:,:65])
+    expectedPxx = [np.mean(abs(F)**2)/normVal for F in ffts]
+
+    for kwargs in ({}, dict(preferSpeedOverMemory=False, nthreads=3),
+                   dict(maxCacheBytes=1000, nthreads=2)):
+        Cxy, Phase, freqs, Pxx = mlab.cohere_pairs(
+            X, ij, 128, detrend=mlab.detrend_mean, noverlap=32,
+            returnPxx=True, **kwargs)
+        assert sorted(Cxy.keys()) == sorted(ij)
+        assert np.allclose(freqs, np.arange(65)/128.*2)
+        for i, j in ij:
+            Pxy = np.mean(ffts[i]*np.conjugate(ffts[j]))/normVal
+            assert np.shape(Cxy[i,j]) == ()
+            assert np.allclose(Cxy[i,j],
+                               abs(Pxy)**2/(expectedPxx[i]*expectedPxx[j]))
+            assert np.allclose(Phase[i,j], np.angle(Pxy))
+        assert np.allclose(Cxy[0,1], Cxy[1,0])
+        assert np.allclose([Pxx[k] for k in range(6)], expectedPxx)
+
+    # a single slice is not averaged over the frequencies
+    Cxy, Phase, freqs = mlab.cohere_pairs(X[:128], ij, 128)
+    assert np.shape(Cxy[0,1]) == (1, 65)
+
+def _write_csv(rows, dates=True):
+    fd, fname = tempfile.mkstemp(suffix='.csv')
+    fh = os.fdopen(fd, 'w')
+    fh.write('id,price,name,ok,code%s\n' % (',date'*dates))
+    for i in range(rows):
+        price = '%1.2f' % (i*0.5)
+        if i % 7 == 0:
+            price = ''
+        # code looks numeric until the last rows
+        code = str(i)
+        if i > rows - 3:
+            code = 'c%d' % i
+        fh.write('%d,%s,n%d,%s,%s' % (i, price, i % 13, i % 2 == 0, code))
+        if dates:
+            fh.write(',2010-%02d-%02d' % (i % 12 + 1, i % 28 + 1))
+        fh.write('\n')
+    fh.close()
+    return fname
+
+def _write_csv_text(text):
+    fd, fname = tempfile.mkstemp(suffix='.csv')
+    os.write(fd, text)
+    os.close(fd)
+    return fname
+
+def _assert_rec_equal(a, b):
+    assert a.dtype.names == b.dtype.names
+    assert len(a) == len(b)
+    for name in a.dtype.names:
+        x, y = a[name], b[name]
+        if x.dtype.kind == 'f':
+            assert np.all(np.isnan(x) == np.isnan(y))
+            x, y = x[~np.isnan(x)], y[~np.isnan(y)]
+        assert np.all(x == y), name
+
+def test_csv2rec_chunks():
+    fname = _write_csv(250)
+    try:
+        expected = mlab.csv2rec(fname)
+        for chunksize in (10, 100, 1000):
+            _assert_rec_equal(mlab.csv2rec(fname, chunksize=chunksize),
+                              expected)
+        chunks = list(mlab.csv2rec_chunks(fname, 100))
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        assert chunks[0].id.dtype.kind == 'i'
+        assert chunks[-1].code.dtype.kind == 'S'
+    finally:
+        os.remove(fname)
+
+def test_csv2rec_memmap():
+    fname = _write_csv(250, dates=False)
+    dat = fname + '.dat'
+    try:
+        expected = mlab.csv2rec(fname)
+        actual = mlab.csv2rec(fname, chunksize=40, memmap=dat)
+        assert isinstance(actual, np.recarray)
+        _assert_rec_equal(actual, expected)
+        del actual
+    finally:
+        os.remove(fname)
+        os.remove(dat)
+
+def test_csv2rec_chunks_promotion():
+    import datetime, StringIO
+    # missing values before and after a and b become floats and ints,
+    # c becomes strings and d datetimes in the last chunk
+    text = ('a,b,c,d\n' + '1,,5,2010-01-01\n'*2 + ',,,\n'*2 +
+            '2.5,7,x,2010-01-02 10:30\n' + ',,,\n')
+    for chunksize in (2, 3, 100):
+        for fh in (StringIO.StringIO(text), _write_csv_text(text)):
+            r = mlab.csv2rec(fh, chunksize=chunksize)
+            if not isinstance(fh, StringIO.StringIO):
+                os.remove(fh)
+            assert np.all(np.isnan(r.a) == [0, 0, 1, 1, 0, 1])
+            assert list(r.a[[0, 1, 4]]) == [1, 1, 2.5]
+            assert list(r.b) == [-1, -1, -1, -1, 7, -1]
+            assert list(r.c) == ['5', '5', '', '', 'x', '']
+            assert list(r.d[[0, 1, 4]]) == [
+                datetime.datetime(2010, 1, 1), datetime.datetime(2010, 1, 1),
+                datetime.datetime(2010, 1, 2, 10, 30)]
+            assert type(r.d[0]) is datetime.datetime
+
+    fname = _write_csv_text(text.replace('2010-01-01', '0').replace(
+        '2010-01-02 10:30', '1'))
+    dat = fname + '.dat'
+    try:
+        r = mlab.csv2rec(fname, chunksize=2, memmap=dat)
+        assert np.all(np.isnan(r.a) == [0, 0, 1, 1, 0, 1])
+        assert list(r.b) == [-1, -1, -1, -1, 7, -1]
+        assert list(r.c) == ['5', '5', '', '', 'x', '']
+        del r
+    finally:
+        os.remove(fname)
+        os.remove(dat)
+
+def test_csv2rec_chunks_promotions():
+    import StringIO
+    # a and b become strings in different chunks, so each pass after
+    # the first promotes another column
+    text = 'a,b\n1,2\nx,3\n4,y\n5,6\n'
+    expected = mlab.csv2rec(StringIO.StringIO(text))
+    for chunksize in (1, 2):
+        for fh in (StringIO.StringIO(text), _write_csv_text(text)):
+            r = mlab.csv2rec(fh, chunksize=chunksize)
+            if not isinstance(fh, StringIO.StringIO):
+                os.remove(fh)
+            _assert_rec_equal(r, expected)
+            assert list(r.a) == ['1', 'x', '4', '5']
+            assert list(r.b) == ['2', '3', 'y', '6']
+
+def test_rec_groupby():
+    r = np.rec.fromarrays([np.array(['b', 'a', 'b', 'a', 'c', 'b']),
+                           np.array([1, 2, 1, 1, 1, 1]),
+                           np.array([1., 2., 3., 4., 5., 6.])],
+                          names='name,day,x')
+    stats = (('x', len, 'n'), ('x', np.sum, 'total'),
+             ('x', np.mean, 'avg'), ('x', np.max, 'high'),
+             ('x', lambda x: x[-1], 'last'))
+    g = mlab.rec_groupby(r, ('name', 'day'), stats)
+    assert list(g.name) == ['a', 'a', 'b', 'c']
+    assert list(g.day) == [1, 2, 1, 1]
+    assert list(g.n) == [1, 1, 3, 1]
+    assert np.allclose(g.total, [4, 2, 10, 5])
+    assert np.allclose(g.avg, [4, 2, 10/3., 5])
+    assert np.allclose(g.high, [4, 2, 6, 5])
+    assert np.allclose(g.last, [4, 2, 6, 5])
+
+def test_rec_join():
+    r1 = np.rec.fromarrays([np.array([1, 1, 2, 3]),
+                            np.array(['x', 'y', 'x', 'x']),
+                            np.array([1., 2., 3., 4.])], names='a,b,v')
+    r2 = np.rec.fromarrays([np.array([3, 1, 4]),
+                            np.array(['x', 'y', 'x']),
+                            np.array([30., 20., 40.])], names='a,b,v')
+    key = ('a', 'b')
+    r = mlab.rec_join(key, r1, r2)
+    assert zip(r.a, r.b) == [(1, 'y'), (3, 'x')]
+    assert list(r.v1) == [2., 4.] and list(r.v2) == [20., 30.]
+    r = mlab.rec_join(key, r1, r2, jointype='leftouter')
+    assert zip(r.a, r.b) == [(1, 'x'), (1, 'y'), (2, 'x'), (3, 'x')]
+    assert list(r.v2) == [0., 20., 0., 30.]
+    r = mlab.rec_join(key, r1, r2, jointype='outer', defaults=dict(v1=-1.))
+    assert zip(r.a, r.b) == [(1, 'x'), (1, 'y'), (2, 'x'), (3, 'x'), (4, 'x')]
+    assert list(r.v1) == [1., 2., 3., 4., -1.]
+    assert list(r.v2) == [0., 20., 0., 30., 40.]
+
+def _rec2csv_text(r, **kwargs):
+    fname = tempfile.mktemp(suffix='.csv')
+    try:
+        mlab.rec2csv(r, fname, **kwargs)
+        return open(fname, 'rb').read()
+    finally:
+        os.remove(fname)
+
+def test_rec2csv_columns():
+    import datetime
+    r = np.rec.fromarrays([np.array([1, 2, 3]),
+                           np.array([0.5, np.nan, 1e-5]),
+                           np.array([True, False, True]),
+                           np.array(['a', 'b,c', 'say "d"']),
+                           np.array([datetime.date(2010, 1, 2)]*3,
+                                    dtype=object)],
+                          names='i,x,ok,s,d')
+    assert _rec2csv_text(r) == ('i,x,ok,s,d\r\n'
+                                '1,0.5,True,a,2010-01-02\r\n'
+                                '2,nan,False,"b,c",2010-01-02\r\n'
+                                '3,1e-05,True,"say ""d""",2010-01-02\r\n')
+
+    # formats derived from the standard ones are used for each value
+    class Negative(mlab.FormatInt):
+        def tostr(self, x):
+            return '%d'%-x
+    formatd = dict(i=Negative(), x=mlab.FormatPercent(1),
+                   d=mlab.FormatDate('%d/%m/%Y'))
+    assert _rec2csv_text(r[:1], delimiter=' ', formatd=formatd,
+                         withheader=False) == '-1 0.5 True a 02/01/2010\r\n'
@@ -0,0 +1,28 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from nose.tools import assert_equal
+from matplotlib.figure import Figure
+from matplotlib.transforms import Affine2D
+
+def test_barbs_rotation():
+    # barbs with the same features are one polygon rotated to their angles
+    ax = Figure().add_subplot(111)
+    angles = np.linspace(0, 2 * np.pi, 7)
+    speeds = np.array([65, 65, 65, 20, 20, 2, 115])
+    u = speeds * np.cos(angles)
+    v = speeds * np.sin(angles)
+    barbs = ax.barbs(np.arange(7), np.zeros(7), u, v)
+    verts = [path.vertices[:-1] for path in barbs.get_paths()]
+    assert_equal( [len(vert) for vert in verts], [10, 10, 10, 7, 7, 42, 13] )
+
+    for i, j in [(0, 1), (0, 2), (3, 4)]:
+        rotate = Affine2D().rotate(angles[j] - angles[i])
+        assert_array_almost_equal(rotate.transform(verts[i]), verts[j])
+
+    # a barb pointing down the y-axis is not rotated
+    staff = ax.barbs([0], [0], [0], [-65]).get_paths()[0].vertices
+    assert_array_almost_equal(staff[:2], [[0, 0], [0, 7]])
+
+    # empty barbs are circles
+    assert_array_almost_equal(np.hypot(verts[5][:, 0], verts[5][:, 1]),
+                              np.ones(42) * 7 * 0.15)
@@ -0,0 +1,61 @@
+import numpy as np
+import matplotlib.ticker as mticker
+from nose.tools import assert_equal
+
+def _labels(formatter, locs):
+    # the labels made one tick at a time, as before format_ticks
+    formatter.set_locs(locs)
+    return [formatter(x, i) for i, x in enumerate(locs)]
+
+def _check_format_ticks(formatter, locs, vmin, vmax):
+    formatter.create_dummy_axis()
+    formatter.set_bounds(vmin, vmax)
+    expected = _labels(formatter, locs)
+    assert_equal( formatter.format_ticks(locs), expected )
+
+def test_format_ticks():
+    for locs in ([-1.0, -0.5, 0.0, 0.5, 1.0],
+                 np.arange(1e5, 1e5 + 5e-3, 1e-3),
+                 np.linspace(-3e-7, 3e-7, 7),
+                 np.linspace(1e9, 5e9, 5)):
+        _check_format_ticks(mticker.ScalarFormatter(), locs, locs[0], locs[-1])
+        _check_format_ticks(mticker.ScalarFormatter(useMathText=True),
+                            locs, locs[0], locs[-1])
+        _check_format_ticks(mticker.EngFormatter(unit='Hz', places=1),
+                            locs, locs[0], locs[-1])
+        _check_format_ticks(mticker.EngFormatter(places=0),
+                            locs, locs[0], locs[-1])
+
+    locs = [0, 1e-3, 2e-3, 0.01, 0.05, 0.1, 1, 20, 100, 1e4, 1e5, -10]
+    for labelOnlyBase in (True, False):
+        for cls in (mticker.LogFormatter, mticker.LogFormatterExponent,
+                    mticker.LogFormatterMathtext):
+            _check_format_ticks(cls(labelOnlyBase=labelOnlyBase),
+                                locs, 1e-3, 1e5)
+        _check_format_ticks(mticker.LogFormatter(base=2,
+                                                 labelOnlyBase=labelOnlyBase),
+                            [0.25, 0.5, 1, 3, 4, 1024], 0.25, 1024)
+
+    formatter = mticker.LogFormatterMathtext()
+    assert_equal( formatter.format_ticks([0, 0.01, 1, 1000, -100, 20]),
+                  ['$0$', r'$\mathdefault{10^{-2}}$', r'$\mathdefault{10^{0}}$',
+                   r'$\mathdefault{10^{3}}$', r'$\mathdefault{-10^{2}}$',
+                   ''] )
+
+def test_format_ticks_override():
+    # a derived class formatting single ticks is still used per tick
+    class PlusFormatter(mticker.ScalarFormatter):
+        def __call__(self, x, pos=None):
+            return '+' + mticker.ScalarFormatter.__call__(self, x, pos)
+
+    formatter = PlusFormatter()
+    formatter.create_dummy_axis()
+    formatter.set_bounds(0, 2)
+    assert_equal( formatter.format_ticks([0, 1, 2]), ['+0', '+1', '+2'] )
+
+    formatter = mticker.FixedFormatter(['a', 'b'])
+    assert_equal( formatter.format_ticks([5, 6, 7]), ['a', 'b', ''] )
+
+if __name__=='__main__':
+    import nose
+    nose.runmodule(argv=['-s','--with-doctest'], exit=False)
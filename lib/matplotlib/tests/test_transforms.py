@@ -1,6 +1,8 @@
 from nose.tools import assert_equal
 from numpy.testing import assert_almost_equal
-from matplotlib.transforms import Affine2D
+from matplotlib.transforms import Affine2D, TransformedPath
+from matplotlib.path import Path
+from matplotlib.figure import Figure
 import numpy as np
 
 def test_Affine2D_from_values():
@@ -38,3 +40,121 @@ def test_Affine2D_from_values():
     actual = t.transform(points)
     expected = np.array( [[0,6],[0,6],[0,6]] )
     assert_almost_equal(actual,expected)
+
+def test_affine_only_invalidation():
+    fig = Figure()
+    ax = fig.add_subplot(111)
+    ax.set_xscale('log')
+    ax.set_xlim(1, 100)
+    path = Path([[1, 0], [10, 0.5], [100, 1]])
+    tpath = TransformedPath(path, ax.transData)
+    points, affine = tpath.get_transformed_path_and_affine()
+    assert_almost_equal(affine.transform(points.vertices),
+                        ax.transData.transform(path.vertices))
+
+    # panning only changes the affine part
+    ax.set_xlim(10, 1000)
+    ax.set_ylim(-1, 2)
+    points2, affine = tpath.get_transformed_path_and_affine()
+    assert points2 is points
+    assert_almost_equal(affine.transform(points.vertices),
+                        ax.transData.transform(path.vertices))
+
+    ax.set_xscale('linear')
+    points3, affine = tpath.get_transformed_path_and_affine()
+    assert points3 is not points
+    assert_almost_equal(affine.transform(points3.vertices),
+                        ax.transData.transform(path.vertices))
+
+def test_polar_rmin_invalidation():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    def render(redraw):
+        fig = Figure(figsize=(4, 4))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111, polar=True)
+        theta = np.linspace(0, 2 * np.pi, 50)
+        ax.plot(theta, 1 + 3 * theta / (2 * np.pi))
+        ax.fill(theta, 2 + np.cos(theta), alpha=0.5)
+        ax.scatter(theta[::5], 2 + np.sin(theta[::5]))
+        if redraw:
+            canvas.draw()
+        # the polar projection reads rmin from the view limits
+        ax.set_ylim(1, 4)
+        canvas.draw()
+        return canvas.tostring_rgb()
+
+    assert render(True) == render(False)
+
+def test_mollweide_transform():
+    from matplotlib.projections.geo import MollweideAxes
+    transform = MollweideAxes.MollweideTransform(1)
+    ll = np.array([[0, 0], [np.pi, 0], [-np.pi / 2, np.pi / 2],
+                   [np.pi / 4, -np.pi / 2], [1.0, 0.5], [-2.0, -1.2]])
+    xy = transform.transform(ll)
+    assert_almost_equal(xy[:4], [[0, 0], [2 * np.sqrt(2), 0],
+                                 [0, np.sqrt(2)], [0, -np.sqrt(2)]])
+    # the auxiliary angle solves 2 aux + sin(2 aux) = pi sin(latitude)
+    aux = np.arcsin(xy[4:, 1] / np.sqrt(2))
+    assert_almost_equal(2 * aux + np.sin(2 * aux), np.pi * np.sin(ll[4:, 1]),
+                        decimal=3)
+    assert_almost_equal(xy[4:, 0], 2 * np.sqrt(2) * ll[4:, 0] * np.cos(aux) / np.pi)
+
+def test_interpolated_transformed():
+    def polar(tr):
+        return np.column_stack([tr[:, 1] * np.cos(tr[:, 0]),
+                                tr[:, 1] * np.sin(tr[:, 0])])
+
+    # straight images get no new vertices
+    path = Path([[0, 0], [0, 1], [0, 2]])
+    assert_equal( len(path.interpolated_transformed(polar, 64).vertices), 3 )
+
+    # a circle is subdivided up to the given number of steps
+    path = Path([[0, 1], [np.pi, 1], [2 * np.pi, 1]],
+                [Path.MOVETO, Path.LINETO, Path.LINETO])
+    ipath = path.interpolated_transformed(polar, 16, tolerance=1e-3)
+    assert_equal( len(ipath.vertices), 33 )
+    assert_almost_equal(np.hypot(ipath.vertices[:, 0], ipath.vertices[:, 1]),
+                        np.ones(33))
+    assert_equal( list(ipath.codes), [Path.MOVETO] + [Path.LINETO] * 32 )
+
+    # fewer where the error allows, and never across a move
+    path = Path([[0, 1], [np.pi, 1], [0, 2], [0.1, 2]],
+                [Path.MOVETO, Path.LINETO, Path.MOVETO, Path.LINETO])
+    ipath = path.interpolated_transformed(polar, 1000, tolerance=1e-3)
+    codes = list(ipath.codes)
+    assert_equal( codes.count(Path.MOVETO), 2 )
+    start = codes.index(Path.MOVETO, 1)
+    assert_almost_equal(ipath.vertices[start], [2, 0])
+    assert 10 < start < 100
+    assert_equal( len(ipath.vertices) - start, 2 )
+
+    # a segment whose image comes back to its chord at the midpoint is
+    # still subdivided: the Lambert equator starts and ends at the
+    # antipode of the centre, which maps next to the centre
+    from matplotlib.projections.geo import LambertAxes
+    lambert = LambertAxes.LambertTransform(0, 0, 64).transform
+    path = Path([[-np.pi, 0], [np.pi, 0]])
+    ipath = path.interpolated_transformed(lambert, 64)
+    assert len(ipath.vertices) > 16
+    assert_almost_equal(ipath.vertices[:, 1], np.zeros(len(ipath.vertices)))
+    assert ipath.vertices[:, 0].min() < -1.9
+    assert ipath.vertices[:, 0].max() > 1.9
+
+def test_affine_transform_path():
+    path = Path([[0, 0], [1, 0], [np.nan, 1]], _interpolation_steps=3)
+    assert not hasattr(path, '__dict__')
+
+    trans = Affine2D().scale(2, 3).translate(1, 1)
+    expected = Path(trans.transform(path.vertices), path.codes, 3)
+    for tpath in (trans.transform_path(path), path.transformed(trans)):
+        assert_almost_equal(tpath.vertices, expected.vertices)
+        assert_equal( tpath.codes, None )
+        assert tpath.has_nonfinite and expected.has_nonfinite
+        assert_equal( tpath.should_simplify, expected.should_simplify )
+        assert_equal( tpath._interpolation_steps, 3 )
+
+    # unit stars are cached apart from unit polygons
+    star = Path.unit_regular_star(7)
+    assert Path.unit_regular_star(7) is star
+    assert Path.unit_regular_polygon(7) is not star
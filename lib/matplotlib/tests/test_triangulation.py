@@ -0,0 +1,74 @@
+import numpy as np
+from nose.tools import assert_equal
+# matplotlib.tri is imported by matplotlib.axes, which it imports itself
+import matplotlib.axes
+import matplotlib.tri as mtri
+
+def _find_brute_force(triang, x, y, tol):
+    # all unmasked triangles containing each point, to within tol
+    tris = triang.triangles
+    xt = triang.x[tris]
+    yt = triang.y[tris]
+    inside = np.ones((len(x), len(tris)), bool)
+    for i in range(3):
+        x0, y0 = xt[:, i], yt[:, i]
+        x1, y1 = xt[:, (i+1)%3], yt[:, (i+1)%3]
+        cross = (x1-x0)*(y[:, None]-y0) - (y1-y0)*(x[:, None]-x0)
+        inside &= cross >= -tol
+    if triang.mask is not None:
+        inside &= ~triang.mask
+    return inside
+
+def test_trifinder():
+    np.random.seed(19680801)
+    x = np.random.uniform(-1, 1, 200)
+    y = np.random.uniform(-1, 1, 200)
+    triang = mtri.Triangulation(x, y)
+    trifinder = triang.get_trifinder()
+    assert trifinder is triang.get_trifinder()
+
+    # random points, the triangulation's points and a point outside
+    xs = np.r_[np.random.uniform(-1.2, 1.2, 2000), x, 5]
+    ys = np.r_[np.random.uniform(-1.2, 1.2, 2000), y, 0]
+    for mask in (None, np.arange(len(triang.triangles)) % 3 == 0):
+        triang.set_mask(mask)
+        trifinder = triang.get_trifinder()
+        tris = trifinder(xs, ys)
+        found = tris >= 0
+        inside = _find_brute_force(triang, xs, ys, 1e-12)
+        assert inside[found, tris[found]].all()
+        inside = _find_brute_force(triang, xs, ys, -1e-12)
+        assert not inside[~found].any()
+    assert_equal( trifinder([np.nan], [0]).tolist(), [-1] )
+
+    # same shape as the input
+    assert_equal( trifinder(xs[:2000].reshape(20, 100),
+                            ys[:2000].reshape(20, 100)).shape, (20, 100) )
+
+def test_trifinder_shared_edges():
+    # points on the edges and corners of a grid of squares split into
+    # triangles are always found in one of them
+    x, y = np.meshgrid(np.linspace(0, 1, 11), np.linspace(0, 1, 11))
+    x = x.ravel()
+    y = y.ravel()
+    triang = mtri.Triangulation(x, y)
+    xs, ys = np.meshgrid(np.linspace(0, 1, 101), np.linspace(0, 1, 101))
+    tris = triang.get_trifinder()(xs, ys)
+    assert (tris >= 0).all()
+
+def test_triangulation_cached():
+    x = [0, 1, 0, 1]
+    y = [0, 0, 1, 1]
+    triang = mtri.Triangulation(x, y, [[0, 1, 2], [1, 3, 2]], [True, False])
+    masked = triang.get_masked_triangles()
+    assert masked is triang.get_masked_triangles()
+    assert_equal( masked.tolist(), [[1, 3, 2]] )
+    assert_equal( triang.get_trifinder()([0.2, 0.8], [0.2, 0.8]).tolist(),
+                  [-1, 1] )
+    assert_equal( triang.neighbors.tolist(), [[-1, -1, -1], [-1, -1, -1]] )
+
+    triang.set_mask(None)
+    assert_equal( len(triang.get_masked_triangles()), 2 )
+    assert_equal( triang.get_trifinder()([0.2, 0.8], [0.2, 0.8]).tolist(),
+                  [0, 1] )
+    assert_equal( triang.neighbors.tolist(), [[-1, 1, -1], [-1, -1, 0]] )
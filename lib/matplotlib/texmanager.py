@@ -33,7 +33,7 @@ or include these two lines in your script::
 
 """
 
-import copy, glob, os, shutil, sys, warnings
+import copy, glob, os, shutil, sys, threading, warnings
 from subprocess import Popen, PIPE, STDOUT
 
 try:
@@ -54,6 +54,23 @@ DEBUG = False
 if sys.platform.startswith('win'): cmd_split = '&'
 else: cmd_split = ';'
 
+# the tex cache directory is shared by every TexManager in the
+# process; generating its files is serialized so that concurrent
+# renderers never see a partially written tex, dvi or png file
+_texcache_lock = threading.RLock()
+
+def _texcache_locked(meth):
+    'decorator serializing *meth* on the shared tex cache'
+    def locked(*args, **kwargs):
+        _texcache_lock.acquire()
+        try:
+            return meth(*args, **kwargs)
+        finally:
+            _texcache_lock.release()
+    locked.__name__ = meth.__name__
+    locked.__doc__ = meth.__doc__
+    return locked
+
 def dvipng_hack_alpha():
     p = Popen('dvipng -version', shell=True, stdin=PIPE, stdout=PIPE,
         stderr=STDOUT, close_fds=(sys.platform!='win32'))
@@ -220,6 +237,7 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
         command.extend(args)
         return ' && '.join(command)
 
+    @_texcache_locked
     def make_tex(self, tex, fontsize):
         """
         Generate a tex file to render the tex string at a specific font size
@@ -270,6 +288,7 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
 
     _re_vbox = re.compile(r"MatplotlibBox:\(([\d.]+)pt\+([\d.]+)pt\)x([\d.]+)pt")
 
+    @_texcache_locked
     def make_tex_preview(self, tex, fontsize):
         """
         Generate a tex file to render the tex string at a specific
@@ -333,6 +352,7 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
         return texfile
 
 
+    @_texcache_locked
     def make_dvi(self, tex, fontsize):
         """
         generates a dvi file containing latex's layout of tex string
@@ -380,6 +400,7 @@ string:\n%s\nHere is the full report generated by LaTeX: \n\n'% repr(tex)) + rep
         return dvifile
 
 
+    @_texcache_locked
     def make_dvi_preview(self, tex, fontsize):
         """
         generates a dvi file containing latex's layout of tex
@@ -428,6 +449,7 @@ string:\n%s\nHere is the full report generated by LaTeX: \n\n'% repr(tex)) + rep
 
         return dvifile
 
+    @_texcache_locked
     def make_png(self, tex, fontsize, dpi):
         """
         generates a png file containing latex's rendering of tex string
@@ -463,6 +485,7 @@ process the following file:\n%s\nHere is the full report generated by dvipng: \
 
         return pngfile
 
+    @_texcache_locked
     def make_ps(self, tex, fontsize):
         """
         generates a postscript file containing latex's rendering of tex string
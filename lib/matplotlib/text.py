@@ -265,7 +265,7 @@ class Text(Artist):
         multile-alignment information. Note that it returns a extent
         of a rotated text when necessary.
         """
-        key = self.get_prop_tup()
+        key = self._get_layout_key()
         if key in self.cached: return self.cached[key]
 
         horizLayout = []
@@ -687,6 +687,18 @@ class Text(Artist):
                 self.figure.dpi, id(self._renderer),
                 )
 
+    def _get_layout_key(self):
+        # the layout is relative to the text position and does not
+        # depend on the color, so texts which only differ in those
+        # share it
+        return (self.get_text(),
+                self._verticalalignment, self._horizontalalignment,
+                self._multialignment, self._linespacing,
+                hash(self._fontproperties),
+                self._rotation, self._rotation_mode,
+                self.figure.dpi, id(self._renderer),
+                )
+
     def get_text(self):
         "Get the text as string"
         return self._text
@@ -101,7 +101,10 @@ axis.
 
 You can derive your own formatter from the Formatter base class by
 simply overriding the ``__call__`` method.  The formatter class has access
-to the axis view and data limits.
+to the axis view and data limits.  The axis gets all its tick labels at
+once from the ``format_ticks`` method, which by default calls the
+formatter for each tick; the formatters above override it to format
+all the ticks with array operations.
 
 To control the major and minor tick label formats, use one of the
 following methods::
@@ -178,6 +181,16 @@ class Formatter(TickHelper):
         'Return the format for tick val x at position pos; pos=None indicated unspecified'
         raise NotImplementedError('Derived must overide')
 
+    def format_ticks(self, values):
+        """
+        Return the tick labels for all the tick locations *values*,
+        after passing them to :meth:`set_locs`.  This calls the
+        formatter for each tick; derived classes may override it to
+        format all the ticks at once.
+        """
+        self.set_locs(values)
+        return [self(x, i) for i, x in enumerate(values)]
+
     def format_data(self,value):
         return self.__call__(value)
 
@@ -482,6 +495,20 @@ class ScalarFormatter(Formatter):
         elif self._useMathText:
             self.format = '$\mathdefault{%s}$' % self.format
 
+    def format_ticks(self, values):
+        'Return the tick labels for all the tick locations *values*'
+        if cbook.overrides(self, ScalarFormatter, '__call__', 'pprint_val',
+                           'fix_minus'):
+            return Formatter.format_ticks(self, values)
+        self.set_locs(values)
+        if len(values)==0:
+            return []
+        xp = (np.asarray(values, float)-self.offset)/10**self.orderOfMagnitude
+        xp[np.absolute(xp) < 1e-8] = 0
+        fmt = self.format
+        minus = self.fix_minus('-')
+        return [(fmt % x).replace('-', minus) for x in xp.tolist()]
+
     def pprint_val(self, x):
         xp = (x-self.offset)/10**self.orderOfMagnitude
         if np.absolute(xp) < 1e-8: xp = 0
@@ -538,23 +565,52 @@ class LogFormatter(Formatter):
 
     def __call__(self, x, pos=None):
         'Return the format for tick val *x* at position *pos*'
+        return self._format_log([x])[0]
+
+    def format_ticks(self, values):
+        'Return the tick labels for all the tick locations *values*'
+        if cbook.overrides(self, LogFormatter, '__call__'):
+            return Formatter.format_ticks(self, values)
+        self.set_locs(values)
+        if len(values)==0:
+            return []
+        return self._format_log(values)
+
+    def _log_decades(self, values):
+        """
+        Return the *values* and their logarithms in the base as lists,
+        and a list of the nearest integer logarithms, or *None* for the
+        values which are not decades.  Zero values have a logarithm
+        of 0.
+        """
+        x = np.asarray(values, float)
+        fx = np.zeros(x.shape, float)
+        nonzero = x != 0
+        fx[nonzero] = np.log(np.absolute(x[nonzero]))/math.log(self._base)
+        nearest = np.where(fx > 0, np.floor(fx+0.5), np.ceil(fx-0.5))
+        decades = [None] * len(x)
+        for i in np.nonzero(np.absolute(fx-nearest) < 1e-10)[0]:
+            decades[i] = long(nearest[i])
+        return x.tolist(), fx.tolist(), decades
+
+    def _format_log(self, values):
+        'Return the labels for the sequence of tick values *values*'
         vmin, vmax = self.axis.get_view_interval()
         d = abs(vmax - vmin)
-        b = self._base
-        if x == 0.0:
-            return '0'
-        sign = np.sign(x)
-        # only label the decades
-        fx = math.log(abs(x))/math.log(b)
-        isDecade = self.is_decade(fx)
-        if not isDecade and self.labelOnlyBase: s = ''
-        elif x>10000: s= '%1.0e'%x
-        elif x<1: s =  '%1.0e'%x
-        else        : s =  self.pprint_val(x, d)
-        if sign == -1:
-            s =  '-%s' % s
-
-        return self.fix_minus(s)
+        labels = []
+        for x, fx, decade in zip(*self._log_decades(values)):
+            if x == 0.0:
+                labels.append('0')
+                continue
+            # only label the decades
+            if decade is None and self.labelOnlyBase: s = ''
+            elif x>10000: s= '%1.0e'%x
+            elif x<1: s =  '%1.0e'%x
+            else        : s =  self.pprint_val(x, d)
+            if x < 0:
+                s =  '-%s' % s
+            labels.append(self.fix_minus(s))
+        return labels
 
     def format_data(self, value):
         b = self.labelOnlyBase
@@ -604,31 +660,25 @@ class LogFormatterExponent(LogFormatter):
     Format values for log axis; using ``exponent = log_base(value)``
     """
 
-    def __call__(self, x, pos=None):
-        'Return the format for tick val *x* at position *pos*'
-
-
+    def _format_log(self, values):
+        'Return the labels for the sequence of tick values *values*'
         vmin, vmax = self.axis.get_view_interval()
         vmin, vmax = mtransforms.nonsingular(vmin, vmax, expander = 0.05)
         d = abs(vmax-vmin)
-        b=self._base
-        if x == 0:
-            return '0'
-        sign = np.sign(x)
-        # only label the decades
-        fx = math.log(abs(x))/math.log(b)
-        isDecade = self.is_decade(fx)
-        if not isDecade and self.labelOnlyBase: s = ''
-        #if 0: pass
-        elif fx>10000: s= '%1.0e'%fx
-        #elif x<1: s = '$10^{%d}$'%fx
-        #elif x<1: s =  '10^%d'%fx
-        elif fx<1: s =  '%1.0e'%fx
-        else        : s =  self.pprint_val(fx,d)
-        if sign == -1:
-            s =  '-%s' % s
-
-        return self.fix_minus(s)
+        labels = []
+        for x, fx, decade in zip(*self._log_decades(values)):
+            if x == 0:
+                labels.append('0')
+                continue
+            # only label the decades
+            if decade is None and self.labelOnlyBase: s = ''
+            elif fx>10000: s= '%1.0e'%fx
+            elif fx<1: s =  '%1.0e'%fx
+            else        : s =  self.pprint_val(fx,d)
+            if x < 0:
+                s =  '-%s' % s
+            labels.append(self.fix_minus(s))
+        return labels
 
 
 class LogFormatterMathtext(LogFormatter):
@@ -636,37 +686,35 @@ class LogFormatterMathtext(LogFormatter):
     Format values for log axis; using ``exponent = log_base(value)``
     """
 
-    def __call__(self, x, pos=None):
-        'Return the format for tick val *x* at position *pos*'
+    def _format_log(self, values):
+        'Return the labels for the sequence of tick values *values*'
         b = self._base
-        # only label the decades
-        if x == 0:
-            return '$0$'
-        sign = np.sign(x)
-        fx = math.log(abs(x))/math.log(b)
-        isDecade = self.is_decade(fx)
-
         usetex = rcParams['text.usetex']
+        labels = []
+        for x, fx, decade in zip(*self._log_decades(values)):
+            if x == 0:
+                labels.append('$0$')
+                continue
 
-        if sign == -1:
-            sign_string = '-'
-        else:
-            sign_string = ''
-
-        if not isDecade and self.labelOnlyBase: s = ''
-        elif not isDecade:
-            if usetex:
-                s = r'$%s%d^{%.2f}$'% (sign_string, b, fx)
-            else:
-                s = '$\mathdefault{%s%d^{%.2f}}$'% (sign_string, b, fx)
-        else:
-            if usetex:
-                s = r'$%s%d^{%d}$'% (sign_string, b, self.nearest_long(fx))
+            if x < 0:
+                sign_string = '-'
             else:
-                s = r'$\mathdefault{%s%d^{%d}}$'% (sign_string, b,
-                                                   self.nearest_long(fx))
+                sign_string = ''
 
-        return s
+            # only label the decades
+            if decade is None and self.labelOnlyBase: s = ''
+            elif decade is None:
+                if usetex:
+                    s = r'$%s%d^{%.2f}$'% (sign_string, b, fx)
+                else:
+                    s = '$\mathdefault{%s%d^{%.2f}}$'% (sign_string, b, fx)
+            else:
+                if usetex:
+                    s = r'$%s%d^{%d}$'% (sign_string, b, decade)
+                else:
+                    s = r'$\mathdefault{%s%d^{%d}}$'% (sign_string, b, decade)
+            labels.append(s)
+        return labels
 
 class EngFormatter(Formatter):
     """
@@ -703,6 +751,16 @@ class EngFormatter(Formatter):
         s = "%s%s" % (self.format_eng(x), self.unit)
         return self.fix_minus(s)
 
+    def format_ticks(self, values):
+        'Return the tick labels for all the tick locations *values*'
+        if cbook.overrides(self, EngFormatter, '__call__', 'format_eng'):
+            return Formatter.format_ticks(self, values)
+        self.set_locs(values)
+        format_str = self._get_format_str()
+        return [self.fix_minus("%s%s" % (self._format_eng(x, format_str),
+                                         self.unit))
+                for x in values]
+
     def format_eng(self, num):
         """ Formats a number in engineering notation, appending a letter
         representing the power of 1000 of the original number. Some examples:
@@ -722,7 +780,18 @@ class EngFormatter(Formatter):
 
         @return: engineering formatted string
         """
+        return self._format_eng(num, self._get_format_str())
+
+    def _get_format_str(self):
+        if self.places is None:
+            format_str = u"%g %s"
+        elif self.places == 0:
+            format_str = u"%i %s"
+        elif self.places > 0:
+            format_str = (u"%%.%if %%s" % self.places)
+        return format_str
 
+    def _format_eng(self, num, format_str):
         dnum = decimal.Decimal(str(num))
 
         sign = 1
@@ -732,7 +801,9 @@ class EngFormatter(Formatter):
             dnum = -dnum
 
         if dnum != 0:
-            pow10 = decimal.Decimal(int(math.floor(dnum.log10()/3)*3))
+            # the adjusted exponent is floor(log10(dnum)), without
+            # computing the logarithm
+            pow10 = decimal.Decimal((dnum.adjusted()//3)*3)
         else:
             pow10 = decimal.Decimal(0)
 
@@ -743,13 +814,6 @@ class EngFormatter(Formatter):
 
         mant = sign*dnum/(10**pow10)
 
-        if self.places is None:
-            format_str = u"%g %s"
-        elif self.places == 0:
-            format_str = u"%i %s"
-        elif self.places > 0:
-            format_str = (u"%%.%if %%s" % self.places)
-
         formatted = format_str % (mant, prefix)
 
         return formatted.strip()
@@ -42,7 +42,7 @@ except NameError:
     from sets import Set as set
 
 import cbook
-from path import Path
+from path import Path, PackedPaths
 from _path import count_bboxes_overlapping_bbox, update_path_extents
 
 DEBUG = False
@@ -63,7 +63,8 @@ class TransformNode(object):
 
     # Invalidation may affect only the affine part.  If the
     # invalidation was "affine-only", the _invalid member is set to
-    # INVALID_AFFINE_ONLY
+    # INVALID_AFFINE, so that caches of the non-affine part (see
+    # TransformedPath) stay valid
     INVALID_NON_AFFINE = 1
     INVALID_AFFINE     = 2
     INVALID            = INVALID_NON_AFFINE | INVALID_AFFINE
@@ -102,26 +103,42 @@ class TransformNode(object):
         ancestors.  Should be called any time the transform changes.
         """
         # If we are an affine transform being changed, we can set the
-        # flag to INVALID_AFFINE_ONLY
+        # flag to INVALID_AFFINE
         value = (self.is_affine) and self.INVALID_AFFINE or self.INVALID
 
         # Shortcut: If self is already invalid, that means its parents
         # are as well, so we don't need to do anything.
-        if self._invalid == value:
+        if self._invalid | value == self._invalid and not self.pass_through:
             return
 
         if not len(self._parents):
-            self._invalid = value
+            self._invalid |= value
             return
 
         # Invalidate all ancestors of self using pseudo-recursion.
-        stack = [self]
+        # Each parent decides how much of itself the change of its
+        # child invalidates; see _get_invalidation.
+        stack = [(self, value)]
         while len(stack):
-            root = stack.pop()
+            root, value = stack.pop()
             # Stop at subtrees that have already been invalidated
-            if root._invalid != value or root.pass_through:
-                root._invalid = self.INVALID
-                stack.extend(root._parents.keys())
+            if root._invalid | value != root._invalid or root.pass_through:
+                root._invalid |= value
+                for parent in root._parents.keys():
+                    stack.append(
+                        (parent, parent._get_invalidation(root, value)))
+
+    def _get_invalidation(self, child, value):
+        """
+        Return how much of this node is invalidated when its *child*
+        was invalidated by *value*.
+
+        The non-affine part of a non-affine node may depend on all of
+        its children, so it is invalidated in full by default.
+        """
+        if self.is_affine:
+            return self.INVALID_AFFINE
+        return self.INVALID
 
     def set_children(self, *children):
         """
@@ -1265,6 +1282,10 @@ class TransformWrapper(Transform):
         self._set(child)
         self._invalid = 0
 
+    def _get_invalidation(self, child, value):
+        # the wrapper is its child, so it is invalidated alike
+        return value
+
     def __repr__(self):
         return "TransformWrapper(%r)" % self._child
     __str__ = __repr__
@@ -1343,6 +1364,16 @@ class AffineBase(Transform):
         return points
     transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
 
+    def transform_path(self, path):
+        # an affine transform keeps the vertices finite and the codes
+        # unchanged, so the checks of the Path constructor are skipped
+        return Path._fast_from_codes_and_verts(
+            self.transform(path.vertices), path.codes,
+            {'should_simplify': path.should_simplify,
+             'has_nonfinite': path.has_nonfinite,
+             'interpolation_steps': path._interpolation_steps})
+    transform_path.__doc__ = Transform.transform_path.__doc__
+
     def transform_path_affine(self, path):
         return self.transform_path(path)
     transform_path_affine.__doc__ = Transform.transform_path_affine.__doc__
@@ -1887,6 +1918,16 @@ class CompositeGenericTransform(Transform):
         self._a = a
         self._b = b
         self.set_children(a, b)
+        self._affine = None
+
+    def _get_invalidation(self, child, value):
+        # The non-affine part is that of *a* if *b* is affine, and
+        # that of *b* applied to all of *a* otherwise, so any change
+        # of *a* then changes it as well.
+        if (value == self.INVALID_AFFINE and child is self._a
+            and not self._b.is_affine):
+            return self.INVALID
+        return value
 
     def frozen(self):
         self._invalid = 0
@@ -1920,6 +1961,8 @@ class CompositeGenericTransform(Transform):
     def transform_non_affine(self, points):
         if self._a.is_affine and self._b.is_affine:
             return points
+        elif self._b.is_affine:
+            return self._a.transform_non_affine(points)
         return self._b.transform_non_affine(
             self._a.transform(points))
     transform_non_affine.__doc__ = Transform.transform_non_affine.__doc__
@@ -1930,23 +1973,26 @@ class CompositeGenericTransform(Transform):
     transform_path.__doc__ = Transform.transform_path.__doc__
 
     def transform_path_affine(self, path):
-        return self._b.transform_path_affine(
-            self._a.transform_path(path))
+        return self.get_affine().transform_path_affine(path)
     transform_path_affine.__doc__ = Transform.transform_path_affine.__doc__
 
     def transform_path_non_affine(self, path):
         if self._a.is_affine and self._b.is_affine:
             return path
+        elif self._b.is_affine:
+            return self._a.transform_path_non_affine(path)
         return self._b.transform_path_non_affine(
             self._a.transform_path(path))
     transform_path_non_affine.__doc__ = Transform.transform_path_non_affine.__doc__
 
     def get_affine(self):
-        if self._a.is_affine and self._b.is_affine:
-            return Affine2D(np.dot(self._b.get_affine().get_matrix(),
-                                    self._a.get_affine().get_matrix()))
-        else:
+        if not self._b.is_affine:
             return self._b.get_affine()
+        if self._invalid or self._affine is None:
+            self._affine = Affine2D(np.dot(self._b.get_affine().get_matrix(),
+                                           self._a.get_affine().get_matrix()))
+            self._invalid = 0
+        return self._affine
     get_affine.__doc__ = Transform.get_affine.__doc__
 
     def inverted(self):
@@ -2220,14 +2266,14 @@ class TransformedPath(TransformNode):
         self._transformed_path = None
         self._transformed_points = None
 
+    def _get_invalidation(self, child, value):
+        # only a change of the non-affine part needs a new copy
+        return value
+
     def _revalidate(self):
-        if ((self._invalid & self.INVALID_NON_AFFINE == self.INVALID_NON_AFFINE)
-            or self._transformed_path is None):
-            self._transformed_path = \
-                self._transform.transform_path_non_affine(self._path)
-            self._transformed_points = \
-                Path(self._transform.transform_non_affine(self._path.vertices),
-                     None, self._path._interpolation_steps)
+        if self._invalid & self.INVALID_NON_AFFINE == self.INVALID_NON_AFFINE:
+            self._transformed_path = None
+            self._transformed_points = None
         self._invalid = 0
 
     def get_transformed_points_and_affine(self):
@@ -2239,6 +2285,10 @@ class TransformedPath(TransformNode):
         be performed.
         """
         self._revalidate()
+        if self._transformed_points is None:
+            self._transformed_points = \
+                Path(self._transform.transform_non_affine(self._path.vertices),
+                     None, self._path._interpolation_steps)
         return self._transformed_points, self.get_affine()
 
     def get_transformed_path_and_affine(self):
@@ -2248,18 +2298,66 @@ class TransformedPath(TransformNode):
         the path necessary to complete the transformation.
         """
         self._revalidate()
+        if self._transformed_path is None:
+            self._transformed_path = \
+                self._transform.transform_path_non_affine(self._path)
         return self._transformed_path, self.get_affine()
 
     def get_fully_transformed_path(self):
         """
         Return a fully-transformed copy of the child path.
         """
+        tpath, affine = self.get_transformed_path_and_affine()
+        return self._transform.transform_path_affine(tpath)
+
+    def get_affine(self):
+        return self._transform.get_affine()
+
+
+class TransformedPaths(TransformNode):
+    """
+    A :class:`TransformedPaths` caches non-affine transformed copies
+    of a sequence of :class:`~matplotlib.path.Path` instances, as
+    :class:`TransformedPath` does for a single path.  The copies are
+    only remade when the non-affine part of the transform changes.
+    """
+    def __init__(self, paths, transform):
+        """
+        Create a new :class:`TransformedPaths` from the given sequence
+        of :class:`~matplotlib.path.Path` instances and
+        :class:`Transform`.
+        """
+        assert isinstance(transform, Transform)
+        TransformNode.__init__(self)
+
+        self._paths = paths
+        self._transform = transform
+        self.set_children(transform)
+        self._transformed_paths = None
+
+    def _get_invalidation(self, child, value):
+        return value
+
+    def get_transformed_paths_and_affine(self):
+        """
+        Return a list of copies of the child paths, with the
+        non-affine part of the transform already applied, along with
+        the affine part necessary to complete the transformation.
+        The copies of a :class:`~matplotlib.path.PackedPaths` are
+        packed too.
+        """
         if ((self._invalid & self.INVALID_NON_AFFINE == self.INVALID_NON_AFFINE)
-            or self._transformed_path is None):
-            self._transformed_path = \
-                self._transform.transform_path_non_affine(self._path)
+            or self._transformed_paths is None):
+            transform = self._transform
+            if isinstance(self._paths, PackedPaths):
+                self._transformed_paths = \
+                    self._paths.transformed_non_affine(transform)
+            else:
+                self._transformed_paths = [
+                    transform.transform_path_non_affine(path)
+                    for path in self._paths]
         self._invalid = 0
-        return self._transform.transform_path_affine(self._transformed_path)
+        return self._transformed_paths, self.get_affine()
 
     def get_affine(self):
         return self._transform.get_affine()
@@ -3,6 +3,7 @@ Unstructured triangular grid functions.
 """
 
 from triangulation import *
+from trifinder import *
 from tricontour import *
 from tripcolor import *
 from triplot import *
@@ -2,6 +2,7 @@
 #include "src/mplutils.h"
 
 #include <algorithm>
+#include <cmath>
 #include <iostream>
 #include <set>
 
@@ -482,7 +483,7 @@ Py::Object Triangulation::set_mask(const Py::Tuple &args)
 
     Py_XDECREF(_mask);
     _mask = 0;
-    if (args[0] != Py::None())
+    if (args[0].ptr() != Py_None)
     {
         _mask = (PyArrayObject*)PyArray_ContiguousFromObject(
                     args[0].ptr(), PyArray_BOOL, 1, 1);
@@ -981,6 +982,204 @@ XY TriContourGenerator::interp(int point1,
 
 
 
+GridTriFinder::GridTriFinder(Py::Object triangulation)
+    : _triangulation(triangulation),
+      _x_scale(0.0),
+      _y_scale(0.0),
+      _ncolumns(0),
+      _nrows(0)
+{
+    _VERBOSE("GridTriFinder::GridTriFinder");
+    const Triangulation& triang = get_triangulation();
+
+    // Find the unmasked triangles that have an area, and their bounding box.
+    std::vector<int> tris;
+    BoundingBox bbox;
+    for (int tri = 0; tri < triang.get_ntri(); ++tri) {
+        if (triang.is_masked(tri))
+            continue;
+        XY point0 = triang.get_point_coords(triang.get_triangle_point(tri,0));
+        XY point1 = triang.get_point_coords(triang.get_triangle_point(tri,1));
+        XY point2 = triang.get_point_coords(triang.get_triangle_point(tri,2));
+        if (!((point1 - point0).cross_z(point2 - point0) > 0.0))
+            continue;  // Zero area or non-finite points.
+        bbox.add(point0);
+        bbox.add(point1);
+        bbox.add(point2);
+        tris.push_back(tri);
+    }
+
+    _cell_starts.assign(1, 0);
+    if (tris.empty())
+        return;
+
+    // About one cell per triangle, with cells about as wide as they are high.
+    _lower = bbox.lower;
+    _upper = bbox.upper;
+    double width = _upper.x - _lower.x;
+    double height = _upper.y - _lower.y;
+    int ntris = tris.size();
+    _ncolumns = int(std::max(1.0, std::min(double(ntris),
+                    ceil(sqrt(ntris*(width/height))))));
+    _nrows = (ntris + _ncolumns - 1) / _ncolumns;
+    _x_scale = _ncolumns / width;
+    _y_scale = _nrows / height;
+
+    /* Store each triangle in the cells its bounding box overlaps, counting
+     * the triangles in each cell on the first pass and storing them on the
+     * second. */
+    int ncells = _ncolumns*_nrows;
+    _cell_starts.assign(ncells + 1, 0);
+    std::vector<int> next;
+    for (int pass = 0; pass < 2; ++pass) {
+        for (std::vector<int>::const_iterator it = tris.begin();
+                it != tris.end(); ++it) {
+            BoundingBox tri_bbox;
+            for (int i = 0; i < 3; ++i)
+                tri_bbox.add(triang.get_point_coords(
+                                 triang.get_triangle_point(*it,i)));
+            int column0 = get_column(tri_bbox.lower.x);
+            int column1 = get_column(tri_bbox.upper.x);
+            int row1 = get_row(tri_bbox.upper.y);
+            for (int row = get_row(tri_bbox.lower.y); row <= row1; ++row) {
+                for (int column = column0; column <= column1; ++column) {
+                    int cell = row*_ncolumns + column;
+                    if (pass == 0)
+                        ++_cell_starts[cell+1];
+                    else
+                        _cell_triangles[next[cell]++] = *it;
+                }
+            }
+        }
+
+        if (pass == 0) {
+            for (int cell = 0; cell < ncells; ++cell)
+                _cell_starts[cell+1] += _cell_starts[cell];
+            _cell_triangles.resize(_cell_starts[ncells]);
+            next.assign(_cell_starts.begin(), _cell_starts.end() - 1);
+        }
+    }
+}
+
+GridTriFinder::~GridTriFinder()
+{
+    _VERBOSE("GridTriFinder::~GridTriFinder");
+}
+
+Py::Object GridTriFinder::find_many(const Py::Tuple &args)
+{
+    _VERBOSE("GridTriFinder::find_many");
+    args.verify_length(2);
+
+    PyArrayObject* x = (PyArrayObject*)PyArray_ContiguousFromObject(
+                           args[0].ptr(), PyArray_DOUBLE, 0, 0);
+    PyArrayObject* y = (PyArrayObject*)PyArray_ContiguousFromObject(
+                           args[1].ptr(), PyArray_DOUBLE, 0, 0);
+    if (x == 0 || y == 0 || !PyArray_SAMESHAPE(x, y)) {
+        Py_XDECREF(x);
+        Py_XDECREF(y);
+        throw Py::ValueError("x and y must be arrays of the same shape");
+    }
+
+    PyArrayObject* tris = (PyArrayObject*)PyArray_SimpleNew(
+                              PyArray_NDIM(x), PyArray_DIMS(x), PyArray_INT);
+    if (tris == 0) {
+        Py_DECREF(x);
+        Py_DECREF(y);
+        throw Py::MemoryError("Could not allocate triangle indices array");
+    }
+
+    const double* x_ptr = (const double*)PyArray_DATA(x);
+    const double* y_ptr = (const double*)PyArray_DATA(y);
+    int* tris_ptr = (int*)PyArray_DATA(tris);
+    npy_intp n = PyArray_SIZE(x);
+
+    // Only C++ data is used here, so other threads may run meanwhile.
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp i = 0; i < n; ++i)
+        tris_ptr[i] = find_one(XY(x_ptr[i], y_ptr[i]));
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(x);
+    Py_DECREF(y);
+    return Py::asObject((PyObject*)tris);
+}
+
+int GridTriFinder::find_one(const XY& xy) const
+{
+    int cell = get_cell(xy);
+    if (cell < 0)
+        return -1;
+    for (int i = _cell_starts[cell]; i < _cell_starts[cell+1]; ++i) {
+        if (triangle_contains(_cell_triangles[i], xy))
+            return _cell_triangles[i];
+    }
+    return -1;
+}
+
+int GridTriFinder::get_cell(const XY& xy) const
+{
+    // Written so that NaNs are outside the grid.
+    if (_ncolumns == 0 ||
+        !(xy.x >= _lower.x && xy.x <= _upper.x &&
+          xy.y >= _lower.y && xy.y <= _upper.y))
+        return -1;
+    return get_row(xy.y)*_ncolumns + get_column(xy.x);
+}
+
+int GridTriFinder::get_column(const double& x) const
+{
+    int column = int((x - _lower.x)*_x_scale);
+    return column < _ncolumns ? column : _ncolumns - 1;
+}
+
+int GridTriFinder::get_row(const double& y) const
+{
+    int row = int((y - _lower.y)*_y_scale);
+    return row < _nrows ? row : _nrows - 1;
+}
+
+const Triangulation& GridTriFinder::get_triangulation() const
+{
+    return *(Triangulation*)_triangulation.ptr();
+}
+
+void GridTriFinder::init_type()
+{
+    _VERBOSE("GridTriFinder::init_type");
+
+    behaviors().name("GridTriFinder");
+    behaviors().doc("GridTriFinder");
+
+    add_varargs_method("find_many", &GridTriFinder::find_many,
+                       "find_many(x, y)");
+}
+
+double GridTriFinder::orient(int point0, int point1, const XY& xy) const
+{
+    if (point0 > point1)
+        return -orient(point1, point0, xy);
+    const Triangulation& triang = get_triangulation();
+    XY start = triang.get_point_coords(point0);
+    return (triang.get_point_coords(point1) - start).cross_z(xy - start);
+}
+
+bool GridTriFinder::triangle_contains(int tri, const XY& xy) const
+{
+    // Triangle points are anticlockwise, so xy is to the left of each edge.
+    const Triangulation& triang = get_triangulation();
+    int point0 = triang.get_triangle_point(tri,0);
+    int point1 = triang.get_triangle_point(tri,1);
+    int point2 = triang.get_triangle_point(tri,2);
+    return orient(point0, point1, xy) >= 0.0 &&
+           orient(point1, point2, xy) >= 0.0 &&
+           orient(point2, point0, xy) >= 0.0;
+}
+
+
+
+
+
 #if defined(_MSC_VER)
 DL_EXPORT(void)
 #elif defined(__cplusplus)
@@ -1000,11 +1199,14 @@ TriModule::TriModule()
 {
     Triangulation::init_type();
     TriContourGenerator::init_type();
+    GridTriFinder::init_type();
 
     add_varargs_method("Triangulation", &TriModule::new_triangulation,
                        "Create and return new C++ Triangulation object");
     add_varargs_method("TriContourGenerator", &TriModule::new_tricontourgenerator,
                        "Create and return new C++ TriContourGenerator object");
+    add_varargs_method("GridTriFinder", &TriModule::new_gridtrifinder,
+                       "Create and return new C++ GridTriFinder object");
 
     initialize("Module for unstructured triangular grids");
 }
@@ -1037,7 +1239,7 @@ Py::Object TriModule::new_triangulation(const Py::Tuple &args)
 
     // Optional mask.
     PyArrayObject* mask = 0;
-    if (args[3].ptr() != 0 && args[3] != Py::None())
+    if (args[3].ptr() != 0 && args[3].ptr() != Py_None)
     {
         mask = (PyArrayObject*)PyArray_ContiguousFromObject(
                    args[3].ptr(), PyArray_BOOL, 1, 1);
@@ -1053,7 +1255,7 @@ Py::Object TriModule::new_triangulation(const Py::Tuple &args)
 
     // Optional edges.
     PyArrayObject* edges = 0;
-    if (args[4].ptr() != 0 && args[4] != Py::None())
+    if (args[4].ptr() != 0 && args[4].ptr() != Py_None)
     {
         edges = (PyArrayObject*)PyArray_ContiguousFromObject(
                     args[4].ptr(), PyArray_INT, 2, 2);
@@ -1069,7 +1271,7 @@ Py::Object TriModule::new_triangulation(const Py::Tuple &args)
 
     // Optional neighbors.
     PyArrayObject* neighbors = 0;
-    if (args[5].ptr() != 0 && args[5] != Py::None())
+    if (args[5].ptr() != 0 && args[5].ptr() != Py_None)
     {
         neighbors = (PyArrayObject*)PyArray_ContiguousFromObject(
                         args[5].ptr(), PyArray_INT, 2, 2);
@@ -1111,3 +1313,14 @@ Py::Object TriModule::new_tricontourgenerator(const Py::Tuple &args)
     return Py::asObject(new TriContourGenerator(tri, z));
 }
 
+Py::Object TriModule::new_gridtrifinder(const Py::Tuple &args)
+{
+    _VERBOSE("TriModule::new_gridtrifinder");
+    args.verify_length(1);
+
+    Py::Object tri = args[0];
+    if (!Triangulation::check(tri))
+        throw Py::ValueError("Expecting a C++ Triangulation object");
+
+    return Py::asObject(new GridTriFinder(tri));
+}
@@ -59,6 +59,16 @@
  * configurations to deal with, 2 of which do not have a contour line (all
  * points below or above (including the same as) the contour level) and 6 that
  * do.  See the function get_exit_edge for details.
+ *
+ * GridTriFinder
+ * -------------
+ * A GridTriFinder finds the triangles of a Triangulation that contain
+ * particular points.  The bounding box of the unmasked triangles is divided
+ * into a regular grid of about ntri cells, and each triangle is stored in
+ * every cell that its bounding box overlaps.  Finding a point is then a case
+ * of testing the few triangles stored in the cell that the point lies in.
+ * The test uses the same arithmetic for both triangles that share an edge,
+ * so that a point is never found to be outside both of them.
  */
 #ifndef _TRI_H
 #define _TRI_H
@@ -459,6 +469,69 @@ private:
 
 
 
+// Point location in a Triangulation using a grid of cells.
+class GridTriFinder : public Py::PythonExtension<GridTriFinder>
+{
+public:
+    /* Constructor.  Stores the unmasked triangles of the triangulation in the
+     * grid, so the GridTriFinder should be recreated if the mask changes.
+     *   triangulation: Triangulation to find triangles in. */
+    GridTriFinder(Py::Object triangulation);
+
+    virtual ~GridTriFinder();
+
+    /* Return the index of the triangle containing the specified point, or -1
+     * if no unmasked triangle contains it. */
+    int find_one(const XY& xy) const;
+
+    /* Find the triangles containing many points.
+     *   args[0]: double array x of point x-coordinates, of any shape.
+     *   args[1]: double array y of point y-coordinates, of the same shape.
+     * Returns int array of the same shape of triangle indices, or -1 for
+     * points that are not in any unmasked triangle. */
+    Py::Object find_many(const Py::Tuple &args);
+
+    // CXX initialisation function.
+    static void init_type();
+
+private:
+    /* Return the index of the grid cell containing the specified point, or -1
+     * if it is outside the grid. */
+    int get_cell(const XY& xy) const;
+
+    // Return the column or row of the grid cell containing x or y.
+    int get_column(const double& x) const;
+    int get_row(const double& y) const;
+
+    // Return the Triangulation object.
+    const Triangulation& get_triangulation() const;
+
+    /* Return the z-component of the cross product of the edge from point0 to
+     * point1 with the vector from point0 to xy, which is positive if xy is to
+     * the left of the edge.  The edge is always evaluated in the same
+     * direction whichever order the points are given in. */
+    double orient(int point0, int point1, const XY& xy) const;
+
+    // Indicates if the specified triangle contains the specified point.
+    bool triangle_contains(int tri, const XY& xy) const;
+
+    // Variables shared with python, always set.
+    Py::Object _triangulation;
+
+    // Variables internal to C++ only.
+    XY _lower, _upper;          // Bounds of the grid.
+    double _x_scale, _y_scale;  // Number of cells per unit x and y.
+    int _ncolumns, _nrows;
+
+    /* The triangles in cell i are _cell_triangles[_cell_starts[i]] to
+     * _cell_triangles[_cell_starts[i+1]-1]. */
+    std::vector<int> _cell_starts;     // Size _ncolumns*_nrows + 1.
+    std::vector<int> _cell_triangles;
+};
+
+
+
+
 // The extension module.
 class TriModule : public Py::ExtensionModule<TriModule>
 {
@@ -468,6 +541,7 @@ public:
 private:
     Py::Object new_triangulation(const Py::Tuple &args);
     Py::Object new_tricontourgenerator(const Py::Tuple &args);
+    Py::Object new_gridtrifinder(const Py::Tuple &args);
 };
 
 #endif
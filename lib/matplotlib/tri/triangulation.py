@@ -34,6 +34,11 @@ class Triangulation(object):
         triangle.  neighbors[i,j] is the triangle that is the neighbor
         to the edge from point index triangles[i,j] to point index
         triangles[i,(j+1)%3].
+
+    The edges, neighbors, unmasked triangles and the
+    :class:`~matplotlib.tri.TriFinder` returned by
+    :meth:`get_trifinder` are calculated when first needed, and kept
+    until the mask is changed by :meth:`set_mask`.
     """
     def __init__(self, x, y, triangles=None, mask=None):
         """
@@ -65,6 +70,8 @@ class Triangulation(object):
         self.mask = None
         self._edges = None
         self._neighbors = None
+        self._masked_triangles = None
+        self._trifinder = None
 
         if triangles is None:
             # No triangulation specified, so use matplotlib.delaunay.
@@ -117,10 +124,26 @@ class Triangulation(object):
         """
         Return an array of triangles that are not masked.
         """
-        if self.mask is not None:
-            return self.triangles.compress(1-self.mask, axis=0)
-        else:
+        if self.mask is None:
             return self.triangles
+        if self._masked_triangles is None:
+            self._masked_triangles = self.triangles.compress(1-self.mask,
+                                                             axis=0)
+        return self._masked_triangles
+
+    def get_trifinder(self):
+        """
+        Return the default :class:`~matplotlib.tri.TriFinder` of this
+        triangulation, a :class:`~matplotlib.tri.GridTriFinder`,
+        creating it if necessary.  It is called with arrays of x and
+        y coordinates to find the triangles containing them::
+
+          tri_indices = triangulation.get_trifinder()(x, y)
+        """
+        if self._trifinder is None:
+            from matplotlib.tri.trifinder import GridTriFinder
+            self._trifinder = GridTriFinder(self)
+        return self._trifinder
 
     @staticmethod
     def get_from_args_and_kwargs(*args, **kwargs):
@@ -193,7 +216,7 @@ class Triangulation(object):
     @property
     def neighbors(self):
         if self._neighbors is None:
-            self._neighbors = self._get_cpp_triangulation().get_neighbors()
+            self._neighbors = self.get_cpp_triangulation().get_neighbors()
         return self._neighbors
 
     def set_mask(self, mask):
@@ -217,3 +240,5 @@ class Triangulation(object):
         # Clear derived fields so they are recalculated when needed.
         self._edges = None
         self._neighbors = None
+        self._masked_triangles = None
+        self._trifinder = None
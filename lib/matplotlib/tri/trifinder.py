@@ -0,0 +1,58 @@
+import matplotlib._tri as _tri
+import numpy as np
+from matplotlib.tri.triangulation import Triangulation
+
+class TriFinder(object):
+    """
+    Abstract base class for classes used to find the triangles of a
+    Triangulation in which (x,y) points lie.
+
+    Rather than instantiate an object of a class derived from TriFinder,
+    it is usually better to use the function
+    :meth:`matplotlib.tri.Triangulation.get_trifinder`, which caches
+    one for the current mask.
+
+    Derived classes implement __call__(x,y) where x,y are array_like point
+    coordinates of the same shape.
+    """
+    def __init__(self, triangulation):
+        if not isinstance(triangulation, Triangulation):
+            raise ValueError('Expected a Triangulation object')
+        self._triangulation = triangulation
+
+    def __call__(self, x, y):
+        """
+        Return an array containing the indices of the triangles in which
+        the specified x,y points lie, or -1 for points that do not lie
+        within an unmasked triangle.  *x* and *y* are array_like
+        coordinates of the same shape, which is the shape of the
+        returned array.
+        """
+        raise NotImplementedError('Derived classes must override __call__')
+
+
+class GridTriFinder(TriFinder):
+    """
+    :class:`TriFinder` which divides the bounding box of the
+    triangulation into a regular grid of about as many cells as there
+    are triangles, and stores each triangle in the cells that its
+    bounding box overlaps.  A point is found by testing the few
+    triangles in its cell, so that finding many points takes time
+    proportional to the number of points.  Points on the edge shared
+    by two triangles are found in the one with the lower index.
+
+    The grid is made for the mask of the triangulation when the
+    GridTriFinder is created, so a new one is needed if the mask is
+    changed.
+    """
+    def __init__(self, triangulation):
+        TriFinder.__init__(self, triangulation)
+        self._cpp_trifinder = _tri.GridTriFinder(
+            triangulation.get_cpp_triangulation())
+
+    def __call__(self, x, y):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.shape != y.shape:
+            raise ValueError("x and y must be array_like with the same shape")
+        return self._cpp_trifinder.find_many(x, y)
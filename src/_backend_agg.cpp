@@ -1546,35 +1546,6 @@ RendererAgg::_draw_path_collection_generic
 }
 
 
-class PathListGenerator
-{
-    const Py::SeqBase<Py::Object>& m_paths;
-    size_t m_npaths;
-
-public:
-    typedef PathIterator path_iterator;
-
-    inline
-    PathListGenerator(const Py::SeqBase<Py::Object>& paths) :
-        m_paths(paths), m_npaths(paths.size())
-    {
-
-    }
-
-    inline size_t
-    num_paths() const
-    {
-        return m_npaths;
-    }
-
-    inline path_iterator
-    operator()(size_t i) const
-    {
-        return PathIterator(m_paths[i % m_npaths]);
-    }
-};
-
-
 Py::Object
 RendererAgg::draw_path_collection(const Py::Tuple& args)
 {
@@ -1584,8 +1555,7 @@ RendererAgg::draw_path_collection(const Py::Tuple& args)
     Py::Object gc_obj = args[0];
     GCAgg gc(gc_obj, dpi);
     agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[1].ptr());
-    Py::SeqBase<Py::Object> path   = args[2];
-    PathListGenerator       path_generator(path);
+    PathListGenerator       path_generator(args[2]);
     Py::SeqBase<Py::Object> transforms_obj   = args[3];
     Py::Object              offsets_obj      = args[4];
     agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[5].ptr());
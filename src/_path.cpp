@@ -504,7 +504,7 @@ _path_module::get_path_collection_extents(const Py::Tuple& args)
 
     //segments, trans, clipbox, colors, linewidths, antialiaseds
     agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[0].ptr());
-    Py::SeqBase<Py::Object> paths            = args[1];
+    PathListGenerator       paths(args[1]);
     Py::SeqBase<Py::Object> transforms_obj   = args[2];
     Py::Object              offsets_obj      = args[3];
     agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[4].ptr(), false);
@@ -523,7 +523,7 @@ _path_module::get_path_collection_extents(const Py::Tuple& args)
             throw Py::ValueError("Offsets array must be Nx2");
         }
 
-        size_t Npaths      = paths.length();
+        size_t Npaths      = paths.num_paths();
         size_t Noffsets    = offsets->dimensions[0];
         size_t N               = std::max(Npaths, Noffsets);
         size_t Ntransforms = std::min(transforms_obj.length(), N);
@@ -552,7 +552,7 @@ _path_module::get_path_collection_extents(const Py::Tuple& args)
 
         for (i = 0; i < N; ++i)
         {
-            PathIterator path(paths[i % Npaths]);
+            PathIterator path(paths(i));
             if (Ntransforms)
             {
                 trans = transforms[i % Ntransforms];
@@ -599,7 +599,7 @@ _path_module::point_in_path_collection(const Py::Tuple& args)
     double                  y                = Py::Float(args[1]);
     double                  radius           = Py::Float(args[2]);
     agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[3].ptr());
-    Py::SeqBase<Py::Object> paths            = args[4];
+    PathListGenerator       paths(args[4]);
     Py::SeqBase<Py::Object> transforms_obj   = args[5];
     Py::SeqBase<Py::Object> offsets_obj      = args[6];
     agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[7].ptr());
@@ -615,7 +615,7 @@ _path_module::point_in_path_collection(const Py::Tuple& args)
         throw Py::ValueError("Offsets array must be Nx2");
     }
 
-    size_t Npaths      = paths.length();
+    size_t Npaths      = paths.num_paths();
     size_t Noffsets    = offsets->dimensions[0];
     size_t N           = std::max(Npaths, Noffsets);
     size_t Ntransforms = std::min(transforms_obj.length(), N);
@@ -638,7 +638,7 @@ _path_module::point_in_path_collection(const Py::Tuple& args)
 
     for (i = 0; i < N; ++i)
     {
-        PathIterator path(paths[i % Npaths]);
+        PathIterator path(paths(i));
 
         if (Ntransforms)
         {
@@ -28,6 +28,7 @@ class PathIterator
     Py::Object m_codes;
 
     size_t m_iterator;
+    size_t m_start;
     size_t m_total_vertices;
 
     /* This class doesn't actually do any simplification, but we
@@ -39,8 +40,8 @@ class PathIterator
 public:
     /* path_obj is an instance of the class Path as defined in path.py */
     inline PathIterator(const Py::Object& path_obj) :
-            m_vertices(), m_codes(), m_iterator(0), m_should_simplify(false),
-            m_simplify_threshold(1.0 / 9.0)
+            m_vertices(), m_codes(), m_iterator(0), m_start(0),
+            m_should_simplify(false), m_simplify_threshold(1.0 / 9.0)
     {
         Py::Object vertices_obj           = path_obj.getAttr("vertices");
         Py::Object codes_obj              = path_obj.getAttr("codes");
@@ -80,6 +81,20 @@ public:
         m_simplify_threshold = Py::Float(simplify_threshold_obj);
     }
 
+    /* Iterate over the vertices from start up to end of vertices and
+       codes arrays which have already been converted and checked, as
+       done by PathListGenerator for the paths of a PackedPaths. */
+    inline PathIterator(const Py::Object& vertices, const Py::Object& codes,
+                        size_t start, size_t end, bool should_simplify,
+                        double simplify_threshold) :
+            m_vertices(vertices), m_codes(codes), m_iterator(0),
+            m_start(start), m_total_vertices(end - start),
+            m_should_simplify(should_simplify),
+            m_simplify_threshold(simplify_threshold)
+    {
+
+    }
+
     ~PathIterator()
     {
 
@@ -89,7 +104,7 @@ public:
     {
         if (m_iterator >= m_total_vertices) return agg::path_cmd_stop;
 
-        const size_t idx = m_iterator++;
+        const size_t idx = m_start + m_iterator++;
 
         char* pair = (char*)PyArray_GETPTR2(m_vertices.ptr(), idx, 0);
         *x = *(double*)pair;
@@ -101,7 +116,7 @@ public:
         }
         else
         {
-            return idx == 0 ? agg::path_cmd_move_to : agg::path_cmd_line_to;
+            return idx == m_start ? agg::path_cmd_move_to : agg::path_cmd_line_to;
         }
     }
 
@@ -131,4 +146,116 @@ public:
     }
 };
 
+/************************************************************
+ PathListGenerator makes a PathIterator for each of the paths of a
+ collection, given either a Python sequence of Path objects or a
+ PackedPaths object (see path.py).  The paths of a PackedPaths share
+ one vertices array and one codes array, and are iterated without
+ making a Python object for each of them.
+ */
+class PathListGenerator
+{
+    Py::SeqBase<Py::Object> m_paths;
+    size_t m_npaths;
+
+    bool m_packed;
+    Py::Object m_vertices;
+    Py::Object m_codes;
+    Py::Object m_starts;
+    bool m_should_simplify;
+    double m_simplify_threshold;
+
+public:
+    typedef PathIterator path_iterator;
+
+    inline
+    PathListGenerator(const Py::Object& paths) :
+        m_paths(paths), m_npaths(0), m_packed(false), m_vertices(),
+        m_codes(), m_starts(), m_should_simplify(false),
+        m_simplify_threshold(1.0 / 9.0)
+    {
+        if (!paths.hasAttr("starts"))
+        {
+            m_npaths = m_paths.size();
+            return;
+        }
+
+        m_packed = true;
+        Py::Object vertices_obj = paths.getAttr("vertices");
+        Py::Object codes_obj    = paths.getAttr("codes");
+        Py::Object starts_obj   = paths.getAttr("starts");
+
+        PyObject* vertices_arr = PyArray_FromObject(vertices_obj.ptr(), PyArray_DOUBLE, 2, 2);
+        if (!vertices_arr)
+        {
+            throw Py::ValueError("Invalid vertices array.");
+        }
+        m_vertices = Py::Object(vertices_arr, true);
+        if (PyArray_DIM(vertices_arr, 1) != 2)
+        {
+            throw Py::ValueError("Invalid vertices array.");
+        }
+        npy_intp nvertices = PyArray_DIM(vertices_arr, 0);
+
+        if (codes_obj.ptr() != Py_None)
+        {
+            PyObject* codes_arr = PyArray_FromObject(codes_obj.ptr(), PyArray_UINT8, 1, 1);
+            if (!codes_arr)
+            {
+                throw Py::ValueError("Invalid codes array.");
+            }
+            m_codes = Py::Object(codes_arr, true);
+            if (PyArray_DIM(codes_arr, 0) != nvertices)
+            {
+                throw Py::ValueError("Codes array is wrong length");
+            }
+        }
+
+        PyObject* starts_arr = PyArray_ContiguousFromObject(starts_obj.ptr(), PyArray_INTP, 1, 1);
+        if (!starts_arr || PyArray_DIM(starts_arr, 0) < 1)
+        {
+            Py_XDECREF(starts_arr);
+            throw Py::ValueError("Invalid starts array.");
+        }
+        m_starts = Py::Object(starts_arr, true);
+
+        // Check the starts up front, so the iterators can trust them
+        const npy_intp* starts = (const npy_intp*)PyArray_DATA(starts_arr);
+        m_npaths = PyArray_DIM(starts_arr, 0) - 1;
+        if (starts[0] < 0 || starts[m_npaths] > nvertices)
+        {
+            throw Py::ValueError("Starts array is out of range");
+        }
+        for (size_t i = 0; i < m_npaths; ++i)
+        {
+            if (starts[i] > starts[i + 1])
+            {
+                throw Py::ValueError("Starts array must be increasing");
+            }
+        }
+
+        m_should_simplify    = paths.getAttr("should_simplify").isTrue();
+        m_simplify_threshold = Py::Float(paths.getAttr("simplify_threshold"));
+    }
+
+    inline size_t
+    num_paths() const
+    {
+        return m_npaths;
+    }
+
+    inline path_iterator
+    operator()(size_t i) const
+    {
+        i = i % m_npaths;
+        if (m_packed)
+        {
+            const npy_intp* starts = (const npy_intp*)PyArray_DATA(m_starts.ptr());
+            return PathIterator(m_vertices, m_codes, starts[i], starts[i + 1],
+                                m_should_simplify, m_simplify_threshold);
+        }
+        return PathIterator(m_paths[i]);
+    }
+};
+
 #endif // __AGG_PY_PATH_ITERATOR_H__
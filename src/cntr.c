@@ -18,6 +18,7 @@
 #include "structmember.h"
 #include <stdlib.h>
 #include <stdio.h>
+#include <string.h>
 #include "numerix.h"
 
 /* Note that all arrays in these routines are Fortran-style,
@@ -1471,68 +1472,6 @@ int reorder(double *xpp, double *ypp, short *kpp,
     return k;
 }
 
-/* Build a list of XY 2-D arrays, shape (N,2), to which a list of path
-        code arrays is concatenated.
-*/
-static PyObject *
-build_cntr_list_v2(long *np, double *xp, double *yp, short *kp,
-                                            int nparts, long ntotal)
-{
-    PyObject *all_contours;
-    PyArrayObject *xyv = NULL;
-    PyArrayObject *kv = NULL;
-    npy_intp dims[2];
-    npy_intp kdims[1];
-    int i;
-    long k;
-
-    PyArray_Dims newshape;
-
-    all_contours = PyList_New(nparts*2);
-
-    for (i=0, k=0; i < nparts; k+= np[i], i++)
-    {
-        double *xpp = xp+k;
-        double *ypp = yp+k;
-        short *kpp = kp+k;
-        int n;
-
-
-        dims[0] = np[i];
-        dims[1] = 2;
-        kdims[0] = np[i];
-        xyv = (PyArrayObject *) PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
-        if (xyv == NULL)  goto error;
-        kv = (PyArrayObject *) PyArray_SimpleNew(1, kdims, PyArray_UBYTE);
-        if (kv == NULL) goto error;
-
-        n = reorder(xpp, ypp, kpp,
-                        (double *) xyv->data,
-                        (unsigned char *) kv->data,
-                        np[i]);
-        if (n == -1) goto error;
-        newshape.len = 2;
-        dims[0] = n;
-        newshape.ptr = dims;
-        if (PyArray_Resize(xyv, &newshape, 1, NPY_CORDER) == NULL) goto error;
-
-        newshape.len = 1;  /* ptr, dims can stay the same */
-        if (PyArray_Resize(kv, &newshape, 1, NPY_CORDER) == NULL) goto error;
-
-
-        if (PyList_SetItem(all_contours, i, (PyObject *)xyv)) goto error;
-        if (PyList_SetItem(all_contours, nparts+i,
-                                (PyObject *)kv)) goto error;
-    }
-    return all_contours;
-
-    error:
-    Py_XDECREF(xyv);
-    Py_XDECREF(kv);
-    Py_XDECREF(all_contours);
-    return NULL;
-}
-
 #if 0   /* preprocess this out when we are not using it. */
 /* Build a list of XY 2-D arrays, shape (N,2), to which a list of K arrays
         is concatenated.
@@ -1587,29 +1526,66 @@ __build_cntr_list_v2(long *np, double *xp, double *yp, short *kp,
 #endif  /* preprocessing out the old version for now */
 
 
-/* cntr_trace is called once per contour level or level pair.
-   If nlevels is 1, a set of contour lines will be returned; if nlevels
-   is 2, the set of polygons bounded by the levels will be returned.
-   If points is True, the lines will be returned as a list of list
-   of points; otherwise, as a list of tuples of vectors.
+/* The contours traced for one level or level pair, reordered into
+   paths.  The buffers are allocated with malloc rather than PyMem_Malloc
+   so that tracing can be done without holding the GIL.
+*/
+typedef struct
+{
+    double *xy;                 /* 2*ntotal coordinates */
+    unsigned char *codes;       /* ntotal MOVETO or LINETO codes */
+    long *starts;               /* path i is points starts[i]:starts[i+1] */
+    long nparts;                /* number of paths */
+    long ntotal;                /* number of points in all paths */
+} Ctrace;
+
+#define TRACE_NOMEMORY -1
+#define TRACE_PASS2_OVERFLOW -2
+#define TRACE_PASS2_NEGATIVE -3
+#define TRACE_REORDER -4
+
+static void
+ctrace_free(Ctrace *trace)
+{
+    free(trace->xy);
+    free(trace->codes);
+    free(trace->starts);
+    trace->xy = NULL;
+    trace->codes = NULL;
+    trace->starts = NULL;
+}
+
+/* cntr_trace_points is called once per contour level or level pair.
+   If nlevels is 1, a set of contour lines is traced; if nlevels
+   is 2, the set of polygons bounded by the levels.
+   It uses the data and saddle arrays of site as its workspace, and
+   makes no Python calls, so it can be run with the GIL released.
+   Returns 0 on success, with the paths in trace, or one of the
+   TRACE_* error codes.
 */
 
-PyObject *
-cntr_trace(Csite *site, double levels[], int nlevels, long nchunk)
+static int
+cntr_trace_points(Csite *site, double levels[], int nlevels, long nchunk,
+                    Ctrace *trace)
 {
-    PyObject *c_list = NULL;
-    double *xp0;
-    double *yp0;
-    short *kp0;
-    long *nseg0;
+    double *xp0 = NULL;
+    double *yp0 = NULL;
+    short *kp0 = NULL;
+    long *nseg0 = NULL;
     int iseg;
+    int status = 0;
 
     /* long nchunk = 30; was hardwired */
     long n;
     long nparts = 0;
     long ntotal = 0;
-    long nparts2 = 0;
     long ntotal2 = 0;
+    long i, k;
+
+    trace->xy = NULL;
+    trace->codes = NULL;
+    trace->starts = NULL;
+    trace->nparts = trace->ntotal = 0;
 
     site->zlevel[0] = levels[0];
     site->zlevel[1] = levels[0];
@@ -1637,11 +1613,20 @@ cntr_trace(Csite *site, double levels[], int nlevels, long nchunk)
             ntotal -= n;
         }
     }
-    xp0 = (double *) PyMem_Malloc(ntotal * sizeof(double));
-    yp0 = (double *) PyMem_Malloc(ntotal * sizeof(double));
-    kp0 = (short *) PyMem_Malloc(ntotal * sizeof(short));
-    nseg0 = (long *) PyMem_Malloc(nparts * sizeof(long));
-    if (xp0 == NULL || yp0 == NULL || kp0 == NULL || nseg0 == NULL) goto error;
+    /* one extra item so that nothing is allocated with size 0 */
+    xp0 = (double *) malloc((ntotal + 1) * sizeof(double));
+    yp0 = (double *) malloc((ntotal + 1) * sizeof(double));
+    kp0 = (short *) malloc((ntotal + 1) * sizeof(short));
+    nseg0 = (long *) malloc((nparts + 1) * sizeof(long));
+    trace->xy = (double *) malloc(2 * (ntotal + 1) * sizeof(double));
+    trace->codes = (unsigned char *) malloc(ntotal + 1);
+    trace->starts = (long *) malloc((nparts + 1) * sizeof(long));
+    if (xp0 == NULL || yp0 == NULL || kp0 == NULL || nseg0 == NULL
+        || trace->xy == NULL || trace->codes == NULL || trace->starts == NULL)
+    {
+        status = TRACE_NOMEMORY;
+        goto ending;
+    }
 
     /* second pass */
     site->xcp = xp0;
@@ -1653,9 +1638,8 @@ cntr_trace(Csite *site, double levels[], int nlevels, long nchunk)
         n = curve_tracer (site, 1);
         if (ntotal2 + n > ntotal)
         {
-            PyErr_SetString(PyExc_RuntimeError,
-                "curve_tracer: ntotal2, pass 2 exceeds ntotal, pass 1");
-            goto error;
+            status = TRACE_PASS2_OVERFLOW;
+            goto ending;
         }
         if (n == 0)
             break;
@@ -1667,36 +1651,143 @@ cntr_trace(Csite *site, double levels[], int nlevels, long nchunk)
             site->ycp += n;
             site->kcp += n;
             ntotal2 += n;
-            nparts2++;
         }
         else
         {
-            PyErr_SetString(PyExc_RuntimeError,
-                "Negative n from curve_tracer in pass 2");
-            goto error;
+            status = TRACE_PASS2_NEGATIVE;
+            goto ending;
         }
     }
 
-    c_list = build_cntr_list_v2(nseg0, xp0, yp0, kp0, nparts, ntotal);
+    /* reorder each part into the output buffers, one after the other */
+    trace->starts[0] = 0;
+    for (i=0, k=0; i < nparts; k+= nseg0[i], i++)
+    {
+        long start = trace->starts[i];
+        n = reorder(xp0+k, yp0+k, kp0+k, trace->xy + 2*start,
+                        trace->codes + start, nseg0[i]);
+        if (n == -1)
+        {
+            status = TRACE_REORDER;
+            goto ending;
+        }
+        trace->starts[i+1] = start + n;
+    }
+    trace->nparts = nparts;
+    trace->ntotal = trace->starts[nparts];
 
-    PyMem_Free(xp0);
-    PyMem_Free(yp0);
-    PyMem_Free(kp0);
-    PyMem_Free(nseg0);
+    ending:
+    free(xp0);
+    free(yp0);
+    free(kp0);
+    free(nseg0);
     site->xcp = NULL;
     site->ycp = NULL;
     site->kcp = NULL;
-    return c_list;
+    if (status)
+        ctrace_free(trace);
+    return status;
+}
+
+static void
+set_trace_error(int status)
+{
+    switch (status)
+    {
+        case TRACE_NOMEMORY:
+            PyErr_SetString(PyExc_MemoryError,
+                "Memory allocation failure in cntr_trace");
+            break;
+        case TRACE_PASS2_OVERFLOW:
+            PyErr_SetString(PyExc_RuntimeError,
+                "curve_tracer: ntotal2, pass 2 exceeds ntotal, pass 1");
+            break;
+        case TRACE_PASS2_NEGATIVE:
+            PyErr_SetString(PyExc_RuntimeError,
+                "Negative n from curve_tracer in pass 2");
+            break;
+        default:
+            PyErr_SetString(PyExc_RuntimeError,
+                "reorder: too many segments in a contour");
+    }
+}
+
+/* Build a list of XY 2-D arrays, shape (N,2), to which a list of path
+        code arrays is concatenated.
+*/
+static PyObject *
+build_cntr_list_v2(Ctrace *trace)
+{
+    PyObject *all_contours;
+    PyArrayObject *xyv = NULL;
+    PyArrayObject *kv = NULL;
+    npy_intp dims[2];
+    long i, start, n;
+
+    all_contours = PyList_New(trace->nparts*2);
+    if (all_contours == NULL) return NULL;
+
+    for (i=0; i < trace->nparts; i++)
+    {
+        start = trace->starts[i];
+        n = trace->starts[i+1] - start;
+        dims[0] = n;
+        dims[1] = 2;
+        xyv = (PyArrayObject *) PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
+        if (xyv == NULL)  goto error;
+        kv = (PyArrayObject *) PyArray_SimpleNew(1, dims, PyArray_UBYTE);
+        if (kv == NULL) goto error;
+        memcpy(xyv->data, trace->xy + 2*start, 2*n*sizeof(double));
+        memcpy(kv->data, trace->codes + start, n);
+
+        PyList_SET_ITEM(all_contours, i, (PyObject *)xyv);
+        PyList_SET_ITEM(all_contours, trace->nparts+i, (PyObject *)kv);
+        xyv = kv = NULL;
+    }
+    return all_contours;
 
     error:
-    PyMem_Free(xp0);
-    PyMem_Free(yp0);
-    PyMem_Free(kp0);
-    PyMem_Free(nseg0);
-    site->xcp = NULL;
-    site->ycp = NULL;
-    site->kcp = NULL;
-    Py_XDECREF(c_list);
+    Py_XDECREF(xyv);
+    Py_XDECREF(kv);
+    Py_XDECREF(all_contours);
+    return NULL;
+}
+
+/* Build a tuple of three arrays holding all of the paths: vertices,
+        shape (N,2), codes, shape (N,), and starts, shape (nparts+1,).
+        Path i is made of vertices[starts[i]:starts[i+1]].
+*/
+static PyObject *
+build_cntr_packed(Ctrace *trace)
+{
+    PyArrayObject *xyv = NULL;
+    PyArrayObject *kv = NULL;
+    PyArrayObject *sv = NULL;
+    npy_intp dims[2];
+    npy_intp *starts;
+    long i;
+
+    dims[0] = trace->ntotal;
+    dims[1] = 2;
+    xyv = (PyArrayObject *) PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
+    if (xyv == NULL) goto error;
+    kv = (PyArrayObject *) PyArray_SimpleNew(1, dims, PyArray_UBYTE);
+    if (kv == NULL) goto error;
+    dims[0] = trace->nparts + 1;
+    sv = (PyArrayObject *) PyArray_SimpleNew(1, dims, NPY_INTP);
+    if (sv == NULL) goto error;
+
+    memcpy(xyv->data, trace->xy, 2*trace->ntotal*sizeof(double));
+    memcpy(kv->data, trace->codes, trace->ntotal);
+    starts = (npy_intp *) sv->data;
+    for (i=0; i <= trace->nparts; i++)
+        starts[i] = trace->starts[i];
+    return Py_BuildValue("(NNN)", xyv, kv, sv);
+
+    error:
+    Py_XDECREF(xyv);
+    Py_XDECREF(kv);
+    Py_XDECREF(sv);
     return NULL;
 }
 
@@ -1711,6 +1802,7 @@ typedef struct {
     PyObject_HEAD
     PyArrayObject *xpa, *ypa, *zpa, *mpa;
     Csite *site;
+    int busy;                   /* site workspace is in use by a trace */
 } Cntr;
 
 
@@ -1766,6 +1858,7 @@ Cntr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->ypa = NULL;
         self->zpa = NULL;
         self->mpa = NULL;
+        self->busy = 0;
     }
 
     return (PyObject *)self;
@@ -1850,22 +1943,80 @@ Cntr_init(Cntr *self, PyObject *args, PyObject *kwds)
     return -1;
 }
 
+/* The GIL is released while tracing, so several threads may trace
+   the same Cntr at once.  The first uses the workspace of the site;
+   any others trace with a private copy of its data and saddle arrays.
+*/
 static PyObject *
 Cntr_trace(Cntr *self, PyObject *args, PyObject *kwds)
 {
     double levels[2] = {0.0, -1e100};
     int nlevels = 2;
     long nchunk = 0L;
-    static char *kwlist[] = {"level0", "level1",  "nchunk", NULL};
-
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "d|dl", kwlist,
-                                      levels, levels+1, &nchunk))
+    int packed = 0;
+    static char *kwlist[] = {"level0", "level1",  "nchunk", "packed", NULL};
+    Csite site;
+    Ctrace trace;
+    int own_workspace = 0;
+    int status;
+    PyObject *result;
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "d|dli", kwlist,
+                                      levels, levels+1, &nchunk, &packed))
     {
         return NULL;
     }
+    if (self->site->data == NULL)
+    {
+        PyErr_SetString(PyExc_ValueError, "Cntr has not been initialized");
+        return NULL;
+    }
     if (levels[1] == -1e100 || levels[1] <= levels[0])
         nlevels = 1;
-    return cntr_trace(self->site, levels, nlevels, nchunk);
+
+    site = *self->site;
+    if (self->busy)
+    {
+        long ijmax = site.imax * site.jmax;
+        site.data = (Cdata *) malloc(sizeof(Cdata) * (ijmax + site.imax + 1));
+        site.saddle = (Saddle *) malloc(sizeof(Saddle) * ijmax);
+        if (site.data == NULL || site.saddle == NULL)
+        {
+            free(site.data);
+            free(site.saddle);
+            return PyErr_NoMemory();
+        }
+        own_workspace = 1;
+    }
+    else
+    {
+        self->busy = 1;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    status = cntr_trace_points(&site, levels, nlevels, nchunk, &trace);
+    Py_END_ALLOW_THREADS
+
+    if (own_workspace)
+    {
+        free(site.data);
+        free(site.saddle);
+    }
+    else
+    {
+        self->busy = 0;
+    }
+    if (status)
+    {
+        set_trace_error(status);
+        return NULL;
+    }
+    if (packed)
+        result = build_cntr_packed(&trace);
+    else
+        result = build_cntr_list_v2(&trace);
+    ctrace_free(&trace);
+    return result;
 }
 
 /* The following will not normally be called.  It is experimental,
@@ -1902,6 +2053,11 @@ static PyMethodDef Cntr_methods[] = {
      "        vector pairs; otherwise, return a list of lists of points.\n"
      "    Optional argument: nchunk; approximate number of grid points\n"
      "        per chunk. 0 (default) for no chunking.\n"
+     "    Optional argument: packed; if true, return a tuple of arrays\n"
+     "        (vertices, codes, starts) holding all of the contours,\n"
+     "        contour i being vertices[starts[i]:starts[i+1]].\n"
+     "    The GIL is released while tracing, so levels may be traced\n"
+     "        in parallel from several threads.\n"
     },
     {"get_cdata", (PyCFunction)Cntr_get_cdata, METH_NOARGS,
      "Returns a copy of the mesh array with contour calculation codes.\n\n"
@@ -0,0 +1,35 @@
+"""
+Time making and drawing a grid of wind barbs.  The barb polygons are
+made once for each combination of flags, barbs and half barbs, and
+rotated for all the barbs with it at once.  Run with the number of
+barbs, eg::
+
+  python barbs_profile.py 100000
+"""
+
+import sys, time
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+if __name__=='__main__':
+    n = 100000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+
+    side = int(np.sqrt(n))
+    x, y = np.meshgrid(np.arange(side), np.arange(side))
+    u = 60 * np.cos(x / 10.) * np.sin(y / 7.)
+    v = 40 * np.sin(x / 5.) * np.cos(y / 11.)
+
+    fig = Figure(figsize=(10, 10))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    t0 = time.time()
+    ax.barbs(x, y, u, v, length=4)
+    tmake = time.time() - t0
+    t0 = time.time()
+    canvas.draw()
+    tdraw = time.time() - t0
+    print '%d barbs: make %1.2fs, draw %1.2fs'%(side*side, tmake, tdraw)
@@ -0,0 +1,46 @@
+"""
+Time cohere_pairs over all the nonredundant pairs of many channels.
+
+The cross spectral densities of a batch of pairs are computed at once
+from the cached FFTs, from one thread per CPU, and maxCacheBytes
+bounds the memory the cached FFTs take.  Run with a number of samples
+and channels, eg::
+
+  python cohere_pairs_profile.py 43000 64
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+import numpy as np
+import matplotlib.mlab as mlab
+
+def run(X, **kwargs):
+    numCols = X.shape[1]
+    ij = [(i, j) for i in range(numCols) for j in range(i+1, numCols)]
+    t0 = time.time()
+    mlab.cohere_pairs(X, ij, **kwargs)
+    return time.time() - t0
+
+if __name__=='__main__':
+    numRows, numCols = 43000, 64
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        numRows = int(args[0])
+    if len(args) > 1:
+        numCols = int(args[1])
+    X = np.random.randn(numRows, numCols)
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('run(X)', 'cohere_pairs.prof')
+        stats = pstats.Stats('cohere_pairs.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        print '%d samples, %d channels, %d pairs'%(
+            numRows, numCols, numCols*(numCols-1)//2)
+        print 'cohere_pairs %1.3fs'%run(X)
+        print 'preferSpeedOverMemory=False %1.3fs'%run(
+            X, preferSpeedOverMemory=False)
+        print 'maxCacheBytes=16MB %1.3fs'%run(X, maxCacheBytes=2**24)
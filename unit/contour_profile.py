@@ -0,0 +1,57 @@
+"""
+Time contouring a large grid, and re-contouring it at new levels.
+
+The levels are traced in parallel threads, and a contour set made
+from another one, eg ``contourf(cs, levels=levels)``, reuses the
+levels it has already traced.  Run with a grid size, eg::
+
+  python contour_profile.py 2000
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def make_data(n):
+    x, y = np.meshgrid(np.linspace(-3, 3, n), np.linspace(-3, 3, n))
+    return np.sin(3*x)*np.cos(4*y) + np.sin(x*y)
+
+def run(z):
+    fig = Figure()
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    levels = np.linspace(-2, 2, 21)
+    t0 = time.time()
+    cs = ax.contourf(z, levels)
+    tcontour = time.time() - t0
+    # move a single level, as an interactive level slider would
+    levels = levels.copy()
+    levels[10] += 0.05
+    t0 = time.time()
+    ax.contourf(cs, levels=levels)
+    trecontour = time.time() - t0
+    t0 = time.time()
+    canvas.draw()
+    tdraw = time.time() - t0
+    return tcontour, trecontour, tdraw
+
+if __name__=='__main__':
+    n = 1000
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+    z = make_data(n)
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('run(z)', 'contour.prof')
+        stats = pstats.Stats('contour.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        tcontour, trecontour, tdraw = run(z)
+        print '%dx%d grid: contourf %1.3fs, new levels %1.3fs, draw %1.3fs'%(
+            n, n, tcontour, trecontour, tdraw)
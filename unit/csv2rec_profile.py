@@ -0,0 +1,75 @@
+"""
+Time reading a large CSV file with csv2rec, one value at a time and
+in chunks converted with numpy, and into a memory-mapped file.
+
+Run with a number of rows, eg::
+
+  python csv2rec_profile.py 200000
+
+and add --profile to print the most expensive calls of the chunked
+reader.
+"""
+
+import os, sys, time, tempfile
+
+import matplotlib.mlab as mlab
+
+def make_file(n, dates=True):
+    fd, fname = tempfile.mkstemp(suffix='.csv')
+    f = os.fdopen(fd, 'w')
+    f.write('id,price,volume,ok,symbol')
+    if dates:
+        f.write(',date')
+    f.write('\n')
+    for i in range(n):
+        f.write('%d,%1.4f,%d,%s,SYM%d'%(
+            i, i*0.37, i*11 % 1000, ('False', 'True')[i%2], i % 500))
+        if dates:
+            f.write(',2010-%02d-%02d'%(i % 12 + 1, i % 28 + 1))
+        f.write('\n')
+    f.close()
+    return fname
+
+def run(fname, nodates):
+    t0 = time.time()
+    mlab.csv2rec(fname)
+    told = time.time() - t0
+    t0 = time.time()
+    mlab.csv2rec(fname, chunksize=100000)
+    tchunked = time.time() - t0
+    t0 = time.time()
+    for chunk in mlab.csv2rec_chunks(fname, 50000):
+        pass
+    tchunks = time.time() - t0
+    # dates are Python objects, so leave them out to memory-map
+    dat = nodates + '.dat'
+    t0 = time.time()
+    r = mlab.csv2rec(nodates, memmap=dat)
+    tmemmap = time.time() - t0
+    del r
+    os.remove(dat)
+    return told, tchunked, tchunks, tmemmap
+
+if __name__=='__main__':
+    n = 200000
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+    fname = make_file(n)
+    nodates = make_file(n, dates=False)
+    try:
+        if '--profile' in sys.argv:
+            import cProfile, pstats
+            cProfile.run('mlab.csv2rec(fname, chunksize=100000)',
+                         'csv2rec.prof')
+            stats = pstats.Stats('csv2rec.prof')
+            stats.sort_stats('cumulative').print_stats(25)
+        else:
+            told, tchunked, tchunks, tmemmap = run(fname, nodates)
+            print '%d rows: csv2rec %1.3fs, chunksize=100000 %1.3fs,'%(
+                n, told, tchunked),
+            print 'csv2rec_chunks %1.3fs, memmap (no dates) %1.3fs'%(
+                tchunks, tmemmap)
+    finally:
+        os.remove(fname)
+        os.remove(nodates)
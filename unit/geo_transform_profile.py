@@ -0,0 +1,53 @@
+"""
+Time the core transforms of the geographic projections, and drawing a
+global map with them.  Run with the number of points, eg::
+
+  python geo_transform_profile.py 1000000
+"""
+
+import sys, time
+
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.projections.geo import AitoffAxes, HammerAxes, \
+     MollweideAxes, LambertAxes
+
+def lonlat(n):
+    np.random.seed(0)
+    return np.column_stack([np.random.uniform(-np.pi, np.pi, n),
+                            np.random.uniform(-np.pi / 2.0, np.pi / 2.0, n)])
+
+def time_transforms(n):
+    ll = lonlat(n)
+    for name, transform in [
+        ('aitoff', AitoffAxes.AitoffTransform(75)),
+        ('hammer', HammerAxes.HammerTransform(75)),
+        ('mollweide', MollweideAxes.MollweideTransform(75)),
+        ('lambert', LambertAxes.LambertTransform(0.0, 0.0, 75))]:
+        t0 = time.time()
+        transform.transform(ll)
+        print '%-10s %d points: %1.3fs'%(name, n, time.time() - t0)
+
+def time_draw(n, projection='mollweide'):
+    fig = Figure()
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection=projection)
+    ax.grid(True)
+    ll = lonlat(n)
+    ax.plot(ll[:, 0], ll[:, 1], ',')
+    t0 = time.time()
+    canvas.draw()
+    tfirst = time.time() - t0
+    t0 = time.time()
+    canvas.draw()
+    print '%s map with %d points: first draw %1.3fs, redraw %1.3fs'%(
+        projection, n, tfirst, time.time() - t0)
+
+if __name__=='__main__':
+    n = 100000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    time_transforms(n)
+    time_draw(n)
@@ -0,0 +1,64 @@
+"""
+Time interpolating several sets of values at the same scattered
+points onto a grid.
+
+mlab.griddata keeps the triangulation of the last set of points it
+was called with, and a mlab.GridInterpolator also finds the
+interpolation weights once, from one thread per CPU, so each new set
+of values is only a weighted sum.  Run with a number of points and a
+grid size, eg::
+
+  python griddata_profile.py 5000 500
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+import numpy as np
+import matplotlib.mlab as mlab
+
+def make_data(npoints, ngrid, nsets=5):
+    np.random.seed(1)
+    x = np.random.uniform(-2, 2, npoints)
+    y = np.random.uniform(-2, 2, npoints)
+    zs = [np.sin(k*x)*np.cos(y) for k in range(1, nsets+1)]
+    xi = np.linspace(-2, 2, ngrid)
+    yi = np.linspace(-2, 2, ngrid)
+    return x, y, zs, xi, yi
+
+def run(x, y, zs, xi, yi, interp='nn'):
+    t0 = time.time()
+    for z in zs:
+        mlab.griddata(x, y, z, xi, yi, interp)
+    tgriddata = time.time() - t0
+    t0 = time.time()
+    gridinterp = mlab.GridInterpolator(x, y, xi, yi, interp)
+    tsetup = time.time() - t0
+    t0 = time.time()
+    for z in zs:
+        gridinterp(z)
+    tcall = time.time() - t0
+    return tgriddata, tsetup, tcall
+
+if __name__=='__main__':
+    npoints, ngrid = 5000, 500
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        npoints = int(args[0])
+    if len(args) > 1:
+        ngrid = int(args[1])
+    x, y, zs, xi, yi = make_data(npoints, ngrid)
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('run(x, y, zs, xi, yi)', 'griddata.prof')
+        stats = pstats.Stats('griddata.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        for interp in ('nn', 'linear'):
+            tgriddata, tsetup, tcall = run(x, y, zs, xi, yi, interp)
+            print ('%s, %d points, %dx%d grid, %d sets: griddata %1.3fs, '
+                   'GridInterpolator %1.3fs + %1.3fs'%(
+                interp, npoints, ngrid, ngrid, len(zs),
+                tgriddata, tsetup, tcall))
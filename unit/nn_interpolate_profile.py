@@ -0,0 +1,71 @@
+"""
+Time natural neighbor interpolation onto a large grid and at many
+scattered points, for 1, 2, 4, ... threads up to the number of CPUs.
+
+The meshes are the datasets of matplotlib.delaunay.testfuncs, plus
+a random mesh as large as the NNTester there makes, and the function
+interpolated is its cloverleaf.  The grid is split into bands of rows
+and the points into batches, which are interpolated from the threads
+with the GIL released; the scattered points are also sorted so that
+each one is near the last before they are located.  Run with a grid
+size and a random mesh size, eg::
+
+  python nn_interpolate_profile.py 1000 10000
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+import numpy as np
+import matplotlib.delaunay as delaunay
+from matplotlib.cbook import cpu_count
+from matplotlib.delaunay.testfuncs import data, cloverleaf, NNTester
+
+def meshes(npoints):
+    kv = data.items()
+    kv.sort()
+    result = [(name, mesh.x, mesh.y) for name, mesh in kv]
+    tester = NNTester(npoints=npoints)
+    result.append(('random%d'%npoints, tester.x, tester.y))
+    return result
+
+def run(x, y, n, nthreads):
+    tri = delaunay.Triangulation(x, y)
+    interp = delaunay.NNInterpolator(tri, cloverleaf(tri.x, tri.y),
+                                     nthreads=nthreads)
+    t0 = time.time()
+    interp[0:1:complex(0, n), 0:1:complex(0, n)]
+    tgrid = time.time() - t0
+    rng = np.random.RandomState(0)
+    px = rng.uniform(0, 1, n*n)
+    py = rng.uniform(0, 1, n*n)
+    t0 = time.time()
+    interp(px, py)
+    tpoints = time.time() - t0
+    return tgrid, tpoints
+
+if __name__=='__main__':
+    n, npoints = 500, 10000
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+    if len(args) > 1:
+        npoints = int(args[1])
+    threads = [1]
+    while threads[-1]*2 <= cpu_count():
+        threads.append(threads[-1]*2)
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        name, x, y = meshes(npoints)[-1]
+        cProfile.run('run(x, y, n, threads[-1])', 'nn_interpolate.prof')
+        stats = pstats.Stats('nn_interpolate.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        print '%dx%d grid and %d scattered points'%(n, n, n*n)
+        for name, x, y in meshes(npoints):
+            for nthreads in threads:
+                tgrid, tpoints = run(x, y, n, nthreads)
+                print '%-12s %d threads: grid %1.3fs, points %1.3fs'%(
+                    name, nthreads, tgrid, tpoints)
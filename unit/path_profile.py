@@ -0,0 +1,74 @@
+"""
+Time making and transforming many small paths, and drawing a figure
+which makes a lot of them: bars, pie wedges and half filled markers.
+Run with a number of repeats, eg::
+
+  python path_profile.py 100000
+"""
+
+import os, sys, time
+
+import numpy as np
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def report_memory():
+    pid = os.getpid()
+    lines = os.popen('ps -p %d -o rss' % pid).readlines()
+    return int(lines[1].split()[0]) / 1024.
+
+def timeit(func, n):
+    t0 = time.time()
+    result = func(n)
+    return time.time() - t0, result
+
+def make_paths(n):
+    verts = Path.unit_rectangle().vertices
+    codes = Path.unit_rectangle().codes
+    return [Path(verts, codes) for i in xrange(n)]
+
+def transform_paths(n):
+    path = Path.unit_regular_polygon(6)
+    trans = Affine2D().scale(2.0).rotate_deg(30).translate(1, 1)
+    return [trans.transform_path(path) for i in xrange(n)]
+
+def make_wedges(n):
+    return [Path.wedge(0, 360.0 * i / n) for i in xrange(1, n + 1)]
+
+def make_figure():
+    fig = Figure(figsize=(8, 8))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(221)
+    ax.bar(np.arange(1000), np.random.rand(1000))
+    ax = fig.add_subplot(222)
+    ax.pie(np.random.rand(200) + 0.1)
+    ax = fig.add_subplot(223)
+    for i, marker in enumerate('sDdp*hH' * 10):
+        ax.plot(np.arange(20), np.random.rand(20) + i, marker,
+                fillstyle='left')
+    ax = fig.add_subplot(224)
+    ax.bar(np.arange(200), np.random.rand(200), hatch='/')
+    canvas.draw()
+    return fig
+
+if __name__=='__main__':
+    n = 100000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+
+    mem0 = report_memory()
+    tmake, paths = timeit(make_paths, n)
+    mem = report_memory() - mem0
+    del paths
+    ttrans, paths = timeit(transform_paths, n)
+    del paths
+    twedge, paths = timeit(make_wedges, n // 10)
+    del paths
+    np.random.seed(0)
+    tfig, fig = timeit(lambda n: make_figure(), n)
+    print 'make %d paths: %1.2fs (%1.1f MB)'%(n, tmake, mem)
+    print 'transform %d paths: %1.2fs'%(n, ttrans)
+    print 'make %d wedges: %1.2fs'%(n // 10, twedge)
+    print 'build and draw figure: %1.2fs'%tfig
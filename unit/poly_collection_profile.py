@@ -0,0 +1,60 @@
+"""
+Time building, autoscaling and drawing a PolyCollection with many
+polygons, and report the memory it takes.
+
+The polygons are packed into a few arrays (see
+:class:`matplotlib.path.PackedPaths`) rather than kept as one Path
+each.  Run with a number of polygons, eg::
+
+  python poly_collection_profile.py 500000
+"""
+
+import os, sys, time
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def report_memory():
+    pid = os.getpid()
+    lines = os.popen('ps -p %d -o rss' % pid).readlines()
+    return int(lines[1].split()[0]) / 1024.
+
+def make_verts(n):
+    # a grid of irregular quads and pentagons
+    side = int(np.ceil(np.sqrt(n)))
+    verts = []
+    for i in xrange(n):
+        m = 4 + i % 2
+        theta = np.linspace(0, 2*np.pi, m, endpoint=False)
+        xy = np.empty((m, 2))
+        xy[:, 0] = i % side + 0.4 * np.cos(theta)
+        xy[:, 1] = i // side + 0.4 * np.sin(theta)
+        verts.append(xy)
+    return verts
+
+if __name__=='__main__':
+    n = 100000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+
+    verts = make_verts(n)
+    mem0 = report_memory()
+    t0 = time.time()
+    col = PolyCollection(verts, facecolors=['r', 'g', 'b'], edgecolors='k')
+    tbuild = time.time() - t0
+    mem = report_memory() - mem0
+
+    fig = Figure(figsize=(8, 8))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    t0 = time.time()
+    ax.add_collection(col)
+    ax.autoscale_view()
+    tlim = time.time() - t0
+    t0 = time.time()
+    canvas.draw()
+    tdraw = time.time() - t0
+    print '%d polygons: build %1.2fs (%1.1f MB), limits %1.2fs, draw %1.2fs'%(
+        n, tbuild, mem, tlim, tdraw)
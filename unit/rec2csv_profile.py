@@ -0,0 +1,58 @@
+"""
+Time writing a large record array with rec2csv and rec2txt.
+
+The formats convert a column of a block of rows at a time, and the
+rows are written a block at a time.  Run with a number of rows, eg::
+
+  python rec2csv_profile.py 200000
+
+and add --profile to print the most expensive calls.
+"""
+
+import os, sys, time, datetime, tempfile
+
+import numpy as np
+import matplotlib.mlab as mlab
+
+def make_data(n):
+    np.random.seed(0)
+    symbols = np.array(['SYM%d'%i for i in range(500)])
+    dates = np.array([datetime.date(2010, 1, 1) + datetime.timedelta(i)
+                      for i in range(250)], dtype=object)
+    return np.rec.fromarrays([np.arange(n),
+                              symbols[np.random.randint(0, 500, n)],
+                              dates[np.random.randint(0, 250, n)],
+                              np.random.rand(n)*100,
+                              np.random.randint(1, 1000, n),
+                              np.random.rand(n) > 0.5],
+                             names='id,symbol,date,price,volume,ok')
+
+def run(r, fname):
+    t0 = time.time()
+    mlab.rec2csv(r, fname)
+    tcsv = time.time() - t0
+    t0 = time.time()
+    mlab.rec2txt(r)
+    ttxt = time.time() - t0
+    return tcsv, ttxt
+
+if __name__=='__main__':
+    n = 200000
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+    r = make_data(n)
+    fd, fname = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+
+    try:
+        if '--profile' in sys.argv:
+            import cProfile, pstats
+            cProfile.run('run(r, fname)', 'rec2csv.prof')
+            stats = pstats.Stats('rec2csv.prof')
+            stats.sort_stats('cumulative').print_stats(25)
+        else:
+            tcsv, ttxt = run(r, fname)
+            print '%d rows: rec2csv %1.3fs, rec2txt %1.3fs'%(n, tcsv, ttxt)
+    finally:
+        os.remove(fname)
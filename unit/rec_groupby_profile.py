@@ -0,0 +1,60 @@
+"""
+Time grouping and joining large record arrays on two key fields.
+
+The rows are grouped and matched by sorting their keys rather than
+row by row in Python.  Run with a number of rows, eg::
+
+  python rec_groupby_profile.py 1000000
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+import numpy as np
+import matplotlib.mlab as mlab
+
+def make_data(n):
+    np.random.seed(0)
+    symbols = np.array(['SYM%d'%i for i in range(500)])
+    r = np.rec.fromarrays([symbols[np.random.randint(0, 500, n)],
+                           np.random.randint(0, 250, n),
+                           np.random.rand(n)*100,
+                           np.random.randint(1, 1000, n)],
+                          names='symbol,day,price,volume')
+    # two tables with unique (day, id) keys which mostly overlap
+    ids = np.arange(n)
+    r1 = np.rec.fromarrays([ids % 250, ids // 250, np.random.rand(n)],
+                           names='day,id,value')
+    ids = ids + n//10
+    r2 = np.rec.fromarrays([ids % 250, ids // 250, np.random.rand(n)],
+                           names='day,id,value')
+    return r, r1, r2
+
+def run(r, r1, r2):
+    stats = (('volume', len, 'trades'), ('volume', np.sum, 'volume'),
+             ('price', np.mean, 'avgprice'), ('price', np.max, 'high'))
+    t0 = time.time()
+    mlab.rec_groupby(r, ('symbol', 'day'), stats)
+    tgroupby = time.time() - t0
+    t0 = time.time()
+    mlab.rec_join(('day', 'id'), r1, r2, jointype='outer')
+    tjoin = time.time() - t0
+    return tgroupby, tjoin
+
+if __name__=='__main__':
+    n = 1000000
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+    r, r1, r2 = make_data(n)
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('run(r, r1, r2)', 'rec_groupby.prof')
+        stats = pstats.Stats('rec_groupby.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        tgroupby, tjoin = run(r, r1, r2)
+        print '%d rows: rec_groupby %1.3fs, rec_join %1.3fs'%(
+            n, tgroupby, tjoin)
@@ -0,0 +1,69 @@
+"""
+Time building a grid of subplots which all share their x and y axes.
+
+Every subplot joins the shared axes groupers, and each autoscale and
+limit change looks up the siblings of the axes; with large grids these
+lookups should stay cheap.  Run with a grid size, eg::
+
+  python shared_axes_profile.py 20
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+from matplotlib.cbook import Grouper
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def build(n):
+    fig = Figure(figsize=(n, n))
+    canvas = FigureCanvasAgg(fig)
+    ax0 = fig.add_subplot(n, n, 1)
+    for i in range(1, n*n):
+        ax = fig.add_subplot(n, n, i+1, sharex=ax0, sharey=ax0)
+        ax.plot([0, 1, 2], [i, 0, i])
+    return fig
+
+def limits(fig):
+    for ax in fig.axes:
+        ax.set_xlim(0, 2)
+        ax.get_shared_x_axes().joined(ax, fig.axes[0])
+
+def group(n):
+    # the groupers alone, with n*n objects joined two at a time
+    class Item:
+        pass
+    items = [Item() for i in range(n*n)]
+    g = Grouper()
+    for i in range(1, len(items)):
+        g.join(items[i-1], items[i])
+        g.joined(items[0], items[i])
+    for item in items:
+        g.get_siblings(item)
+    return items
+
+if __name__=='__main__':
+    n = 10
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('limits(build(n))', 'shared_axes.prof')
+        stats = pstats.Stats('shared_axes.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        t0 = time.time()
+        fig = build(n)
+        tbuild = time.time() - t0
+        t0 = time.time()
+        limits(fig)
+        tlimits = time.time() - t0
+        t0 = time.time()
+        group(n)
+        tgroup = time.time() - t0
+        print '%d shared subplots: build %1.3fs, set limits %1.3fs'%(
+            n*n, tbuild, tlimits)
+        print '%d grouped objects: %1.3fs'%(n*n, tgroup)
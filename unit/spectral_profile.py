@@ -0,0 +1,48 @@
+"""
+Time psd and specgram of a long signal with a short NFFT.
+
+The segments are detrended, windowed and transformed a block at a
+time from a strided view of the signal, rather than one at a time.
+Run with a signal length and NFFT, eg::
+
+  python spectral_profile.py 2000000 128
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+import numpy as np
+import matplotlib.mlab as mlab
+
+def run(x, NFFT):
+    t0 = time.time()
+    mlab.psd(x, NFFT, detrend=mlab.detrend_mean)
+    tpsd = time.time() - t0
+    t0 = time.time()
+    mlab.specgram(x, NFFT, noverlap=NFFT//2)
+    tspecgram = time.time() - t0
+    t0 = time.time()
+    for Pxx, freqs, t in mlab.specgram_chunks(x, NFFT, noverlap=NFFT//2):
+        pass
+    tchunks = time.time() - t0
+    return tpsd, tspecgram, tchunks
+
+if __name__=='__main__':
+    n, NFFT = 1000000, 128
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+    if len(args) > 1:
+        NFFT = int(args[1])
+    x = np.random.randn(n)
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('run(x, NFFT)', 'spectral.prof')
+        stats = pstats.Stats('spectral.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        tpsd, tspecgram, tchunks = run(x, NFFT)
+        print ('%d samples, NFFT=%d: psd %1.3fs, specgram %1.3fs, '
+               'specgram_chunks %1.3fs'%(n, NFFT, tpsd, tspecgram, tchunks))
@@ -0,0 +1,47 @@
+"""
+Time building and saving a figure with a large grid of subplots.
+
+Most of the time spent building a subplot used to go into making tick
+artists which were thrown away when the axes were cleared again; the
+ticks are now made when first needed.  Run with a grid size, eg::
+
+  python subplot_grid_profile.py 20
+
+and add --profile to print the most expensive calls.
+"""
+
+import sys, time
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def build(n):
+    fig = Figure(figsize=(n, n))
+    canvas = FigureCanvasAgg(fig)
+    for i in range(n*n):
+        ax = fig.add_subplot(n, n, i+1)
+        ax.plot([0, 1, 2], [i, 0, i])
+    return fig
+
+def save(fig, fname='subplot_grid.png'):
+    fig.canvas.print_figure(fname, dpi=50)
+
+if __name__=='__main__':
+    n = 10
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        n = int(args[0])
+
+    if '--profile' in sys.argv:
+        import cProfile, pstats
+        cProfile.run('save(build(n))', 'subplot_grid.prof')
+        stats = pstats.Stats('subplot_grid.prof')
+        stats.sort_stats('cumulative').print_stats(25)
+    else:
+        t0 = time.time()
+        fig = build(n)
+        tbuild = time.time() - t0
+        t0 = time.time()
+        save(fig)
+        tsave = time.time() - t0
+        print '%d subplots: build %1.3fs, save %1.3fs'%(n*n, tbuild, tsave)
@@ -0,0 +1,42 @@
+"""
+Time finding the triangles of a large triangulation which contain
+many points, using the TriFinder of the triangulation.  Run with the
+number of triangulation points and query points, eg::
+
+  python trifinder_profile.py 100000 2000000
+"""
+
+import sys, time
+
+import numpy as np
+import matplotlib.axes
+import matplotlib.tri as mtri
+
+if __name__=='__main__':
+    npoints, nquery = 100000, 1000000
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args):
+        npoints = int(args[0])
+    if len(args) > 1:
+        nquery = int(args[1])
+
+    np.random.seed(0)
+    x = np.random.uniform(0, 1, npoints)
+    y = np.random.uniform(0, 1, npoints)
+    t0 = time.time()
+    triang = mtri.Triangulation(x, y)
+    ttriangulate = time.time() - t0
+
+    t0 = time.time()
+    trifinder = triang.get_trifinder()
+    tbuild = time.time() - t0
+
+    xs = np.random.uniform(-0.1, 1.1, nquery)
+    ys = np.random.uniform(-0.1, 1.1, nquery)
+    t0 = time.time()
+    tris = trifinder(xs, ys)
+    tfind = time.time() - t0
+    print '%d triangles: triangulate %1.3fs, build trifinder %1.3fs' % (
+        len(triang.triangles), ttriangulate, tbuild)
+    print '%d points: find %1.3fs, %d found' % (
+        nquery, tfind, (tris >= 0).sum())